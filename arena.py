@@ -1,15 +1,22 @@
 import random
 import pygame
-import time
 from config import *
 from power_bar import PowerBar
 from sound_manager import play_sound
 from explosion_effect import ExplosionEffect
 from meteor_effect import MeteorEffect
-from sound_manager import stop_sound
+from sound_manager import stop_sound, load_sound
+from asset_manager import load_image
+from post_process import BlurDarkenPass
+from profiler import frame_profiler
+from dirty_renderer import TrackedSurface, mark_dirty
+from text_cache import HudLabel, get_font, render_text
+from surface_pool import surface_pool
+from timestep import match_clock
 
 class Arena:
-    def __init__(self, level=1):
+    def __init__(self, level=1, gameplay_rng=None):
+        self.gameplay_rng = gameplay_rng or random.Random()  # The enemy's power choices
         self.explosion_effect = None
         self.enemy_special_active = False
         self.player_dead = False
@@ -25,24 +32,26 @@ class Arena:
         self.level = level  # Set the level attribute
         # load Background
         if level == 1:
-            self.background_img_raw = pygame.image.load("images/background/fire_animatiaon.gif")
-            self.football_net_img = pygame.image.load("images/goal/lava_goal.png")
-            self.football_net_img = pygame.transform.scale(self.football_net_img, (90, 190))
+            background_path = "images/background/fire_animatiaon.gif"
+            net_path, net_size = "images/goal/lava_goal.png", (90, 190)
             self.left_net_rect = pygame.Rect(0, 360, 100, 250)     # Left side
             self.right_net_rect = pygame.Rect(720, 360, 100, 250)  # Right side
         else:
-            self.background_img_raw = pygame.image.load("images/background/throne room.png")
-            self.football_net_img = pygame.image.load("images/goal/throne_goal.png")
-            self.football_net_img = pygame.transform.scale(self.football_net_img, (110, 240))
+            background_path = "images/background/throne room.png"
+            net_path, net_size = "images/goal/throne_goal.png", (110, 240)
             self.left_net_rect = pygame.Rect(0, 320, 100, 250)     # Left side
             self.right_net_rect = pygame.Rect(700, 320, 100, 250)  # Right side
             
         
-        self.background_img = pygame.transform.scale(self.background_img_raw, (800, 600))
+        self.background_img = load_image(background_path, (800, 600), alpha=False)
+        self.football_net_img = load_image(net_path, net_size)
+        self.flipped_net_img = load_image(net_path, net_size, flip=True)
+        self.static_layer = None  # Background + both nets, built on first draw
+        self.fire_post_process = BlurDarkenPass(strength=FIRE_BLUR_STRENGTH)
 
         self.explosion_frames = []
         for i in range(1, 11):  
-            img = pygame.image.load(f"images/effectLevel2/Explosion_{i}.png").convert_alpha()
+            img = load_image(f"images/effectLevel2/Explosion_{i}.png")
             self.explosion_frames.append(img)
 
         self.left_net_rect_goal_area = pygame.Rect(30, 395, 50, 150)
@@ -53,14 +62,19 @@ class Arena:
         self.right_net_rect_side_bar = pygame.Rect(770, 380, 30, 165)
         
         # Load font and setup timer
-        self.start_time = time.time()
+        self.start_time = match_clock.time()
         self.total_time = TOTAL_TIME
-        self.font = pygame.font.Font(None, 36)
+        self.font = get_font(36)
         
         # Initialize score
         self.score = 0
         self.enemy_score = 0 
-        self.score_font = pygame.font.Font(None, 48)
+        self.player_own_goals = 0  # Balls put in their own net (no score either way)
+        self.enemy_own_goals = 0
+        self.score_font = get_font(48)
+        self.timer_label = HudLabel(self.font, (0, 0, 0), (255, 255, 255), midtop=(400, 20))
+        self.score_label = HudLabel(self.score_font, (0, 0, 0), (255, 255, 255), topleft=(20, 20))
+        self.enemy_score_label = HudLabel(self.score_font, (0, 0, 0), (255, 255, 255), topright=(780, 20))
         self.celebrating = False
         self.celebration_message = ""
         self.celebration_start_time = None
@@ -85,30 +99,25 @@ class Arena:
         """Pause the game timer"""
         if not self.paused:
             self.paused = True
-            self.pause_start_time = time.time()
+            self.pause_start_time = match_clock.time()
 
     def resume_timer(self):
         """Resume the game timer"""
         if self.paused:
             self.paused = False
-            self.total_paused_time += time.time() - self.pause_start_time
+            self.total_paused_time += match_clock.time() - self.pause_start_time
 
-    def draw_timer(self, screen):
-        """Draw the game timer with pause support"""
+    def remaining_time(self):
+        """Whole seconds left on the game timer (it stops while paused)"""
         if self.paused:
             elapsed = int(self.pause_start_time - self.start_time - self.total_paused_time)
         else:
-            elapsed = int(time.time() - self.start_time - self.total_paused_time)
-        
-        remaining = max(0, self.total_time - elapsed)
-        timer_surface = self.font.render(f"Time: {remaining}", True, (0, 0, 0))
-        timer_rect = timer_surface.get_rect(midtop=(400, 20))
-        bg_rect = pygame.Rect(timer_rect.left - 5, timer_rect.top - 5, timer_rect.width + 10, timer_rect.height + 10)
-        pygame.draw.rect(screen, (255, 255, 255), bg_rect)
-        screen.blit(timer_surface, timer_rect)
+            elapsed = int(match_clock.time() - self.start_time - self.total_paused_time)
+        return max(0, self.total_time - elapsed)
 
-        if remaining <= 0 and not self.time_out:
-            pygame.time.wait(100)
+    def update_timer(self):
+        """End the match and decide the result once the timer runs out"""
+        if self.remaining_time() <= 0 and not self.time_out:
             self.time_out = True
             if self.score > self.enemy_score:
                 self.win = True
@@ -116,25 +125,21 @@ class Arena:
                 self.win = False
             else:
                 self.win = None  # For a draw
+
+    def draw_timer(self, screen):
+        """Draw the game timer with pause support"""
+        self.timer_label.draw(screen, f"Time: {self.remaining_time()}")
             
     def draw_score(self, screen):
         """Draw both player and enemy scores"""
         # Player score (left side)
-        score_surface = self.score_font.render(f"Player: {self.score}", True, (0, 0, 0))
-        score_rect = score_surface.get_rect(topleft=(20, 20))
-        bg_rect = pygame.Rect(score_rect.left - 5, score_rect.top - 5, score_rect.width + 10, score_rect.height + 10)
-        pygame.draw.rect(screen, (255, 255, 255), bg_rect)
-        screen.blit(score_surface, score_rect)
+        self.score_label.draw(screen, f"Player: {self.score}")
 
         # Enemy score (right side)
         if self.level == 1:
-            enemy_score_surface = self.score_font.render(f"Demon: {self.enemy_score}", True, (0, 0, 0))
+            self.enemy_score_label.draw(screen, f"Demon: {self.enemy_score}")
         else:
-            enemy_score_surface = self.score_font.render(f"Lucifer: {self.enemy_score}", True, (0, 0, 0))
-        enemy_score_rect = enemy_score_surface.get_rect(topright=(780, 20))
-        bg_enemy_rect = pygame.Rect(enemy_score_rect.left - 5, enemy_score_rect.top - 5, enemy_score_rect.width + 10, enemy_score_rect.height + 10)
-        pygame.draw.rect(screen, (255, 255, 255), bg_enemy_rect)
-        screen.blit(enemy_score_surface, enemy_score_rect)
+            self.enemy_score_label.draw(screen, f"Lucifer: {self.enemy_score}")
     
     def update_score(self, ball_rect):
         """Update score based on who last touched the ball"""
@@ -159,11 +164,11 @@ class Arena:
                 self.enemy_score += 1
                 self.celebrating = True
                 self.celebration_message = "DEMON Goal"
-                self.celebration_start_time = time.time()
+                self.celebration_start_time = match_clock.time()
                 
                 # Always play sound regardless of celebration state - use dedicated channel
                 try:
-                    pygame.mixer.Channel(1).play(pygame.mixer.Sound('sounds/goal_enemy.mp3'))
+                    pygame.mixer.Channel(1).play(load_sound('sounds/goal_enemy.mp3'))
                 except:
                     # Fallback to function if direct channel fails
                     play_sound('goal_enemy')
@@ -171,10 +176,11 @@ class Arena:
                 return True
             else:
                 # Character put ball in own goal - no score
+                self.player_own_goals += 1
                 
                 # Always play whistle sound - use dedicated channel
                 try:
-                    pygame.mixer.Channel(2).play(pygame.mixer.Sound('sounds/whistle.mp3'))
+                    pygame.mixer.Channel(2).play(load_sound('sounds/whistle.mp3'))
                 except:
                     # Fallback to function if direct channel fails
                     play_sound('whistle')
@@ -189,11 +195,11 @@ class Arena:
                 self.score += 1
                 self.celebrating = True
                 self.celebration_message = "Goal!"
-                self.celebration_start_time = time.time()
+                self.celebration_start_time = match_clock.time()
                 
                 # Always play sound regardless of celebration state - use dedicated channel
                 try:
-                    pygame.mixer.Channel(3).play(pygame.mixer.Sound('sounds/goal_player.mp3'))
+                    pygame.mixer.Channel(3).play(load_sound('sounds/goal_player.mp3'))
                 except:
                     # Fallback to function if direct channel fails
                     play_sound('goal_player')
@@ -201,10 +207,11 @@ class Arena:
                 return True
             else:
                 # Demon put ball in own goal - no score
+                self.enemy_own_goals += 1
                 
                 # Always play whistle sound - use dedicated channel
                 try:
-                    pygame.mixer.Channel(4).play(pygame.mixer.Sound('sounds/whistle.mp3'))
+                    pygame.mixer.Channel(4).play(load_sound('sounds/whistle.mp3'))
                 except:
                     # Fallback to function if direct channel fails
                     play_sound('whistle')
@@ -214,9 +221,11 @@ class Arena:
         return False
         
     def update(self, bot, character, ball):
-        """Update game state including celebrations and power bars"""
+        """Update game state including the timer, celebrations and power bars"""
+        self.update_timer()
+
         if self.celebrating:
-            current_time = time.time()
+            current_time = match_clock.time()
             elapsed = current_time - self.celebration_start_time
             
             if elapsed >= self.celebration_duration_sec:
@@ -227,9 +236,9 @@ class Arena:
         self.enemy_power_bar.update()
 
         if self.level == 1:
-            if (self.enemy_power_bar.is_full and not self.celebrating and bot.current_action == "kick" and random.random() < 0.2):  # 2% chance per frame
+            if (self.enemy_power_bar.is_full and not self.celebrating and bot.current_action == "kick" and self.gameplay_rng.random() < 0.2):  # 2% chance per frame
                 self.enemy_power_bar.use_power()
-                if random.random() < 0.5:
+                if self.gameplay_rng.random() < 0.5:
                     bot.start_power_kick()
                 else:
                     bot.start_ground_fire()
@@ -315,28 +324,45 @@ class Arena:
         """Draw the hint text for powers"""
         if self.font:
             # Create the surface for the hint text
-            hint_surface = self.font.render(hint_text, True, (255, 255, 255))
+            hint_surface = render_text(self.font, hint_text, (255, 255, 255))
             hint_rect = hint_surface.get_rect(midtop=(400, 550))  # Adjust position as needed
 
             # Draw background for better readability
             bg_rect = pygame.Rect(hint_rect.left - 5, hint_rect.top - 5, hint_rect.width + 10, hint_rect.height + 10)
-            pygame.draw.rect(screen, (0, 0, 0), bg_rect)
+            mark_dirty(screen, pygame.draw.rect(screen, (0, 0, 0), bg_rect))
             
             # Draw the hint text on the screen
             screen.blit(hint_surface, hint_rect)
 
+    def invalidate_static_layer(self):
+        """Rebuild the background/nets layer on the next draw (call after changing either)"""
+        self.static_layer = None
+
+    def build_static_layer(self):
+        """Pre-composite the background and both nets into one opaque surface"""
+        layer = self.background_img.copy()
+        self.draw_nets(layer)
+        return layer
+
+    def draw_nets(self, surface):
+        surface.blit(self.flipped_net_img, self.right_net_rect.topleft)  # Left net
+        surface.blit(self.football_net_img, self.left_net_rect.topleft)  # Right net
+
     def draw(self, screen, ball, character, bot):
         """Draw all arena elements"""
-        flipped_right_net = pygame.transform.flip(self.football_net_img, True, False)
-
-        screen.blit(self.background_img, (0, 0))
+        if self.static_layer is None:
+            self.static_layer = self.build_static_layer()
+        if isinstance(screen, TrackedSurface):
+            screen.restore(self.static_layer)  # Only where last frame drew
+        else:
+            screen.blit(self.static_layer, (0, 0))
         
         if self.level == 1:
-            bot.trigger_full_ground_fire(screen, character)
-            bot.trigger_power_kick(ball, screen)
-        
-        screen.blit(flipped_right_net, self.right_net_rect.topleft)  # Left net
-        screen.blit(self.football_net_img, self.left_net_rect.topleft)  # Right net
+            bot.draw_ground_fire(screen)
+            bot.draw_power_kick(screen)
+            # Fire and sparks burn behind the nets
+            if bot.start_fire or len(bot.power_kick_particles):
+                self.draw_nets(screen)
         
         self.draw_score(screen)
         
@@ -361,24 +387,23 @@ class Arena:
 
         # Draw celebration text
         if self.celebrating:
-            font = pygame.font.SysFont(None, 100)
-            goal_text = font.render(self.celebration_message, True, (255, 215, 0))  # Gold text
+            goal_text = render_text(get_font(100), self.celebration_message, (255, 215, 0))  # Gold text
             screen.blit(goal_text, (400 - goal_text.get_width() // 2, 250))
 
         # Show result if time is up
         if self.time_out:
-            overlay = pygame.Surface((800, 600))
-            overlay.set_alpha(180)
-            overlay.fill((128, 128, 128))  # Gray
-            screen.blit(overlay, (0, 0))
+            with surface_pool.scratch((800, 600)) as overlay:
+                overlay.set_alpha(180)
+                overlay.fill((128, 128, 128))  # Gray
+                screen.blit(overlay, (0, 0))
 
-            result_font = pygame.font.SysFont(None, 100)
+            result_font = get_font(100)
             if self.win is True:
-                result_text = result_font.render("You Win!", True, (0, 255, 0))
+                result_text = render_text(result_font, "You Win!", (0, 255, 0))
             elif self.win is False:
-                result_text = result_font.render("You Lose!", True, (255, 0, 0))
+                result_text = render_text(result_font, "You Lose!", (255, 0, 0))
             else:
-                result_text = result_text = result_font.render("Draw!", True, (255, 255, 0))
+                result_text = render_text(result_font, "Draw!", (255, 255, 0))
 
             screen.blit(result_text, (400 - result_text.get_width() // 2, 250))
         
@@ -392,20 +417,6 @@ class Arena:
         return self.win
         
     def apply_blur_effect_with_dark_top(self, screen):
-        # Step 1: Apply Blur
-        scale = 0.1  # Lower = more blur
-        small_size = (int(WIDTH * scale), int(HEIGHT * scale))
-        small_surface = pygame.transform.smoothscale(screen, small_size)
-        blurred_surface = pygame.transform.smoothscale(small_surface, (WIDTH, HEIGHT))
-        blurred_surface.set_alpha(128)
-        screen.blit(blurred_surface, (0, 0))
-
-        # Step 2: Create black-to-transparent gradient (top dark, bottom clear)
-        gradient = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for y in range(HEIGHT):
-            alpha = int(150 * (1 - y / HEIGHT))  # Max alpha at top, 0 at bottom
-            color = (0, 0, 0, alpha)
-            pygame.draw.line(gradient, color, (0, y), (WIDTH, y))
-
-        # Step 3: Overlay the dark gradient
-        screen.blit(gradient, (0, 0))
\ No newline at end of file
+        # Blur the frame and darken the top (top dark, bottom clear)
+        with frame_profiler.section("fire post-process"):
+            self.fire_post_process.apply(screen)
\ No newline at end of file
@@ -0,0 +1,259 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import pygame
+from collections import OrderedDict
+from asset_manifest import ASSET_GROUPS, VARIANTS
+from config import ASSET_CACHE_BUDGET_MB, SPRITE_PACK_PATH
+
+# Sprite pack layout (written by bake_assets.py):
+#   header | pixel blobs (BGRA, 16-byte aligned) | JSON index
+PACK_MAGIC = b"ORBPACK\0"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<8sIQQ")  # magic, version, index offset, index length
+PACK_FORMAT = "BGRA"  # Same byte order as convert_alpha() surfaces
+
+
+def pack_key(path, size, flip, alpha):
+    """Index key of one baked sprite variant"""
+    size_text = f"{size[0]}x{size[1]}" if size else "source"
+    return f"{path}|{size_text}|{'flip' if flip else 'noflip'}|{'alpha' if alpha else 'opaque'}"
+
+
+class SpritePack:
+    """Memory-mapped sprite pack built by bake_assets.py"""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        # Copy-on-write mapping: pages are only read from disk when touched
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, index_offset, index_length = PACK_HEADER.unpack_from(self.data)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError(f"{path} is not a version {PACK_VERSION} sprite pack")
+        self.index = json.loads(self.data[index_offset:index_offset + index_length])
+        self.buffer = memoryview(self.data)
+        self.fresh_sources = {}  # path -> source unchanged since baking
+
+    def get(self, path, size, flip, alpha):
+        """Surface straight from the packed pixels, or None if not baked/stale"""
+        entry = self.index.get(pack_key(path, size, flip, alpha))
+        if entry is None or not self._is_fresh(path, entry):
+            return None
+        width, height = entry["size"]
+        start = entry["offset"]
+        pixels = self.buffer[start:start + width * height * 4]
+        return pygame.image.frombuffer(pixels, (width, height), PACK_FORMAT)
+
+    def _is_fresh(self, path, entry):
+        if path not in self.fresh_sources:
+            try:
+                stat = os.stat(path)
+                self.fresh_sources[path] = (stat.st_mtime_ns == entry["source_mtime"]
+                                            and stat.st_size == entry["source_size"])
+            except OSError:
+                # Source missing at runtime: the baked copy is all we have
+                self.fresh_sources[path] = True
+        return self.fresh_sources[path]
+
+
+def open_sprite_pack(path=SPRITE_PACK_PATH):
+    """Open the baked sprite pack, or return None to decode PNGs instead"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return SpritePack(path)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring sprite pack {path}: {e}")
+        return None
+
+
+class AssetCache:
+    """Process-wide sprite registry shared by every level, menu and scene.
+
+    Surfaces are keyed by (path, size, flip, pixel format) and kept in a
+    bounded LRU so restarting a level reuses frames instead of decoding the
+    PNGs again. Returned surfaces are shared - copy before mutating them.
+    """
+
+    def __init__(self, budget_bytes, pack=None):
+        self.budget_bytes = budget_bytes
+        self.pack = pack  # Optional SpritePack checked before decoding PNGs
+        self.used_bytes = 0
+        self.surfaces = OrderedDict()  # key -> Surface, oldest first
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path, size=None, flip=False, alpha=True):
+        """Return a scaled, flipped and display-converted Surface for path"""
+        pixel_format = self._pixel_format(alpha)
+        key = (path, tuple(size) if size else None, flip, pixel_format)
+
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self._build(path, key[1], flip, pixel_format)
+        self._store(key, surface)
+        return surface
+
+    def _build(self, path, size, flip, pixel_format):
+        # Baked sprites skip PNG decode and scaling entirely
+        if self.pack:
+            surface = self.pack.get(path, size, flip, pixel_format != "opaque")
+            if surface is not None:
+                if pixel_format == "alpha":
+                    surface = surface.convert_alpha()
+                elif pixel_format == "opaque":
+                    surface = surface.convert()
+                return surface
+
+        # Flipped variants come from the cached unflipped one
+        if flip:
+            surface = self.get(path, size, False, pixel_format != "opaque")
+            return pygame.transform.flip(surface, True, False)
+
+        # Source images can be huge, so only the scaled result is kept and
+        # converted - never the decoded original
+        surface = pygame.image.load(path)
+        if size:
+            surface = pygame.transform.scale(surface, size)
+
+        if pixel_format == "alpha":
+            surface = surface.convert_alpha()
+        elif pixel_format == "opaque":
+            surface = surface.convert()
+        return surface
+
+    def adopt(self, key, surface):
+        """Insert a surface built elsewhere (e.g. by the preloader)"""
+        if key not in self.surfaces:
+            self._store(key, surface)
+
+    def _pixel_format(self, alpha):
+        # convert() needs a display mode; without one keep the decoded format
+        if pygame.display.get_init() and pygame.display.get_surface() is not None:
+            return "alpha" if alpha else "opaque"
+        return "raw"
+
+    def _store(self, key, surface):
+        size_bytes = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self.surfaces[key] = surface
+        self.used_bytes += size_bytes
+
+        # Evict least recently used surfaces until we are back under budget
+        while self.used_bytes > self.budget_bytes and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.used_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+
+    def clear(self):
+        """Drop every cached surface"""
+        self.surfaces.clear()
+        self.used_bytes = 0
+
+
+class RotationAtlas:
+    """A sprite pre-rotated to evenly spaced angles, built once"""
+
+    def __init__(self, surface, steps):
+        self.step_degrees = 360 / steps
+        # Clockwise rotations, matching rotate(surface, -angle)
+        self.frames = [pygame.transform.rotate(surface, -i * self.step_degrees) for i in range(steps)]
+
+    def get(self, angle):
+        """Frame nearest to a clockwise angle in degrees"""
+        return self.frames[round(angle / self.step_degrees) % len(self.frames)]
+
+
+class AssetPreloader:
+    """Warms manifest asset groups on a worker thread.
+
+    The worker decodes, scales and converts surfaces; the main thread only
+    adopts finished Surfaces into the cache (see collect), so starting the
+    next level never waits on the PNG decoder.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.lock = threading.Lock()
+        self.finished = []  # (key, surface) built by workers, not yet adopted
+        self.started = set()  # group names already requested
+
+    def start(self, group):
+        """Begin loading an asset group in the background (once per group)"""
+        if group in self.started:
+            return
+        self.started.add(group)
+        worker = threading.Thread(target=self._load_group, args=(ASSET_GROUPS[group],),
+                                  name=f"preload-{group}", daemon=True)
+        worker.start()
+
+    def _load_group(self, entries):
+        for path, size, variants in entries:
+            for variant in variants:
+                flip, alpha = VARIANTS[variant]
+                pixel_format = self.cache._pixel_format(alpha)
+                key = (path, tuple(size) if size else None, flip, pixel_format)
+                if key in self.cache.surfaces:
+                    continue
+                try:
+                    # Build without touching the cache dict - only the main
+                    # thread mutates it
+                    surface = self.cache._build(path, key[1], False, pixel_format)
+                    if flip:
+                        surface = pygame.transform.flip(surface, True, False)
+                except (pygame.error, FileNotFoundError) as e:
+                    print(f"Preload skipped {path}: {e}")
+                    continue
+                with self.lock:
+                    self.finished.append((key, surface))
+
+    def collect(self):
+        """Adopt surfaces finished by the workers (main thread, non-blocking)"""
+        if not self.finished:
+            return
+        with self.lock:
+            finished, self.finished = self.finished, []
+        for key, surface in finished:
+            self.cache.adopt(key, surface)
+
+
+# Shared registry used by load_image / load_frames
+cache = AssetCache(ASSET_CACHE_BUDGET_MB * 1024 * 1024, open_sprite_pack())
+preloader = AssetPreloader(cache)
+rotation_atlases = {}  # (path, size, steps, pixel format) -> RotationAtlas
+
+
+def preload_group(group):
+    """Start warming an asset group from asset_manifest.ASSET_GROUPS"""
+    preloader.start(group)
+
+
+def load_image(path, size=None, flip=False, alpha=True):
+    """Load an image through the shared cache"""
+    preloader.collect()
+    return cache.get(path, size, flip, alpha)
+
+
+def load_rotation_atlas(path, size, steps, alpha=True):
+    """Rotation atlas for an image, shared by everything that draws it"""
+    key = (path, tuple(size), steps, cache._pixel_format(alpha))
+    if key not in rotation_atlases:
+        rotation_atlases[key] = RotationAtlas(load_image(path, size, alpha=alpha), steps)
+    return rotation_atlases[key]
+
+
+def load_frames(paths, size=None, flip=False, alpha=True):
+    """Load a list of animation frames, skipping ones that fail to load"""
+    preloader.collect()
+    frames = []
+    for path in paths:
+        try:
+            frames.append(cache.get(path, size, flip, alpha))
+        except (pygame.error, FileNotFoundError):
+            print(f"Error: Could not load image {path}")
+    return frames
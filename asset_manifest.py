@@ -0,0 +1,80 @@
+# Sprites baked into the sprite pack by bake_assets.py
+#
+# Each entry is (source, target size, variants). A size of None keeps the
+# source size. Variants pick the pixel format the game asks for:
+#   "alpha"   - convert_alpha() sprite (load_image default)
+#   "opaque"  - convert() background (load_image(..., alpha=False))
+#   "flipped" - horizontally flipped alpha sprite (load_image(..., flip=True))
+
+VARIANTS = {
+    # variant name -> (flip, alpha)
+    "alpha": (False, True),
+    "opaque": (False, False),
+    "flipped": (True, True),
+}
+
+
+def frames(pattern, numbers, size, variants=("alpha",)):
+    """Expand a numbered frame pattern into manifest entries"""
+    return [(pattern.format(i), size, variants) for i in numbers]
+
+
+ASSET_GROUPS = {
+    "menu": [
+        ("images/background/menu_background.png", (800, 600), ("opaque",)),
+        ("images/button/play_button.png", (200, 80), ("alpha",)),
+        ("images/button/replay.png", (200, 200), ("alpha",)),
+    ],
+    "common": [
+        ("images/ball/ball.png", (30, 30), ("alpha",)),
+        *frames("images/power_frame/{:02d}.png", range(1, 41), (300, 300)),
+        *frames("images/player/Idle A-{:02d}.png", range(1, 7), (150, 200)),
+        *frames("images/player/Run A-{:02d}.png", range(1, 9), (150, 200)),
+        *frames("images/player/Attack A-{:02d}.png", range(3, 5), (150, 200)),
+        *frames("images/player/Jump A-{:02d}.png", range(1, 11), (150, 200)),
+        *frames("images/player/Dead-{:02d}.png", range(1, 4), (150, 200)),
+        *frames("images/player/Hurt-{:02d}.png", range(1, 4), (150, 200)),
+        *frames("images/power_bar/powerbar_{}.png", range(1, 7), (200, 60)),
+        *frames("images/effectLevel2/Explosion_{}.png", range(1, 11), None),
+    ],
+    "level1": [
+        ("images/background/fire_animatiaon.gif", (800, 600), ("opaque",)),
+        ("images/goal/lava_goal.png", (90, 190), ("alpha", "flipped")),
+        *frames("images/bot_level_1/Idle A-{:02d}.png", range(1, 7), (110, 110)),
+        *frames("images/bot_level_1/Run A-{:02d}.png", range(1, 8), (110, 110)),
+        *frames("images/bot_level_1/Attack A-{:02d}.png", range(3, 5), (110, 110)),
+    ],
+    "level2": [
+        ("images/background/throne room.png", (800, 600), ("opaque",)),
+        ("images/goal/throne_goal.png", (110, 240), ("alpha", "flipped")),
+        *frames("images/bot_level_2/Idle-{:02d}.png", range(1, 9), (120, 135)),
+        *frames("images/bot_level_2/Run-{:02d}.png", range(1, 9), (120, 135)),
+        *frames("images/bot_level_2/Jump-{:02d}.png", range(1, 9), (120, 135)),
+        *frames("images/bot_level_2/Attack-{:02d}.png", range(1, 3), (120, 135)),
+        *frames("images/bot_level_2/Dead-{:02d}.png", range(1, 5), (120, 135)),
+        *frames("images/vine/vine{}.png", range(1, 6), (80, 200)),
+    ],
+    "screens": [
+        ("images/background/complate_level_background.png", (800, 600), ("opaque",)),
+        ("images/background/fire_animatiaon.gif", (800, 600), ("opaque",)),
+    ],
+    "story": [
+        ("images/background/scene01.png", (800, 600), ("opaque",)),
+        ("images/background/scene02.jpeg", (800, 600), ("opaque",)),
+        ("TransitionLv1Lv2/CastleScene.png", None, ("opaque",)),
+        ("storyscene/orbAtLucifer.png", (800, 600), ("opaque",)),
+        ("storyscene/orbAtLuciferMissing.jpeg", (800, 600), ("opaque",)),
+        ("storyscene/stormBackToFirstBackground.png", (800, 600), ("opaque",)),
+        ("storyscene/dragon.jpg", None, ("opaque",)),
+    ],
+}
+
+MANIFEST = [entry for group in ASSET_GROUPS.values() for entry in group]
+
+# Cutscene videos baked by bake_cutscenes.py, as (source, flip). flip matches
+# the argument play_video() is called with; frames are stored at screen size.
+CUTSCENES = [
+    ("storyscene/chaosNoOrb.mp4", False),
+    ("storyscene/revisionFirstVid.mp4", True),
+    ("storyscene/revisionChaos.mp4", True),
+]
@@ -0,0 +1,85 @@
+"""Bake the sprites listed in asset_manifest.py into one memory-mappable pack.
+
+Usage: python bake_assets.py [--output build/sprites.pack]
+
+Every (source, size, variant) is decoded, scaled and flipped exactly like
+asset_manager does at runtime, then stored as raw BGRA pixels. The game
+mmaps the pack and builds Surfaces with pygame.image.frombuffer, so level
+loads skip PNG decoding and scaling. Re-run after changing any image;
+sprites whose source changed since baking are decoded from disk instead.
+"""
+import argparse
+import json
+import os
+import pygame
+from asset_manager import PACK_FORMAT, PACK_HEADER, PACK_MAGIC, PACK_VERSION, pack_key
+from asset_manifest import MANIFEST, VARIANTS
+from config import SPRITE_PACK_PATH
+
+ALIGNMENT = 16
+
+
+def bake_surface(path, size, flip):
+    """Decode and transform one sprite the same way AssetCache does"""
+    surface = pygame.image.load(path)
+    if size:
+        surface = pygame.transform.scale(surface, size)
+    if flip:
+        surface = pygame.transform.flip(surface, True, False)
+
+    # Blit onto a 32-bit alpha surface so colorkeys and palettes resolve
+    # the same way convert_alpha() would
+    baked = pygame.Surface(surface.get_size(), pygame.SRCALPHA, 32)
+    baked.blit(surface, (0, 0))
+    return baked
+
+
+def bake(output_path):
+    index = {}
+    blobs = []
+    offset = PACK_HEADER.size
+
+    for source, size, variants in MANIFEST:
+        if not os.path.exists(source):
+            print(f"Skipping missing source: {source}")
+            continue
+        stat = os.stat(source)
+
+        for variant in variants:
+            flip, alpha = VARIANTS[variant]
+            key = pack_key(source, size, flip, alpha)
+            if key in index:
+                continue  # Listed by more than one asset group
+            surface = bake_surface(source, size, flip)
+            pixels = pygame.image.tobytes(surface, PACK_FORMAT)
+
+            padding = -offset % ALIGNMENT
+            blobs.append(b"\0" * padding)
+            offset += padding
+
+            index[key] = {
+                "offset": offset,
+                "size": surface.get_size(),
+                "source_mtime": stat.st_mtime_ns,
+                "source_size": stat.st_size,
+            }
+            blobs.append(pixels)
+            offset += len(pixels)
+
+    index_bytes = json.dumps(index).encode("utf-8")
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "wb") as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, offset, len(index_bytes)))
+        for blob in blobs:
+            f.write(blob)
+        f.write(index_bytes)
+
+    print(f"Baked {len(index)} sprites into {output_path} ({offset / (1024 * 1024):.1f} MB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bake game sprites into a sprite pack")
+    parser.add_argument("--output", default=SPRITE_PACK_PATH, help="pack file to write")
+    args = parser.parse_args()
+    bake(args.output)
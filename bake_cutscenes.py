@@ -0,0 +1,90 @@
+"""Bake the cutscene videos listed in asset_manifest.py into memory-mappable frame caches.
+
+Usage: python bake_cutscenes.py [--raw] [--keyframe-interval 30]
+
+Every frame is decoded, scaled to the screen size and flipped exactly like
+VideoStream does with cv2, then stored as RGB rows in
+build/cutscenes/<video>.frames. By default each frame is stored as the
+zlib-compressed XOR with the frame before it (mostly zeros, so it packs
+small), with a full key frame every --keyframe-interval frames. --raw stores
+uncompressed frames instead, which the game only copies, at about 1.4 MB a
+frame. Re-run after changing a video; stale caches are ignored.
+"""
+import argparse
+import json
+import os
+import zlib
+import cv2
+import numpy as np
+from asset_manifest import CUTSCENES
+from config import WIDTH, HEIGHT
+from storyscene.video_stream import CACHE_HEADER, CACHE_MAGIC, CACHE_VERSION, cache_path, convert_frame
+
+ALIGNMENT = 16
+
+
+def bake(source, flip, size, raw, keyframe_interval):
+    capture = cv2.VideoCapture(source)
+    if not capture.isOpened():
+        print(f"Skipping unreadable video: {source}")
+        return
+    stat = os.stat(source)
+    fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+
+    width, height = size
+    frame = np.empty((height, width, 3), np.uint8)
+    previous = np.empty_like(frame)
+    frames = []
+    output_path = cache_path(source)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    with open(output_path, "wb") as f:
+        f.write(b"\0" * CACHE_HEADER.size)  # Header is written last
+        offset = CACHE_HEADER.size
+        while True:
+            ok, decoded = capture.read()
+            if not ok:
+                break
+            convert_frame(decoded, size, not flip, frame)
+
+            if raw:
+                kind, blob = "raw", frame.tobytes()
+            elif len(frames) % keyframe_interval == 0:
+                kind, blob = "key", zlib.compress(frame.tobytes())
+            else:
+                kind, blob = "delta", zlib.compress(np.bitwise_xor(frame, previous).tobytes())
+            frame, previous = previous, frame
+
+            padding = -offset % ALIGNMENT
+            f.write(b"\0" * padding)
+            offset += padding
+            frames.append((offset, len(blob), kind))
+            f.write(blob)
+            offset += len(blob)
+
+        index_bytes = json.dumps({
+            "size": [width, height],
+            "flip": flip,
+            "fps": fps,
+            "source_mtime": stat.st_mtime_ns,
+            "source_size": stat.st_size,
+            "frames": frames,
+        }).encode("utf-8")
+        f.write(index_bytes)
+        f.seek(0)
+        f.write(CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, offset, len(index_bytes)))
+
+    capture.release()
+    print(f"Baked {len(frames)} frames of {source} into {output_path} ({offset / (1024 * 1024):.1f} MB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bake cutscene videos into frame caches")
+    parser.add_argument("--raw", action="store_true", help="store uncompressed frames")
+    parser.add_argument("--keyframe-interval", type=int, default=30, help="frames between full key frames")
+    args = parser.parse_args()
+    for source, flip in CUTSCENES:
+        if not os.path.exists(source):
+            print(f"Skipping missing video: {source}")
+            continue
+        bake(source, flip, (WIDTH, HEIGHT), args.raw, args.keyframe_interval)
@@ -1,14 +1,23 @@
 import math
+import numpy as np
 import pygame
-from config import WIDTH, GROUND_Y, gravity, DEBUG_MODE
+from config import WIDTH, GROUND_Y, gravity, DEBUG_MODE, BALL_ROTATION_STEPS, FLAME_CACHE_BUDGET_MB
 from collision import resolve_ball_obj_collision, resolve_ball_player_collision, bot_power_kick_player_ball_collision
 from character import CharacterAnimation
 import random
 from sound_manager import play_sound
 from botLevel1 import BotLevel1
+from asset_manager import load_image, load_rotation_atlas
+from text_cache import get_font
+from transform_cache import TransformCache
+from particles import SparkPool, rng, spark_colors, stamps
+
+# Flame trail transforms shared by every ball
+flame_cache = TransformCache(FLAME_CACHE_BUDGET_MB * 1024 * 1024)
 
 class Ball:
-    def __init__(self, current_level=1):
+    def __init__(self, current_level=1, gameplay_rng=None):
+        self.gameplay_rng = gameplay_rng or random.Random()  # Bounces off vines
         self.radius = 15
         self.pos = [WIDTH // 2, 100]
         self.vel = [0, 0] # x for horizontal, y for vertical speed
@@ -28,9 +37,11 @@ class Ball:
         self.arena = None  # Reference to arena (will be set in GameLevel1)
         
         # Load and scale the normal image
-        self.original_image = pygame.image.load("images/ball/ball.png").convert_alpha()
-        self.original_image = pygame.transform.scale(self.original_image, (self.radius * 2, self.radius * 2))
+        self.original_image = load_image("images/ball/ball.png", (self.radius * 2, self.radius * 2))
         self.image = self.original_image  # Will be rotated later
+        # Pre-rotated copies so drawing is a lookup instead of a rotate per frame
+        self.rotations = load_rotation_atlas("images/ball/ball.png", (self.radius * 2, self.radius * 2),
+                                             BALL_ROTATION_STEPS)
         
         # Special effect properties
         self.special_effect_active = False
@@ -42,11 +53,10 @@ class Ball:
         self.power_frames = []
         for i in range(1, 41):
             try:
-                frame = pygame.image.load(f"images/power_frame/{str(i).zfill(2)}.png").convert_alpha()
                 # INCREASED SIZE from 240x240 to 300x300 for more obvious effect
-                frame = pygame.transform.scale(frame, (300, 300))
+                frame = load_image(f"images/power_frame/{str(i).zfill(2)}.png", (300, 300))
                 self.power_frames.append(frame)
-            except pygame.error:
+            except (pygame.error, FileNotFoundError):
                 print(f"❌ Error: Could not load power frame {i}")
         
         self.power_frame_index = 0
@@ -60,7 +70,8 @@ class Ball:
         self.frame_opacity = [255, 240, 225, 210, 195, 180, 160, 140, 120, 100]  # Higher opacity values
         
         # Add particle effect properties
-        self.particles = []
+        self.particles = SparkPool(256)
+        self.effects = True  # Cosmetic trail sparks; off in headless simulation
         self.max_particles = 30  # INCREASED from 20 to 30
         
         # Track the current direction of the ball
@@ -70,11 +81,9 @@ class Ball:
         self.pulse_timer = 0
         self.pulse_scale = 1.0
 
-        # Load and keep copies of original frames for scaling effects
-        self.original_power_frames = []
-        if self.power_frames:
-            for frame in self.power_frames:
-                self.original_power_frames.append(frame.copy())
+        # Keep the original frames for scaling effects (cached frames are
+        # shared between balls and never modified, so no copies are needed)
+        self.original_power_frames = list(self.power_frames)
         
         # Add tracking for recent kicks to better handle kick detection
         self.last_touch_timer = 0  # Changed from last_kick_timer
@@ -292,8 +301,8 @@ class Ball:
                     self.vel[1] = -5  # Give it an upward bounce
                 
                 # Add some randomness to make it more realistic
-                self.vel[0] += random.uniform(0, 3)  # Only add positive randomness to keep it going right
-                self.vel[1] += random.uniform(-2, 2)
+                self.vel[0] += self.gameplay_rng.uniform(0, 3)  # Only add positive randomness to keep it going right
+                self.vel[1] += self.gameplay_rng.uniform(-2, 2)
                 
                 # If special effect is active, maintain its properties
                 if self.special_effect_active:
@@ -369,34 +378,18 @@ class Ball:
                     self.previous_positions.pop(0)
                     
                 # Add particles around the ball when special effect is active
-                if random.random() < 0.25:  # 25% chance each frame
-                    for _ in range(3):
-                        # Create particles slightly behind the ball based on velocity
-                        particle_angle = (self.direction + 180) % 360 + random.uniform(-30, 30)
-                        particle_angle_rad = math.radians(particle_angle)
-                        particle_distance = random.uniform(5, 20)
-                        
-                        offset_x = math.cos(particle_angle_rad) * particle_distance
-                        offset_y = math.sin(particle_angle_rad) * particle_distance
-                            
-                        particle = {
-                            'pos': [self.pos[0] + offset_x, self.pos[1] + offset_y],
-                            'vel': [random.uniform(-2.0, 2.0), random.uniform(-2.0, 2.0)],
-                            'radius': random.uniform(2, 6),
-                            'lifetime': 30,
-                            'color': (random.randint(200, 255), 
-                                     random.randint(100, 255), 
-                                     random.randint(50, 150))
-                        }
-                        self.particles.append(particle)
+                if self.effects and rng.random() < 0.25:  # 25% chance each frame
+                    # Create 3 particles slightly behind the ball based on velocity
+                    particle_angle_rad = np.radians((self.direction + 180) % 360 + rng.uniform(-30, 30, 3))
+                    particle_distance = rng.uniform(5, 20, 3)
+                    self.particles.emit(self.pos[0] + np.cos(particle_angle_rad) * particle_distance,
+                                        self.pos[1] + np.sin(particle_angle_rad) * particle_distance,
+                                        rng.uniform(-2.0, 2.0, 3), rng.uniform(-2.0, 2.0, 3),
+                                        30, rng.uniform(2, 6, 3), spark_colors(3))
             
             # Update particles
-            for particle in self.particles[:]:
-                particle['pos'][0] += particle['vel'][0]
-                particle['pos'][1] += particle['vel'][1]
-                particle['lifetime'] -= 1
-                if particle['lifetime'] <= 0:
-                    self.particles.remove(particle)
+            if self.effects:
+                self.particles.update()
             
             # Update power frame animation
             self.power_frame_counter += 1
@@ -409,13 +402,13 @@ class Ball:
             if self.special_effect_timer <= 0:
                 self.special_effect_active = False
                 self.previous_positions = []  # Clear trail when effect ends
-                self.particles = []  # Clear particles
+                self.particles.clear()  # Clear particles
                 self.bounciness = -0.8  # Reset bounciness to normal
                 self.character_ref = None  # Clear character reference
         else:
             # Clear trail if effect is not active
             self.previous_positions = []
-            self.particles = []
+            self.particles.clear()
         
         # Normal physics updates
         if self.special_effect_active:
@@ -541,7 +534,7 @@ class Ball:
             if not (self.character_ref and hasattr(self.character_ref, 'animation_locked') and self.character_ref.animation_locked):
                 self.special_effect_active = False  # Turn
                 self.previous_positions = []  # Clear trail
-                self.particles = []  # Clear particles
+                self.particles.clear()  # Clear particles
             return True
         
         # Check if ball out of bounds - only end special effect if character animation not locked
@@ -550,7 +543,7 @@ class Ball:
             if not (self.character_ref and hasattr(self.character_ref, 'animation_locked') and self.character_ref.animation_locked):
                 self.special_effect_active = False  # Turn off effect when ball goes out of bounds
                 self.previous_positions = []  # Clear trail
-                self.particles = []  # Clear particles
+                self.particles.clear()  # Clear particles
             return True
     
         return False
@@ -562,7 +555,7 @@ class Ball:
             self.power_frame_index = 0
             self.power_frame_counter = 0
             self.previous_positions = []  # Clear any existing trail
-            self.particles = []  # Clear any existing particles
+            self.particles.clear()  # Clear any existing particles
             self.pulse_timer = 0  # Reset pulse timer
             
             # Store the character reference if provided
@@ -607,36 +600,19 @@ class Ball:
             self.bounciness = -0.1  # Almost no bounce
             
             # Add initial burst of particles - INCREASED for more visible effect
-            for _ in range(30):  # Increased from 20 to 30
-                angle = random.uniform(0, 2 * 3.14159)
-                speed = random.uniform(3, 10)  # Increased speed range
-                particle = {
-                    'pos': [self.pos[0], self.pos[1]],
-                    'vel': [speed * math.cos(angle), speed * math.sin(angle)],
-                    'radius': random.uniform(3, 8),  # Larger particles
-                    'lifetime': random.randint(30, 60),  # Longer lifetime
-                    'color': (random.randint(200, 255), 
-                             random.randint(100, 255), 
-                             random.randint(50, 150))
-                }
-                self.particles.append(particle)
+            count = 30  # Increased from 20 to 30
+            angle = rng.uniform(0, 2 * 3.14159, count)
+            speed = rng.uniform(3, 10, count)  # Increased speed range
+            self.particles.emit(self.pos[0], self.pos[1], speed * np.cos(angle), speed * np.sin(angle),
+                                rng.integers(30, 61, count),  # Longer lifetime
+                                rng.uniform(3, 8, count),  # Larger particles
+                                spark_colors(count))
         else:
             print("Cannot activate special effect: power frames not loaded")
 
     def draw(self, screen):
         # Draw particles first (behind everything)
-        for particle in self.particles:
-            alpha = min(255, int(255 * (particle['lifetime'] / 30.0)))
-            color_with_alpha = (*particle['color'], alpha)
-            
-            # Create a surface for the particle with transparency
-            particle_surface = pygame.Surface((int(particle['radius'] * 2), int(particle['radius'] * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, color_with_alpha, 
-                            (int(particle['radius']), int(particle['radius'])), int(particle['radius']))
-            
-            screen.blit(particle_surface, 
-                    (int(particle['pos'][0] - particle['radius']), 
-                        int(particle['pos'][1] - particle['radius'])))
+        self.particles.draw(screen)
         
         # Draw trail segments ONLY (we'll skip drawing the main flame)
         if self.special_effect_active and self.power_frames:
@@ -650,19 +626,11 @@ class Ball:
                     # Get the frame
                     frame = self.power_frames[frame_idx]
                     
-                    # Create a copy with alpha for trail effect
-                    alpha_frame = frame.copy()
-                    alpha_frame.set_alpha(self.frame_opacity[i])
-                    
                     # Scale frames based on position in trail
                     scale_factor = 0.85 + (i / (len(self.previous_positions) * 1.0))  # INCREASED base scale
-                    # Base size is 300
-                    scaled_width = int(300 * scale_factor)
-                    scaled_height = int(300 * scale_factor)
-                    scaled_frame = pygame.transform.scale(alpha_frame, (scaled_width, scaled_height))
                     
-                    # Rotate frame to match the ball's direction at that point
-                    rotated_frame = pygame.transform.rotate(scaled_frame, -trail_dir)
+                    # Faded, scaled and rotated to match the ball's direction at that point
+                    rotated_frame = flame_cache.get(frame, scale_factor, trail_dir, self.frame_opacity[i])
                     
                     # Position the frame at the stored position
                     frame_x = pos_x - rotated_frame.get_width() // 2
@@ -676,13 +644,9 @@ class Ball:
             if len(self.previous_positions) < self.max_trail_length:
                 current_frame = self.power_frames[self.power_frame_index]
                 
-                # Apply pulsing effect to main flame
-                pulse_width = int(current_frame.get_width() * pulse_amount)
-                pulse_height = int(current_frame.get_height() * pulse_amount)
-                pulsed_frame = pygame.transform.scale(current_frame, (pulse_width, pulse_height))
-                
-                # Always rotate the flame to match the ball's direction
-                rotated_frame = pygame.transform.rotate(pulsed_frame, -self.direction)
+                # Apply pulsing effect to main flame and always rotate it to
+                # match the ball's direction
+                rotated_frame = flame_cache.get(current_frame, pulse_amount, self.direction)
                 
                 # Calculate the appropriate offset to align the right edge of the flame with the ball
                 direction_rad = math.radians(self.direction)
@@ -701,8 +665,8 @@ class Ball:
                 # Draw the rotated frame
                 screen.blit(rotated_frame, (frame_x, frame_y))
         
-        # Rotate the image and update position for the ball
-        self.image = pygame.transform.rotate(self.original_image, -self.angle)
+        # Rotated image and position for the ball
+        self.image = self.rotations.get(self.angle)
         rect = self.image.get_rect(center=(int(self.pos[0]), int(self.pos[1])))
         
         # Draw the actual ball (AFTER the effect so ball is on top)
@@ -712,9 +676,7 @@ class Ball:
         if hasattr(self, 'collision_flash') and self.collision_flash > 0:
             flash_radius = self.radius + 5
             flash_alpha = int(255 * (self.collision_flash / 10))
-            flash_surface = pygame.Surface((flash_radius * 2, flash_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(flash_surface, (255, 255, 0, flash_alpha), 
-                            (flash_radius, flash_radius), flash_radius)
+            flash_surface = stamps.get(flash_radius, (255, 255, 0, flash_alpha))
             screen.blit(flash_surface, 
                     (int(self.pos[0] - flash_radius), int(self.pos[1] - flash_radius)))
             
@@ -726,7 +688,7 @@ class Ball:
                             self.radius, 2)  # Blue circle outline
             
             # Label
-            font = pygame.font.Font(None, 20)
+            font = get_font(20)
             text = font.render("Ball", True, (0, 0, 255))
             screen.blit(text, (int(self.pos[0] - 15), int(self.pos[1] - self.radius - 20)))
             
@@ -787,7 +749,7 @@ class Ball:
         
         # Reset particles and trails
         self.previous_positions = []
-        self.particles = []
+        self.particles.clear()
         
         # Reset animation properties
         self.power_frame_index = 0
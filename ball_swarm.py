@@ -0,0 +1,84 @@
+"""Many balls at once on the vectorized kernel in collision.py.
+
+BallSwarm is the multi-ball chaos mode (CHAOS_BALLS extra balls in a
+match); sample_landings runs Monte Carlo copies of a ball to see where a
+shot is likely to come down.
+"""
+import numpy as np
+from config import WIDTH, GROUND_Y, BALL_ROTATION_STEPS
+from collision import rect_array, step_balls
+from asset_manager import load_rotation_atlas
+import particles
+
+
+class BallSwarm:
+    """Extra balls bouncing off the ground, walls, nets and characters like the match ball.
+
+    They never score and never touch the match ball, and they are spawned
+    from the cosmetic random stream, so a seeded match plays out the same
+    with or without them. Balls that come to rest drop back in from the sky.
+    """
+
+    def __init__(self, count, horizontal_scale, radius=15):
+        self.radius = radius
+        self.horizontal_scale = horizontal_scale
+        self.pos = np.empty((count, 2))
+        self.vel = np.empty((count, 2))
+        self.angle = np.zeros(count)
+        self.rotations = load_rotation_atlas("images/ball/ball.png", (radius * 2, radius * 2),
+                                             BALL_ROTATION_STEPS)
+        self.respawn(np.arange(count))
+
+    def __len__(self):
+        return len(self.pos)
+
+    def respawn(self, balls):
+        """Drop the given balls in from above the arena with a random push"""
+        count = len(balls)
+        rng = particles.rng
+        self.pos[balls, 0] = rng.uniform(self.radius * 4, WIDTH - self.radius * 4, count)
+        self.pos[balls, 1] = rng.uniform(-200, 100, count)
+        self.vel[balls, 0] = rng.uniform(-15, 15, count)
+        self.vel[balls, 1] = rng.uniform(-5, 5, count)
+
+    def update(self, rects, player_objects):
+        step_balls(self.pos, self.vel, self.radius, rect_array(rects), rect_array(player_objects),
+                   self.horizontal_scale)
+        # Spin like the match ball
+        self.angle = (self.angle + self.vel[:, 0] * 2.0 * self.horizontal_scale * 0.90) % 360
+
+        resting = (np.abs(self.vel[:, 0]) < 0.05) & (self.pos[:, 1] >= GROUND_Y - self.radius)
+        if resting.any():
+            self.respawn(np.flatnonzero(resting))
+
+    def draw(self, screen):
+        frames = [self.rotations.get(angle) for angle in self.angle.tolist()]
+        # Rotated frames are larger than the ball; center each one on its ball
+        half_sizes = np.array([frame.get_size() for frame in frames]).reshape(-1, 2) // 2
+        corners = (self.pos.astype(int) - half_sizes).tolist()
+        screen.blits(list(zip(frames, corners)), doreturn=False)
+
+
+def sample_landings(ball, samples, rects, player_objects, spread=1.0, max_steps=180, rng=None):
+    """Where copies of ball first touch the ground when its velocity is off by normal noise of spread.
+
+    Steps samples copies with the same physics as BallSwarm and returns the
+    x of each landing, NaN for copies still in the air after max_steps.
+    Pass rng (a numpy Generator) for repeatable samples.
+    """
+    rng = rng or np.random.default_rng()
+    pos = np.tile(np.asarray(ball.pos, float), (samples, 1))
+    vel = np.asarray(ball.vel, float) + rng.normal(0, spread, (samples, 2))
+    rects, player_rects = rect_array(rects), rect_array(player_objects)
+
+    landings = np.full(samples, np.nan)
+    in_air = np.ones(samples, bool)
+    for _ in range(max_steps):
+        grounded = step_balls(pos, vel, ball.radius, rects, player_rects,
+                              ball.HORIZONTAL_FORCE_SCALE, ball.VERTICAL_FORCE_SCALE)
+        landed = in_air & grounded
+        landings[landed] = pos[landed, 0]
+        in_air &= ~grounded
+        if not in_air.any():
+            break
+    return landings
@@ -0,0 +1,95 @@
+"""Run many headless matches across all CPU cores and summarise the results.
+
+Usage: python batch_matches.py [--level 1] [--matches 100] [--seed 0]
+                               [--player chase] [--workers N] [--record DIR]
+
+Match i is played with seed --seed + i by a scripted player: chase (runs at
+the ball and uses powers), random (mashes random keys, seeded per match) or
+idle (stands still). Each match prints a line as soon as it finishes; the
+totals for win/draw/loss, goals, own goals and powers used follow at the end.
+Use it to check a balance change, such as the bot's move_speed, over a few
+hundred matches instead of playing them by hand. With the same options the
+results are the same whatever the number of workers.
+"""
+import argparse
+import os
+import time
+from multiprocessing import Pool
+from config import SIMULATION_RATE
+from match import chase_ball, random_player, simulate_match
+
+PLAYERS = {
+    "chase": lambda seed: chase_ball,
+    "random": random_player,
+    "idle": lambda seed: (),
+}
+
+
+def play(job):
+    """Play one match in a worker process; job is (level, player, seed, record directory or None)"""
+    level, player, seed, record_dir = job
+    record = os.path.join(record_dir, f"level{level}-{seed}.keys") if record_dir else None
+    start = time.perf_counter()
+    state = simulate_match(level, PLAYERS[player](seed), seed, record=record)
+    state["wall_time"] = time.perf_counter() - start
+    return state
+
+
+def outcome(state):
+    return {True: "win", False: "loss"}.get(state["win"], "draw")
+
+
+def summarise(results, wall_time, workers):
+    count = len(results)
+    if not count:
+        return
+    outcomes = [outcome(state) for state in results]
+    steps = sum(state["steps"] for state in results)
+
+    def average(key):
+        return sum(state[key] for state in results) / count
+
+    print()
+    print(f"{count} matches of level {results[0]['level']}, {workers} worker(s)")
+    print(f"{'':<16}{'player':>10}{'bot':>10}")
+    print(f"{'wins':<16}{outcomes.count('win') / count:>10.1%}{outcomes.count('loss') / count:>10.1%}")
+    print(f"{'draws':<16}{outcomes.count('draw') / count:>10.1%}{outcomes.count('draw') / count:>10.1%}")
+    print(f"{'goals/match':<16}{average('score'):>10.2f}{average('enemy_score'):>10.2f}")
+    print(f"{'own goals/match':<16}{average('player_own_goals'):>10.2f}{average('enemy_own_goals'):>10.2f}")
+    print(f"{'powers/match':<16}{average('player_powers'):>10.2f}{average('enemy_powers'):>10.2f}")
+    simulated = steps / SIMULATION_RATE
+    print(f"Simulated {simulated:.0f}s of play in {wall_time:.1f}s "
+          f"({count / wall_time:.1f} matches/s, {simulated / wall_time:.0f}x real time)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless matches in parallel and summarise them")
+    parser.add_argument("--level", type=int, choices=(1, 2), default=1)
+    parser.add_argument("--matches", type=int, default=100, help="number of matches to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first match; match i uses seed + i")
+    parser.add_argument("--player", choices=sorted(PLAYERS), default="chase", help="scripted player")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--record", metavar="DIR", help="save an input log of every match in DIR")
+    args = parser.parse_args()
+
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+    jobs = [(args.level, args.player, args.seed + i, args.record) for i in range(args.matches)]
+    results = []
+    start = time.perf_counter()
+    pool = Pool(args.workers)
+    # Small jobs handed out one at a time keep every core busy to the end
+    for state in pool.imap_unordered(play, jobs, chunksize=1):
+        results.append(state)
+        print(f"[{len(results)}/{args.matches}] seed {state['seed']}: "
+              f"{state['score']}-{state['enemy_score']} {outcome(state)} "
+              f"({state['wall_time']:.2f}s)", flush=True)
+    # Let the workers exit on their own: SDL turns SIGTERM into a quit event,
+    # so Pool.terminate() can wait forever on a worker that started pygame
+    pool.close()
+    pool.join()
+    summarise(results, time.perf_counter() - start, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""Headless rendering benchmarks.
+
+Usage: python benchmark.py [name ...] [--frames N]
+
+Runs with SDL's dummy video/audio drivers, so no window or sound device is
+needed. Each benchmark prints its average frame time.
+"""
+import argparse
+import contextlib
+import io
+import os
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import WIDTH, HEIGHT, FPS
+
+
+def quiet():
+    """Swallow the game's debug prints so the report stays readable"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def power_shot(ball):
+    """Put the ball into a fresh power shot from the left side of the arena"""
+    ball.reset()
+    ball.pos = [150, 380]
+    ball.vel = [9, -3]
+    ball.activate_special_effect()
+
+
+def time_frames(frames, step):
+    """Average milliseconds per call of step() over frames calls"""
+    with quiet():
+        start = time.perf_counter()
+        for frame in range(frames):
+            step(frame)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def bench_flame_trail(screen, frames):
+    """Ball.draw during a power shot, with and without the flame transform cache"""
+    import ball as ball_module
+    from ball import Ball
+    from botLevel1 import BotLevel1
+    from character import CharacterAnimation
+
+    with quiet():
+        ball, player, bot = Ball(1), CharacterAnimation(), BotLevel1()
+    player.position_x, bot.position_x = -500, -500  # Keep them out of the shot
+    cache = ball_module.flame_cache
+
+    def run(frame, cold):
+        if not ball.special_effect_active or ball.update([], [], player, bot):
+            power_shot(ball)
+        if cold:
+            cache.clear()  # Every transform rebuilt, as before the cache existed
+        screen.fill((0, 0, 0))
+        ball.draw(screen)
+
+    results = {}
+    for label, cold in (("uncached", True), ("cached", False)):
+        cache.clear()
+        cache.hits = cache.misses = 0
+        with quiet():
+            power_shot(ball)
+        results[label] = time_frames(frames, lambda frame: run(frame, cold))
+        hit_rate = cache.hit_rate()
+        print(f"  {label:<9} {results[label]:7.2f} ms/frame  (cache hit rate {hit_rate:.0%})")
+    print(f"  speedup   {results['uncached'] / results['cached']:7.2f}x")
+
+
+def bench_ground_fire(screen, frames):
+    """Level 1 bot's ground fire at full strength for every EFFECT_QUALITY renderer"""
+    from fire_effect import GROUND_FIRE_QUALITY, create_ground_fire
+
+    for quality in GROUND_FIRE_QUALITY:
+        fire = create_ground_fire(quality)
+
+        def burn(frame):
+            # Fuel it the way BotLevel1 does during the first half of the fire
+            if frame % 5 == 0:
+                fire.emit_row(1)
+            fire.update()
+
+        # Warm up until the smoke has risen as high as it gets
+        for frame in range(150):
+            burn(frame)
+        update_ms = time_frames(frames, burn)
+        draw_ms = time_frames(frames, lambda frame: fire.draw(screen))
+        print(f"  {quality:<7} ({type(fire).__name__}) update {update_ms:6.2f} ms  draw {draw_ms:6.2f} ms")
+
+
+def draw_per_particle_surfaces(screen, pool):
+    """Reference renderer: a fresh SRCALPHA Surface and circle per particle"""
+    for i in range(pool.count):
+        r = int(pool.radius[i])
+        s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+        pygame.draw.circle(s, pool.color[i].tolist(), (r, r), r)
+        screen.blit(s, (float(pool.x[i]) - r, float(pool.y[i]) - r))
+
+
+def bench_particle_stamps(screen, frames):
+    """Particles drawn per millisecond: per-particle Surfaces vs cached stamps with one blits()"""
+    from particles import FireSmokePool
+
+    pool = FireSmokePool(4096)
+    while len(pool) < 3000:
+        pool.emit_row(1)
+        pool.update()
+
+    renderers = (("surfaces", lambda frame: draw_per_particle_surfaces(screen, pool)),
+                 ("stamps", lambda frame: pool.draw(screen)))
+    rates = {}
+    for label, draw in renderers:
+        ms = time_frames(frames, draw)
+        rates[label] = len(pool) / ms
+        print(f"  {label:<9} {ms:7.2f} ms/frame  {rates[label]:8.0f} particles/ms")
+    print(f"  speedup   {rates['stamps'] / rates['surfaces']:7.2f}x")
+
+
+def blur_dark_top_per_frame(screen):
+    """Reference: the post-process as it was, rebuilding everything every frame"""
+    small_surface = pygame.transform.smoothscale(screen, (WIDTH // 10, HEIGHT // 10))
+    blurred_surface = pygame.transform.smoothscale(small_surface, (WIDTH, HEIGHT))
+    blurred_surface.set_alpha(128)
+    screen.blit(blurred_surface, (0, 0))
+    gradient = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    for y in range(HEIGHT):
+        pygame.draw.line(gradient, (0, 0, 0, int(150 * (1 - y / HEIGHT))), (0, y), (WIDTH, y))
+    screen.blit(gradient, (0, 0))
+
+
+def bench_post_process(screen, frames):
+    """Fire blur + dark-top pass: rebuilt per frame vs cached BlurDarkenPass"""
+    from asset_manager import load_image
+    from post_process import BlurDarkenPass
+    from profiler import FrameProfiler
+
+    background = load_image("images/background/fire_animatiaon.gif", (WIDTH, HEIGHT), alpha=False)
+    profiler = FrameProfiler()
+    passes = {"rebuilt": blur_dark_top_per_frame}
+    for strength in (0.25, 0.5, 1.0):
+        passes[f"cached {strength}"] = BlurDarkenPass(strength=strength).apply
+
+    for label, apply in passes.items():
+        for frame in range(frames):
+            screen.blit(background, (0, 0))
+            with profiler.section(label):
+                apply(screen)
+        print(f"  {label:<12} {profiler.average_ms(label):6.2f} ms/frame")
+
+
+def post_later(delay, *events):
+    """Post events from a background thread, delay seconds apart"""
+    def post():
+        for event in events:
+            time.sleep(delay)
+            pygame.event.post(event)
+    threading.Thread(target=post, daemon=True).start()
+
+
+def cpu_usage(run):
+    """Process CPU time of run() as a share of the wall time it took"""
+    wall, cpu = time.perf_counter(), time.process_time()
+    with quiet():
+        run()
+    wall = time.perf_counter() - wall
+    return (time.process_time() - cpu) / wall, wall
+
+
+def redraw_every_frame(menu, seconds):
+    """Reference: the main menu loop as it was, redrawing at FPS until it is left"""
+    clock = pygame.time.Clock()
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        menu.handle_events_start_button(pygame.event.get())
+        menu.draw()
+        clock.tick(FPS)
+
+
+def bench_idle_screens(screen, frames):
+    """CPU use of the menu, result and dialogue screens while they wait for input"""
+    import main
+    import story
+    from menu import Menu
+
+    seconds = 2.0
+    with quiet():
+        menu = Menu(screen)
+        game = main.MainGame.__new__(main.MainGame)
+        game.screen, game.running, game.screen_profiler = screen, True, main.FrameProfiler()
+    # Put the buttons under the (headless) mouse so a posted click presses them
+    menu.start_button_rect.topleft = menu.retry_button_rect.topleft = pygame.mouse.get_pos()
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pygame.mouse.get_pos())
+
+    def key(k=pygame.K_SPACE):
+        return pygame.event.Event(pygame.KEYDOWN, key=k)
+
+    def dialogue():
+        # Step through every line at a reading pace
+        post_later(0.65, *[key() for _ in range(16)])
+        story.throne_room_dialogue(screen)
+
+    screens = {
+        "menu (redraw every frame)": lambda: redraw_every_frame(menu, seconds),
+        "menu": lambda: (post_later(seconds, click), menu.run()),
+        "retry menu": lambda: (post_later(seconds, click), menu.show_retry_menu()),
+        "level complete": lambda: game.show_level_complete(1),
+        "win screen": lambda: (post_later(seconds, key(pygame.K_m)), game.show_win_screen()),
+        "dialogue": dialogue,
+    }
+    for label, run in screens.items():
+        pygame.event.clear()
+        usage, wall = cpu_usage(run)
+        print(f"  {label:<26} {usage:6.1%} CPU over {wall:5.1f} s")
+
+
+def bench_simulation(screen, frames):
+    """Headless matches (no drawing) with a scripted player: simulated seconds per wall-clock second"""
+    from match import chase_ball, simulate_match
+    from timestep import match_clock
+
+    for level in (1, 2):
+        simulate_match(level, chase_ball)  # Load sprites and sounds first
+        matches, steps = 5, 0
+        start = time.perf_counter()
+        for seed in range(matches):
+            steps += simulate_match(level, chase_ball, seed)["steps"]
+        elapsed = time.perf_counter() - start
+        simulated = steps / match_clock.rate
+        print(f"  level {level}: {matches} matches, {simulated:.0f} simulated s in {elapsed:.2f} s"
+              f" ({simulated / elapsed:.0f}x real time)")
+
+
+def step_balls_scalar(balls, radius, rects, player_rects, horizontal_scale):
+    """Reference: Ball.update's normal physics one ball at a time, with the scalar collision functions"""
+    from config import GROUND_Y, gravity
+    from collision import resolve_ball_obj_collision, resolve_ball_player_collision
+
+    for pos, vel in balls:
+        vel[1] += gravity
+        pos[0] += vel[0] * horizontal_scale
+        pos[1] += vel[1]
+        if pos[1] >= GROUND_Y - radius:
+            pos[1] = GROUND_Y - radius
+            vel[1] *= -0.8
+            vel[0] *= 0.99 * horizontal_scale
+        if pos[0] <= radius:
+            pos[0] = radius
+            vel[0] *= -1 * horizontal_scale
+        elif pos[0] >= WIDTH - radius:
+            pos[0] = WIDTH - radius
+            vel[0] *= -1 * horizontal_scale
+        for rect in rects:
+            resolve_ball_obj_collision(pos, vel, radius, rect, bounce_factor=1)
+        for rect in player_rects:
+            resolve_ball_player_collision(pos, vel, radius, rect, horizontal_bounce_factor=0.5, vertical_bounce_factor=0.8)
+
+
+def bench_multi_ball(screen, frames):
+    """1000 balls against a level 1 arena's nets and characters: scalar loop vs the NumPy kernel"""
+    import numpy as np
+    from collision import rect_array, step_balls
+    from match import Match
+
+    with quiet():
+        match = Match(1, effects=False, seed=0)
+    rects = match.goal_rects
+    player_rects = [obj.rect for obj in match.character_rects]
+    scale, radius, count = match.ball.HORIZONTAL_FORCE_SCALE, match.ball.radius, 1000
+    steps = min(frames, 120)  # The scalar loop takes a while
+
+    rng = np.random.default_rng(0)
+    start_pos = np.column_stack((rng.uniform(radius, WIDTH - radius, count), rng.uniform(0, HEIGHT - 100, count)))
+    start_vel = rng.uniform(-15, 15, (count, 2))
+
+    balls = [(list(p), list(v)) for p, v in zip(start_pos.tolist(), start_vel.tolist())]
+    scalar_ms = time_frames(steps, lambda frame: step_balls_scalar(balls, radius, rects, player_rects, scale))
+
+    pos, vel = start_pos.copy(), start_vel.copy()
+    rect_rows, player_rows = rect_array(rects), rect_array(player_rects)
+    vector_ms = time_frames(steps, lambda frame: step_balls(pos, vel, radius, rect_rows, player_rows, scale))
+
+    error = max(np.abs(pos - [p for p, v in balls]).max(), np.abs(vel - [v for p, v in balls]).max())
+    print(f"  scalar    {scalar_ms:7.2f} ms/step")
+    print(f"  numpy     {vector_ms:7.2f} ms/step")
+    print(f"  speedup   {scalar_ms / vector_ms:7.2f}x  ({count} balls, {steps} steps, max difference {error:.2g})")
+
+
+def write_test_clip(path, frames, size=(640, 360), fps=30):
+    """Short synthetic video with moving content, so the benchmark needs no shipped cutscene"""
+    import cv2
+    import numpy as np
+
+    width, height = size
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, size)
+    ramp = np.arange(width) % 256
+    for frame in range(frames):
+        picture = np.zeros((height, width, 3), np.uint8)
+        picture[:, :, 0] = ramp
+        picture[:, :, 1] = (np.arange(height) % 256)[:, None]
+        picture[height // 3:height // 2, frame * 8 % width:frame * 8 % width + 60] = 255
+        writer.write(picture)
+    writer.release()
+
+
+def stream_frames(path, flip):
+    """Play a cutscene through VideoStream as fast as it decodes: (copies of its frames, ms per frame, source)"""
+    from storyscene.video_stream import FrameCache, VideoStream
+
+    stream = VideoStream(path, (WIDTH, HEIGHT), flip=flip)
+    assert stream.is_open(), f"could not open {path}"
+    source = "cache" if isinstance(stream.source, FrameCache) else "cv2"
+    frames = []
+    start = time.perf_counter()
+    stream.start()
+    while (surface := stream.next_frame()) is not None:
+        frames.append(pygame.image.tobytes(surface, "RGB"))
+    elapsed = time.perf_counter() - start
+    stream.close()
+    return frames, elapsed * 1000 / max(1, len(frames)), source
+
+
+def bench_cutscene_decode(screen, frames):
+    """A cutscene with no baked cache (the cv2 fallback) vs the same clip baked, which must show identical frames"""
+    import tempfile
+    import bake_cutscenes
+    from storyscene import video_stream
+
+    with tempfile.TemporaryDirectory() as folder:
+        clip = os.path.join(folder, "clip.mp4")
+        write_test_clip(clip, min(frames, 120))
+        cache_dir, video_stream.CUTSCENE_CACHE_DIR = video_stream.CUTSCENE_CACHE_DIR, os.path.join(folder, "cache")
+        try:
+            assert video_stream.open_frame_cache(clip, (WIDTH, HEIGHT), True) is None
+            decoded, decoded_ms, source = stream_frames(clip, True)
+            print(f"  {source:<9} {decoded_ms:7.2f} ms/frame  ({len(decoded)} frames, no cache)")
+            with quiet():
+                bake_cutscenes.bake(clip, True, (WIDTH, HEIGHT), False, 30)
+            baked, baked_ms, source = stream_frames(clip, True)
+            print(f"  {source:<9} {baked_ms:7.2f} ms/frame  identical to cv2: {baked == decoded}")
+        finally:
+            video_stream.CUTSCENE_CACHE_DIR = cache_dir
+
+
+BENCHMARKS = {
+    "flame_trail": bench_flame_trail,
+    "ground_fire": bench_ground_fire,
+    "particle_stamps": bench_particle_stamps,
+    "post_process": bench_post_process,
+    "idle_screens": bench_idle_screens,
+    "simulation": bench_simulation,
+    "multi_ball": bench_multi_ball,
+    "cutscene_decode": bench_cutscene_decode,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless rendering benchmarks")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--frames", type=int, default=600, help="frames per measurement")
+    args = parser.parse_args()
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark {name!r}")
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    with quiet():
+        from sound_manager import initialize_sounds
+        initialize_sounds()
+
+    for name in args.names or BENCHMARKS:
+        print(f"{name}:")
+        BENCHMARKS[name](screen, args.frames)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,29 @@
 
 import pygame
 from config import *
-import random
-from smokeParticle import SmokeParticle
+from asset_manager import load_frames
+from dirty_renderer import mark_dirty
+from text_cache import get_font, render_text
+from surface_pool import surface_pool
+from timestep import match_clock
+from particles import KickSparkPool, rng
+from fire_effect import create_ground_fire
+from sound_manager import load_sound
 import pygame.mixer
 import pygame.image
 import math
 
 class BotLevel1:
     def __init__(self):
-        def load_images(frame_list, resize=(110, 110)):
-            loaded_images = []
-            for frame in frame_list:
-                try:
-                    img = pygame.image.load(frame)
-                    img = pygame.transform.scale(img, resize)
-                    loaded_images.append(img)
-                except pygame.error:
-                    print(f"Error: Could not load image {frame}")
-            return loaded_images
-
         idle_frames = [f'images/bot_level_1/Idle A-{str(i).zfill(2)}.png' for i in range(1, 7)]
         run_frames = [f'images/bot_level_1/Run A-{str(i).zfill(2)}.png' for i in range(1, 8)]
         kick_frames = ['images/bot_level_1/Attack A-03.png', 'images/bot_level_1/Attack A-04.png' ]
         jump_frames = [f'images/bot_level_1/Idle A-{str(i).zfill(2)}.png' for i in range(1, 7)]
 
-        self.idle_animation = load_images(idle_frames)
-        self.run_animation = load_images(run_frames)
-        self.kick_animation = load_images(kick_frames)
-        self.jump_animation = load_images(jump_frames)
+        self.idle_animation = load_frames(idle_frames, (110, 110))
+        self.run_animation = load_frames(run_frames, (110, 110))
+        self.kick_animation = load_frames(kick_frames, (110, 110))
+        self.jump_animation = load_frames(jump_frames, (110, 110))
 
         if not all([self.idle_animation, self.run_animation, self.kick_animation, self.jump_animation]):
             raise RuntimeError("One or more animations failed to load. Check file paths.")
@@ -53,15 +48,16 @@ class BotLevel1:
             65, 100                            # width, height
         )
         self.is_jumping_over_ball = False
-        self.power_kick_particles = []
-        self.particles = []
+        self.power_kick_particles = KickSparkPool(512)
+        self.ground_fire = create_ground_fire()  # Renderer picked by EFFECT_QUALITY
+        self.effects = True  # Cosmetic fire and sparks; off in headless simulation
         self.start_fire = False
         self.fire_start_time = None
         self.fire_duration = 3000 
         self.fire_frame_counter = 0
         self.fire_frame_delay = 5  # Adjust this to control particle spawn rate
-        self.fire_sound = pygame.mixer.Sound("sounds/mixkit-fire-spell-with-explosion-1338.wav")
-        self.fire_sound_continuous = pygame.mixer.Sound("sounds/fire-noise-159659.mp3")
+        self.fire_sound = load_sound("sounds/mixkit-fire-spell-with-explosion-1338.wav")
+        self.fire_sound_continuous = load_sound("sounds/fire-noise-159659.mp3")
         self.power_kick = False
         
         # Add paused state
@@ -202,7 +198,7 @@ class BotLevel1:
         # Draw collision box if debug mode is enabled
         if DEBUG_MODE:
             # pygame.draw.rect(surface, (255, 0, 0), self.rect, 2)  # Red outline
-            font = pygame.font.Font(None, 20)
+            font = get_font(20)
             text = font.render("Bot Hitbox", True, (255, 0, 0))
             surface.blit(text, (self.rect.x, self.rect.y - 20))
             
@@ -219,24 +215,24 @@ class BotLevel1:
             # Draw a pulsing outline
             outline_thickness = 3 + int(math.sin(self.freeze_effect_timer * 0.1) * 2)
             outline_color = (0, 191, 255)  # Deep sky blue
-            pygame.draw.rect(surface, outline_color, 
+            outline = pygame.draw.rect(surface, outline_color, 
                         pygame.Rect(draw_x - 2, draw_y - 2, 
                                     img.get_width() + 4, img.get_height() + 4), 
                         outline_thickness)
+            mark_dirty(surface, outline)
             
             # Draw "FROZEN" text with a gentle bounce effect
-            font = pygame.font.Font(None, 36)
             text_y_offset = int(math.sin(self.freeze_effect_timer * 0.1) * 3)
-            text_surface = font.render("FROZEN", True, (0, 191, 255))
+            text_surface = render_text(get_font(36), "FROZEN", (0, 191, 255))
             text_rect = text_surface.get_rect(center=(draw_x + img.get_width() // 2, 
                                                     draw_y - 20 + text_y_offset))
             
             # Draw a semi-transparent background for better visibility
             bg_rect = pygame.Rect(text_rect.left - 5, text_rect.top - 5, 
                                 text_rect.width + 10, text_rect.height + 10)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            bg_surface.fill((0, 0, 0, 128))  # Semi-transparent black
-            surface.blit(bg_surface, (bg_rect.left, bg_rect.top))
+            with surface_pool.scratch(bg_rect.size, pygame.SRCALPHA) as bg_surface:
+                bg_surface.fill((0, 0, 0, 128))  # Semi-transparent black
+                surface.blit(bg_surface, (bg_rect.left, bg_rect.top))
             
             # Draw text
             surface.blit(text_surface, text_rect)
@@ -245,10 +241,11 @@ class BotLevel1:
             for i in range(3):
                 icicle_x = draw_x + img.get_width() * (i + 1) / 4
                 icicle_height = 10 + int(math.sin(self.freeze_effect_timer * 0.1 + i) * 3)
-                pygame.draw.polygon(surface, (200, 240, 255),  # Light blue
+                icicle = pygame.draw.polygon(surface, (200, 240, 255),  # Light blue
                                 [(icicle_x - 3, draw_y + img.get_height()),
                                 (icicle_x + 3, draw_y + img.get_height()),
                                 (icicle_x, draw_y + img.get_height() + icicle_height)])
+                mark_dirty(surface, icicle)
         
     # def reset(self):
     #     self.__init__()
@@ -334,9 +331,9 @@ class BotLevel1:
                 self.set_animation()
                 
                     
-    def trigger_full_ground_fire(self, screen, player):
- 
-        current_time = pygame.time.get_ticks()
+    def update_ground_fire(self, player):
+        """Advance the ground fire one step and hold the player down while it burns"""
+        current_time = match_clock.ticks()
 
         if self.start_fire:
             if self.fire_start_time is None:
@@ -361,13 +358,8 @@ class BotLevel1:
                     num_particles_per_column = int(2 * spawn_factor)
 
                     # if len(self.particles) < self.MAX_PARTICLES and num_particles_per_column > 0:
-                    if num_particles_per_column > 0:
-                        base_y = HEIGHT
-                        step = 5
-                        for x in range(0, WIDTH, step):
-                            for i in range(num_particles_per_column):
-                                flame_color = random.choice([(255, 100, 0), (255, 150, 50), (255, 200, 100)])
-                                self.particles.append(SmokeParticle(x + random.randint(-5, 5), base_y, flame_color, "flame"))
+                    if num_particles_per_column > 0 and self.effects:
+                        self.ground_fire.emit_row(num_particles_per_column, step=5)
             
             if self.start_fire:          
                 if player.current_action != "dead": 
@@ -385,62 +377,39 @@ class BotLevel1:
                     player.set_animation(self)                    
                 player.update({}, self)
 
-                # Always update & draw particles
-                for p in self.particles[:]:
-                    p.update()
-                    p.draw(screen)
-                    if p.life <= 0:
-                        self.particles.remove(p)
+                if self.effects:
+                    self.ground_fire.update()
             else:
                 if player.current_action != "idle":
                     player.current_action = "idle"
                     player.set_animation(self)
                 player.update({}, self)
 
+    def draw_ground_fire(self, screen):
+        if self.start_fire:
+            self.ground_fire.draw(screen)
 
     def start_ground_fire(self):
         self.start_fire = True
         self.fire_start_time = None  # Reset the timer   
         
-    def trigger_power_kick(self, ball, screen):
+    def update_power_kick(self, ball):
+        if not self.effects:
+            return
         if self.power_kick:
             ball_rect = ball.get_rect()
 
             # Generate 5–10 new particles (reduce for better performance)
-            for _ in range(random.randint(5, 10)):
-                self.power_kick_particles.append({
-                    'position': [ball_rect.centerx, ball_rect.centery],
-                    'velocity': [random.uniform(-3, 3), random.uniform(-5, -1)],
-                    'lifetime': 30,
-                    'max_lifetime': 30  # Used to calculate color and size fade
-                })
-
-        # Update and draw each particle
-        for p in self.power_kick_particles[:]:
-            # Update position
-            p['position'][0] += p['velocity'][0]
-            p['position'][1] += p['velocity'][1]
-            p['velocity'][1] += 0.1  # gravity
-            p['lifetime'] -= 1
-
-            # Calculate color (fade from yellow to red)
-            progress = p['lifetime'] / p['max_lifetime']
-            r = int(255)
-            g = int(140 * progress)  # From 140 → 0
-            b = int(0)
-            color = (r, g, b)
-
-            # Calculate size (shrink over time)
-            radius = max(1, int(6 * progress))
-
-            # Draw with flicker
-            offset_x = random.randint(-1, 1)
-            offset_y = random.randint(-1, 1)
-            pygame.draw.circle(screen, color, (int(p['position'][0] + offset_x), int(p['position'][1] + offset_y)), radius)
-
-            # Remove dead particles
-            if p['lifetime'] <= 0:
-                self.power_kick_particles.remove(p)
+            count = rng.integers(5, 11)
+            self.power_kick_particles.emit(ball_rect.centerx, ball_rect.centery,
+                                           rng.uniform(-3, 3, count), rng.uniform(-5, -1, count),
+                                           30, 6, (255, 140, 0))
+
+        # Sparks shrink and fade from yellow to red
+        self.power_kick_particles.update()
+
+    def draw_power_kick(self, screen):
+        self.power_kick_particles.draw(screen)
 
     def start_power_kick(self):
         self.power_kick = True
@@ -1,31 +1,24 @@
 import pygame
 import math
 from config import *
+from asset_manager import load_frames
+from dirty_renderer import mark_dirty
+from text_cache import get_font, render_text
+from surface_pool import surface_pool
 
 class BotLevel2:
     def __init__(self):
-        def load_images(frame_list, resize=(120, 135)):
-            loaded_images = []
-            for frame in frame_list:
-                try:
-                    img = pygame.image.load(frame)
-                    img = pygame.transform.scale(img, resize)
-                    loaded_images.append(img)
-                except pygame.error:
-                    print(f"Error: Could not load image {frame}")
-            return loaded_images
-
         idle_frames = [f'images/bot_level_2/Idle-{str(i).zfill(2)}.png' for i in range(1, 9)]
         run_frames = [f'images/bot_level_2/Run-{str(i).zfill(2)}.png' for i in range(1, 9)]
         jump_frames = [f'images/bot_level_2/Jump-{str(i).zfill(2)}.png' for i in range(1, 9)]
         attack_frames = [f'images/bot_level_2/Attack-{str(i).zfill(2)}.png' for i in range(1, 3)]
         dead_frames = [f'images/bot_level_2/Dead-{str(i).zfill(2)}.png' for i in range(1, 5)]
 
-        self.idle_animation = load_images(idle_frames)
-        self.run_animation = load_images(run_frames)
-        self.jump_animation = load_images(jump_frames)
-        self.attack_animation = load_images(attack_frames)
-        self.dead_animation = load_images(dead_frames)
+        self.idle_animation = load_frames(idle_frames, (120, 135))
+        self.run_animation = load_frames(run_frames, (120, 135))
+        self.jump_animation = load_frames(jump_frames, (120, 135))
+        self.attack_animation = load_frames(attack_frames, (120, 135))
+        self.dead_animation = load_frames(dead_frames, (120, 135))
         
         if not all([self.idle_animation, self.run_animation, self.jump_animation]):
             raise RuntimeError("One or more animations failed to load. Check file paths.")
@@ -170,24 +163,24 @@ class BotLevel2:
             # Draw a pulsing outline
             outline_thickness = 3 + int(math.sin(self.freeze_effect_timer * 0.1) * 2)
             outline_color = (0, 191, 255)  # Deep sky blue
-            pygame.draw.rect(surface, outline_color, 
+            outline = pygame.draw.rect(surface, outline_color, 
                         pygame.Rect(draw_x - 2, draw_y - 2, 
                                     img.get_width() + 4, img.get_height() + 4), 
                         outline_thickness)
+            mark_dirty(surface, outline)
             
             # Draw "FROZEN" text with a gentle bounce effect
-            font = pygame.font.Font(None, 36)
             text_y_offset = int(math.sin(self.freeze_effect_timer * 0.1) * 3)
-            text_surface = font.render("FROZEN", True, (0, 191, 255))
+            text_surface = render_text(get_font(36), "FROZEN", (0, 191, 255))
             text_rect = text_surface.get_rect(center=(draw_x + img.get_width() // 2, 
                                                     draw_y - 20 + text_y_offset))
             
             # Draw a semi-transparent background for better visibility
             bg_rect = pygame.Rect(text_rect.left - 5, text_rect.top - 5, 
                                 text_rect.width + 10, text_rect.height + 10)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            bg_surface.fill((0, 0, 0, 128))  # Semi-transparent black
-            surface.blit(bg_surface, (bg_rect.left, bg_rect.top))
+            with surface_pool.scratch(bg_rect.size, pygame.SRCALPHA) as bg_surface:
+                bg_surface.fill((0, 0, 0, 128))  # Semi-transparent black
+                surface.blit(bg_surface, (bg_rect.left, bg_rect.top))
             
             # Draw text
             surface.blit(text_surface, text_rect)
@@ -196,10 +189,11 @@ class BotLevel2:
             for i in range(3):
                 icicle_x = draw_x + img.get_width() * (i + 1) / 4
                 icicle_height = 10 + int(math.sin(self.freeze_effect_timer * 0.1 + i) * 3)
-                pygame.draw.polygon(surface, (200, 240, 255),  # Light blue
+                icicle = pygame.draw.polygon(surface, (200, 240, 255),  # Light blue
                                 [(icicle_x - 3, draw_y + img.get_height()),
                                 (icicle_x + 3, draw_y + img.get_height()),
                                 (icicle_x, draw_y + img.get_height() + icicle_height)])
+                mark_dirty(surface, icicle)
         
     def reset(self):
        # Reset position to default starting point
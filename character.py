@@ -1,20 +1,11 @@
 import pygame
 from config import *
+from asset_manager import load_frames
+from timestep import match_clock
 import time
 
 class CharacterAnimation:
     def __init__(self):
-        def load_images(frame_list, resize=(150, 200)):
-            loaded_images = []
-            for frame in frame_list:
-                try:
-                    img = pygame.image.load(frame)
-                    img = pygame.transform.scale(img, resize)
-                    loaded_images.append(img)
-                except pygame.error:
-                    print(f" Error: Could not load image {frame}")
-            return loaded_images
-
         idle_frames = [f'images/player/Idle A-{str(i).zfill(2)}.png' for i in range(1, 7)]
         run_frames = [f'images/player/Run A-{str(i).zfill(2)}.png' for i in range(1, 9)]
         kick_frames = ['images/player/Attack A-03.png', 'images/player/Attack A-04.png']
@@ -22,12 +13,12 @@ class CharacterAnimation:
         dead_frames = [f'images/player/Dead-{str(i).zfill(2)}.png' for i in range(1, 4)]
         hurt_frames = [f'images/player/Hurt-{str(i).zfill(2)}.png' for i in range(1, 4)]
 
-        self.idle_animation = load_images(idle_frames)
-        self.run_animation = load_images(run_frames)
-        self.kick_animation = load_images(kick_frames)
-        self.jump_animation = load_images(jump_frames)
-        self.dead_animation = load_images(dead_frames)
-        self.hurt_animation = load_images(hurt_frames)
+        self.idle_animation = load_frames(idle_frames, (150, 200))
+        self.run_animation = load_frames(run_frames, (150, 200))
+        self.kick_animation = load_frames(kick_frames, (150, 200))
+        self.jump_animation = load_frames(jump_frames, (150, 200))
+        self.dead_animation = load_frames(dead_frames, (150, 200))
+        self.hurt_animation = load_frames(hurt_frames, (150, 200))
 
         if not all([self.idle_animation, self.run_animation, self.kick_animation, self.jump_animation]):
             raise RuntimeError("One or more animations failed to load. Check file paths.")
@@ -92,7 +83,7 @@ class CharacterAnimation:
                         self.frame_index += 1
                 return
             
-        current_time = pygame.time.get_ticks()
+        current_time = match_clock.ticks()
         if self.power_kick_hit and current_time >= 2000:
             self.power_kick_hit = False
 
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 from config import *
 
 def resolve_ball_obj_collision(circle_pos, circle_vel, radius, rect, bounce_factor):
@@ -140,4 +141,101 @@ def bot_power_kick_player_ball_collision(circle_pos, circle_vel, radius, player,
         offset_x = 50
         offset_y = 50
         player.rect.x = player.position_x + offset_x
-        player.rect.y = player.position_y - player.jump_height + offset_y
\ No newline at end of file
+        player.rect.y = player.position_y - player.jump_height + offset_y
+
+
+# Vectorized versions for many balls at once. Positions and velocities are
+# (K, 2) float arrays changed in place, and each step applies the same
+# operations in the same order as the scalar functions and Ball.update.
+
+def rect_array(rects):
+    """(M, 4) array of left, top, right, bottom for pygame Rects or objects with a .rect"""
+    rects = [getattr(rect, "rect", rect) for rect in rects]
+    return np.array([(r.left, r.top, r.right, r.bottom) for r in rects], float).reshape(-1, 4)
+
+
+def _push_out_balls(pos, radius, rect):
+    """Move the balls overlapping rect out of it; returns their indices and collision normals"""
+    left, top, right, bottom = rect
+    dx = pos[:, 0] - np.clip(pos[:, 0], left, right)
+    dy = pos[:, 1] - np.clip(pos[:, 1], top, bottom)
+    distance = np.hypot(dx, dy)
+    hit = np.flatnonzero(distance < radius)
+    if not len(hit):
+        return hit, None, None
+    distance = distance[hit]
+    distance[distance == 0] = 0.1  # Avoid division by zero if the ball is exactly at the corner
+    nx, ny = dx[hit] / distance, dy[hit] / distance
+    overlap = radius - distance
+    pos[hit, 0] += nx * overlap
+    pos[hit, 1] += ny * overlap
+    return hit, nx, ny
+
+
+def resolve_balls_obj_collision(pos, vel, radius, rects, bounce_factor):
+    """resolve_ball_obj_collision for every ball against every rect of a rect_array, in rect order.
+
+    Returns a mask of the balls that hit something.
+    """
+    collided = np.zeros(len(pos), bool)
+    for rect in rects:
+        hit, nx, ny = _push_out_balls(pos, radius, rect)
+        if not len(hit):
+            continue
+        velocity_normal = vel[hit, 0] * nx + vel[hit, 1] * ny
+        vel[hit, 0] = (vel[hit, 0] - 2 * velocity_normal * nx) * bounce_factor
+        vel[hit, 1] = (vel[hit, 1] - 2 * velocity_normal * ny) * bounce_factor
+        collided[hit] = True
+    return collided
+
+
+def resolve_balls_player_collision(pos, vel, radius, rects, horizontal_bounce_factor, vertical_bounce_factor):
+    """resolve_ball_player_collision for every ball against every rect of a rect_array, in rect order.
+
+    Returns a mask of the balls that hit something.
+    """
+    collided = np.zeros(len(pos), bool)
+    for rect in rects:
+        hit, nx, ny = _push_out_balls(pos, radius, rect)
+        if not len(hit):
+            continue
+        velocity_normal = vel[hit, 0] * nx + vel[hit, 1] * ny
+        vel_x = (vel[hit, 0] - 1 * velocity_normal * nx) * horizontal_bounce_factor
+        vel_y = (vel[hit, 1] - 1 * velocity_normal * ny) * vertical_bounce_factor
+        # Nearly stationary balls get a small boost along the collision normal
+        slow = np.hypot(vel_x, vel_y) < 10
+        vel_x[slow] += nx[slow] * 8
+        vel_y[slow] += ny[slow] * 10
+        vel[hit, 0] = vel_x
+        vel[hit, 1] = vel_y
+        collided[hit] = True
+    return collided
+
+
+def step_balls(pos, vel, radius, rects, player_rects, horizontal_scale, vertical_scale=1, bounciness=-0.8):
+    """Advance balls one step with Ball.update's normal physics (no power shot, kicks or vines).
+
+    Gravity, movement, the ground and wall bounces, then the net rects
+    (bounce factor 1) and the characters' rects, both from rect_array().
+    Returns a mask of the balls that touched the ground this step.
+    """
+    vel[:, 1] += gravity * vertical_scale
+    pos[:, 0] += vel[:, 0] * horizontal_scale
+    pos[:, 1] += vel[:, 1] * vertical_scale
+
+    # Bounce off ground
+    grounded = pos[:, 1] >= GROUND_Y - radius
+    pos[grounded, 1] = GROUND_Y - radius
+    vel[grounded, 1] *= bounciness * vertical_scale
+    vel[grounded, 0] *= 0.99 * horizontal_scale
+
+    # Bounce off walls
+    left = pos[:, 0] <= radius
+    right = ~left & (pos[:, 0] >= WIDTH - radius)
+    pos[left, 0] = radius
+    pos[right, 0] = WIDTH - radius
+    vel[left | right, 0] *= -1 * horizontal_scale
+
+    resolve_balls_obj_collision(pos, vel, radius, rects, 1)
+    resolve_balls_player_collision(pos, vel, radius, player_rects, 0.5, 0.8)
+    return grounded
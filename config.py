@@ -24,4 +24,45 @@ gravity = 0.5
 TOTAL_TIME = 30  # seconds
 
 # Debug settings
-DEBUG_MODE = False  # DISABLED: Set to False to disable collision visualization and debug prints
\ No newline at end of file
+DEBUG_MODE = False  # DISABLED: Set to False to disable collision visualization and debug prints
+
+# Asset cache
+ASSET_CACHE_BUDGET_MB = 96  # Memory budget for cached sprites shared across levels
+
+# Sprite pack built by bake_assets.py (decoded PNGs are used if it is missing)
+SPRITE_PACK_PATH = "build/sprites.pack"
+
+# Cutscene frames pre-scaled by bake_cutscenes.py (videos are decoded with cv2 if missing)
+CUTSCENE_CACHE_DIR = "build/cutscenes"
+
+# Ball rotation atlas (angles are rounded to 360 / steps degrees)
+BALL_ROTATION_STEPS = 72
+
+# Scaled/rotated power-shot flame frames kept between frames
+FLAME_CACHE_BUDGET_MB = 48
+
+# Effect quality: "low", "medium" or "high" (see fire_effect.GROUND_FIRE_QUALITY)
+EFFECT_QUALITY = "medium"
+
+# Blur over the screen while the level 1 bot's ground fire burns (0 = off, 1 = full)
+FIRE_BLUR_STRENGTH = 0.5
+
+# Print where frame time went (post-processing, drawing, flip) when a level ends
+PROFILE_FRAMES = False
+
+# Redraw and present only the screen regions that changed each match frame
+# (falls back to a full flip when they cover DIRTY_RECT_FULL_RATIO of the screen)
+DIRTY_RECT_RENDERING = False
+DIRTY_RECT_FULL_RATIO = 0.5
+
+# Match simulation rate, independent of the render frame rate (FPS). When
+# drawing falls behind, at most MAX_CATCH_UP_STEPS steps run per frame.
+SIMULATION_RATE = 60
+MAX_CATCH_UP_STEPS = 5
+
+# Save each match's seed and per-step key input to INPUT_LOG_DIR, for replay.py
+RECORD_INPUT_LOGS = False
+INPUT_LOG_DIR = "build/replays"
+
+# Multi-ball chaos mode: extra balls that bounce around the arena but never score
+CHAOS_BALLS = 0
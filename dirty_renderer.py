@@ -0,0 +1,114 @@
+import pygame
+
+
+def drop_covered(rects):
+    """rects without duplicates or rects lying entirely inside another one"""
+    kept = []
+    for rect in sorted(rects, key=lambda r: r.width * r.height, reverse=True):
+        if not any(big.contains(rect) for big in kept):
+            kept.append(rect)
+    return kept
+
+
+def mark_dirty(surface, rect):
+    """Record a pygame.draw call's bounding rect when drawing into a TrackedSurface"""
+    if isinstance(surface, TrackedSurface):
+        surface.mark(rect)
+
+
+class TrackedSurface(pygame.Surface):
+    """Back buffer that remembers which regions were drawn this frame.
+
+    blit, blits and fill record the area they touched; pygame.draw calls
+    are recorded through mark_dirty. Each blits() call is one entity (a
+    particle system, a trail) and is recorded as the bounding box of its
+    blits rather than hundreds of tiny rects.
+    """
+
+    def __init__(self, size, flags=0, target=None):
+        super().__init__(size, flags, target)
+        self.dirty = []  # Rects drawn this frame
+        self.previous = None  # Rects drawn last frame; None means everything
+        self.restored = None  # What restore() put back this frame; None means everything
+        self.layer = None  # Static layer the previous frame was drawn on
+
+    def mark(self, rect):
+        rect = pygame.Rect(rect).clip(self.get_rect())
+        if rect.width and rect.height:
+            self.dirty.append(rect)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        rect = super().blit(source, dest, area, special_flags)
+        self.mark(rect)
+        return rect
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = super().blits(blit_sequence, doreturn=True)
+        if rects:
+            self.mark(rects[0].unionall(rects[1:]))
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        rect = super().fill(color, rect, special_flags)
+        self.mark(rect)
+        return rect
+
+    def restore(self, layer):
+        """Put layer back wherever the previous frame drew (all of it if unknown)"""
+        if self.previous is None or layer is not self.layer:
+            super().blit(layer, (0, 0))
+            self.restored = None
+        else:
+            super().blits([(layer, rect, rect) for rect in self.previous], doreturn=False)
+            self.restored = self.previous
+        self.layer = layer
+
+    def end_frame(self):
+        """Regions to present this frame (None for the whole screen)"""
+        drawn, self.dirty = self.dirty, []
+        self.previous = drop_covered(drawn)
+        if self.restored is None:
+            return None
+        return drop_covered(self.restored + drawn)
+
+
+class DirtyRenderer:
+    """Presents only the parts of the screen that changed since the last frame.
+
+    The game draws into surface instead of the display. restore() erases
+    last frame's entities from the static layer, and present() copies the
+    erased and newly drawn regions to the display and updates just those.
+    When they cover full_ratio of the screen or more (fire blur, result
+    overlay, the first frame) a plain full-screen flip is cheaper.
+    """
+
+    def __init__(self, display, full_ratio=0.5):
+        self.display = display
+        self.full_ratio = full_ratio
+        self.surface = TrackedSurface(display.get_size(), 0, display)
+        self.screen_area = display.get_width() * display.get_height()
+        self.frames = 0
+        self.full_frames = 0
+        self.dirty_ratio_total = 0.0
+
+    def present(self):
+        rects = self.surface.end_frame()
+        # Partly overlapping rects are counted twice, which errs towards a full flip
+        ratio = 1.0 if rects is None else min(1.0, sum(r.width * r.height for r in rects) / self.screen_area)
+        self.frames += 1
+        self.dirty_ratio_total += ratio
+
+        if ratio >= self.full_ratio:
+            self.full_frames += 1
+            self.display.blit(self.surface, (0, 0))
+            pygame.display.flip()
+        else:
+            self.display.blits([(self.surface, rect, rect) for rect in rects], doreturn=False)
+            pygame.display.update(rects)
+
+    def average_dirty_ratio(self):
+        return self.dirty_ratio_total / self.frames if self.frames else 0.0
+
+    def report(self):
+        print(f"Dirty rects over {self.frames} frames: {self.average_dirty_ratio():.1%} of the screen"
+              f" redrawn on average, {self.full_frames} full flips")
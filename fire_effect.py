@@ -0,0 +1,117 @@
+import numpy as np
+import pygame
+from config import WIDTH, HEIGHT, EFFECT_QUALITY
+from particles import FireSmokePool, rng
+
+# Ground fire renderer per EFFECT_QUALITY: ("heat", cell size in px) or ("particles", None)
+GROUND_FIRE_QUALITY = {
+    "low": ("heat", 8),
+    "medium": ("heat", 4),
+    "high": ("particles", None),
+}
+
+# Heat -> RGBA control points: white smoke fading out, grey smoke, then flame
+HEAT_PALETTE_POINTS = (
+    # heat   R    G    B    A
+    (0.00, 255, 255, 255, 0),
+    (0.10, 230, 230, 230, 30),
+    (0.30, 130, 130, 130, 170),
+    (0.55, 50, 50, 50, 200),
+    (0.70, 255, 100, 0, 200),
+    (0.85, 255, 150, 50, 220),
+    (1.00, 255, 200, 100, 235),
+)
+
+
+def build_heat_palette(points=HEAT_PALETTE_POINTS, size=256):
+    """Lookup table of RGBA colours for heat levels 0..size-1"""
+    points = np.array(points, np.float32)
+    heat = np.linspace(0, 1, size)
+    channels = [np.interp(heat, points[:, 0], points[:, i]) for i in range(1, 5)]
+    return np.stack(channels, axis=1).astype(np.uint8)
+
+
+class HeatFire:
+    """Ground fire simulated on a low-resolution heat buffer.
+
+    The bottom row is fuelled while the fire burns. Every frame most cells
+    take the heat of a random neighbour below them and cool by a random
+    amount, so heat rises about as fast as the smoke particles did, with a
+    ragged, flickering edge. The buffer is palette-mapped into a small surface and
+    upscaled with one smoothscale, so the cost does not depend on how much
+    fire is on screen.
+    """
+
+    FUEL_FRAMES = 6  # Frames one emit_row keeps the bottom row burning
+    ROW_PX = 3  # Row height in pixels
+    RISE_CHANCE = 0.8  # Chance a cell rises each frame (~2.4 px/frame on average)
+    COOLING = 0.007  # Average heat lost per frame
+
+    def __init__(self, cell_size=4, width=WIDTH, height=HEIGHT):
+        self.cell_width = cell_size
+        self.cols = width // cell_size
+        self.rows = height // self.ROW_PX
+        self.heat = np.zeros((self.cols, self.rows), np.float32)  # surfarray (x, y) layout
+        self.palette = build_heat_palette()
+        # Index grids for the upward shift: row y reads row y + 1, columns wrap
+        self.source_rows = np.arange(1, self.rows)[np.newaxis, :]
+        self.columns = np.arange(self.cols)[:, np.newaxis]
+        self.fuel_frames = 0
+        self.intensity = 0.0
+
+        self.small = pygame.Surface((self.cols, self.rows), pygame.SRCALPHA, 32)
+        self.full = pygame.Surface((self.cols * cell_size, self.rows * self.ROW_PX), pygame.SRCALPHA, 32)
+
+    def clear(self):
+        """Put the fire out"""
+        self.heat[:] = 0
+        self.fuel_frames = 0
+
+    def emit_row(self, per_column, step=5):
+        """Fuel the bottom row; per_column matches FireSmokePool.emit_row (2 is full strength)"""
+        self.intensity = min(1.0, per_column / 2 + 0.5)
+        self.fuel_frames = self.FUEL_FRAMES
+
+    def update(self):
+        heat = self.heat
+        if self.fuel_frames > 0:
+            self.fuel_frames -= 1
+            heat[:, -1] = self.intensity * rng.uniform(0.7, 1.0, self.cols)
+        else:
+            heat[:, -1] *= 0.8
+
+        # Rising cells take the heat of a random neighbour below them, so
+        # flame tongues flicker sideways and the smoke front stays ragged
+        shape = (self.cols, self.rows - 1)
+        drift = rng.integers(-1, 2, shape)
+        rises = rng.random(shape) < self.RISE_CHANCE
+        new_heat = np.where(rises, heat[(self.columns + drift) % self.cols, self.source_rows], heat[:, :-1])
+
+        # Cooling comes in bursts, which breaks the smoke into puffs
+        new_heat -= (rng.random(shape) < 0.25) * (self.COOLING * 4)
+        np.maximum(new_heat, 0, out=heat[:, :-1])
+
+    def draw(self, screen):
+        # Only the rows that still hold heat are palette-mapped and scaled
+        hot_rows = np.flatnonzero(self.heat.max(axis=0) > 0.01)
+        if len(hot_rows) == 0:
+            return
+        top = int(hot_rows[0])
+
+        rgba = self.palette[np.minimum(self.heat[:, top:] * 255, 255).astype(np.uint8)]
+        band = self.small.subsurface((0, top, self.cols, self.rows - top))
+        pygame.surfarray.pixels3d(band)[...] = rgba[..., :3]
+        pygame.surfarray.pixels_alpha(band)[...] = rgba[..., 3]
+
+        y = top * self.ROW_PX
+        target = self.full.subsurface((0, y, self.full.get_width(), self.full.get_height() - y))
+        pygame.transform.smoothscale(band, target.get_size(), target)
+        screen.blit(target, (0, y))
+
+
+def create_ground_fire(quality=EFFECT_QUALITY):
+    """Ground fire renderer for a quality level; both expose emit_row/update/draw/clear"""
+    style, cell_size = GROUND_FIRE_QUALITY[quality]
+    if style == "heat":
+        return HeatFire(cell_size)
+    return FireSmokePool(4096)
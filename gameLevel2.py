@@ -1,255 +1,87 @@
-import time
 import pygame
-from botLevel2 import BotLevel2
 from config import *
-from ball import Ball
-from character import CharacterAnimation
-from arena import Arena
-from power_manager import PowerManager
+from match import Match
+from input_log import KeyboardInput
+from profiler import frame_profiler
+from dirty_renderer import DirtyRenderer
+from timestep import FixedTimestep, InterpolatedPositions
+from surface_pool import surface_pool
+import os
 import sys
-import time
-from sound_manager import play_background_music, play_sound
+from sound_manager import play_background_music
 
-def GameLevel2(screen):
+
+def GameLevel2(screen, replay=None, speed=1):
+    """Play level 2 from the keyboard, or watch an InputReplay of it at speed times real time"""
     # Game elements (create objects)
     play_background_music('level2_background')
     clock = pygame.time.Clock()
-    ball = Ball(2)
-    arena = Arena(level=2)  # IMPORTANT: Set level=2 here!
-    bot = BotLevel2()
-    player = CharacterAnimation()
-    
+    match = Match(2, seed=replay.seed if replay else None)
+    arena = match.arena
+    controls = replay or KeyboardInput()
+    if RECORD_INPUT_LOGS and not replay:
+        os.makedirs(INPUT_LOG_DIR, exist_ok=True)
+        match.record_input(os.path.join(INPUT_LOG_DIR, f"level2-{match.seed}.keys"))
+
     # Debug: Verify level is set correctly
     print(f"DEBUG: Arena level is set to: {arena.level}")
-    
-    # Link ball and arena for tracking who kicked last
-    ball.arena = arena
-    
-    # Create power manager using arena's power bar
-    power_manager = PowerManager(player, ball, arena, bot, arena.player_power_bar)
 
-    # Define edge rectangles for collision detection
-    character_rects = [player, bot]
-    goal_rects = [arena.left_net_rect_side_bar, arena.left_net_rect_top_bar, 
-                  arena.right_net_rect_top_bar, arena.right_net_rect_side_bar]
+    # Optionally draw into a tracked back buffer and present only what changed
+    # (debug overlays are not tracked, so they always get full flips)
+    renderer = DirtyRenderer(screen, DIRTY_RECT_FULL_RATIO) if DIRTY_RECT_RENDERING and not DEBUG_MODE else None
+    canvas = renderer.surface if renderer else screen
 
-    keys_pressed = set()
-    goal_cooldown = False
-    reset_timer = 0
-    RESET_DELAY = 60  # frames to wait after goal before reset
+    # Simulate at a fixed rate; drawing interpolates between the last two steps
+    timestep = FixedTimestep(SIMULATION_RATE * speed, max(1, int(MAX_CATCH_UP_STEPS * speed)))
+    positions = InterpolatedPositions(match.ball, match.player, match.bot)
 
     running = True
     while running:
         for event in pygame.event.get():
             if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                match.save_input_log()  # Keep the log of an abandoned match
                 pygame.quit()
                 sys.exit()
-            elif event.type == pygame.KEYDOWN and not arena.celebrating:
-                keys_pressed.add(event.key)
-                
-                # Handle power shot with 'p' key using power manager
-                if event.key == pygame.K_p and not power_manager.is_power_active:
-                    if power_manager.activate_power():
-                        # Power activated successfully, don't process other animations
-                        continue
-
-                # Handle vine power - Available in Level 2
-                if event.key == pygame.K_v and not power_manager.is_vine_active:
-                    if power_manager.activate_vine():
-                        # Play vine activation sound
-                        play_sound('vine_power')
-                        continue
-
-                # Only process normal animations if not in power mode
-                if not power_manager.is_power_active:
-                    if event.key == pygame.K_k:
-                        player.current_action = "kick"
-                        play_sound('ball_kick')
-                    elif event.key == pygame.K_SPACE and player.is_grounded:
-                        player.current_action = "jump"
-                    elif event.key in CONTROL_KEYS.values():
-                        player.current_action = "run"
-                    player.set_animation(bot)
-
-            elif event.type == pygame.KEYUP and not arena.celebrating:
-                keys_pressed.discard(event.key)
-                # Only change to idle if not in power mode and no keys pressed
-                if not keys_pressed and not power_manager.is_power_active:
-                    player.current_action = "idle"
-                    player.set_animation(bot)
-
-        # Update arena (handles its own celebrations and power bars)
-        arena.update(bot, player, ball)
-        
-        # Handle celebration and reset timing
-        if arena.celebrating:
-            # During celebration, count frames
-            reset_timer += 1
-            
-            # Clear any pressed keys during celebration
-            if keys_pressed:
-                keys_pressed.clear()
-            
-            # Check if celebration duration has passed
-            current_time = time.time()
-            if current_time - arena.celebration_start_time >= arena.celebration_duration_sec:
-                # Start reset phase
-                arena.celebrating = False
-                print("Celebration ended, starting reset phase")
-        elif goal_cooldown and reset_timer > 0:
-            # Post-celebration reset phase
-            reset_timer += 1
-            if reset_timer >= RESET_DELAY:
-                print("Resetting game after goal")
-                
-                # Reset ball using its own reset method
-                ball.reset()  # This will put it back to [WIDTH//2, 100]
-                
-                # Reset players
-                player.reset()
-                bot.is_paused = False
-                bot.reset()
-                arena.player_dead = False
-                
-                # Reset power manager
-                power_manager.reset()
-                
-                # Resume timer and clear cooldown
-                arena.resume_timer()
-                arena.player_power_bar.resume()
-                arena.enemy_power_bar.resume()
-                goal_cooldown = False
-                reset_timer = 0
-                
-                print(f"Ball reset to default sky position: ({ball.pos[0]}, {ball.pos[1]})")
-        else:
-            # Normal game logic (not celebrating)
-            # Update power manager (handles both powers)
-            power_manager.update(keys_pressed)
-            
-            # Update game state for player (normal physics only if not in power mode)
-            if not power_manager.is_power_active:
-                player.update(keys_pressed, bot)
-            
-            # Update game state for bot
-            bot.auto_chase(ball)
-            bot.update()
-            
-            # UPDATED: Check vine collision before updating ball
-            # Now correctly handles a list of vine rectangles
-            vine_rects = power_manager.get_vine_rect()
-            if vine_rects:
-                # Debug: Print the vine rects before passing to ball
-                ball.check_vine_collision(vine_rects)
-            
-            # Update game state for ball
-            if arena.player_dead:
-                dead_ball = ball.update(goal_rects, character_rects, bot, bot)  # Pass bot for both player and bot
             else:
-                dead_ball = ball.update(goal_rects, character_rects, player, bot)
+                controls.handle_event(event)
 
-
-            # Update scoreboard
-            ball_rect = ball.get_rect()
-            
-            # Check if ball is in goal area
-            in_goal_area = (arena.left_net_rect_goal_area.colliderect(ball_rect) or 
-                           arena.right_net_rect_goal_area.colliderect(ball_rect))
-            
-            # Clear goal cooldown if ball leaves goal areas
-            if not in_goal_area and not goal_cooldown:
-                goal_cooldown = False
-            
-            # Check for goal scored ONLY if not in cooldown
-            if not goal_cooldown:
-                goal_scored = arena.update_score(ball_rect)
-                
-                # When something happened in goal area (score or own goal attempt)
-                if goal_scored:
-                    print("Goal detected, starting celebration/reset sequence")
-                    goal_cooldown = True
-                    reset_timer = 1  # Start counting for reset
-                    
-                    # Turn off special effects immediately
-                    ball.special_effect_active = False
-                    ball.previous_positions = []
-                    ball.particles = []
-                    
-                    # End power mode if active
-                    if power_manager.is_power_active:
-                        power_manager._end_power_mode()
-                    
-                    # Force bot to be visible and in a consistent position
-                    # IMPORTANT: This is critical for maintaining visibility during celebration
-                    bot.is_paused = False
-                    bot.position_x = 570  # Fixed position X
-                    bot.position_y = GROUND_Y - 150  # Place slightly higher to ensure visibility
-                    bot.jump_height = 0  # Reset any jumping
-                    bot.is_jumping = False
-                    bot.is_grounded = True
-                    bot.current_action = "idle"
-                    bot.current_animation = bot.idle_animation
-                    bot.frame_index = 0
-                    bot.is_flipped = True
-                    
-                    # Update rectangle
-                    bot.rect.x = bot.position_x
-                    bot.rect.y = bot.position_y - bot.jump_height + 50
-                    
-                    # Print bot position for debugging
-                    print(f"After goal, bot positioned at: ({bot.position_x}, {bot.position_y})")
-                    
-                    # Pause timer for celebrations only
-                    if arena.celebrating:
-                        arena.pause_timer()
-                        arena.player_power_bar.pause()
-                        arena.enemy_power_bar.pause()
-                    else:
-                        # For own goals, skip celebration and go straight to reset
-                        print("Own goal detected, preparing immediate reset")
-                        arena.pause_timer()  # Still pause timer briefly
-                        play_sound('whistle')
-                        arena.player_power_bar.pause()
-                        arena.enemy_power_bar.pause()
-                    
-                    # Clear keys
-                    keys_pressed.clear()
-            
-            # Handle dead ball
-            if dead_ball and not arena.celebrating and not goal_cooldown:
-                print("Dead ball detected, resetting")
-                
-                # Reset ball using its own reset method
-                ball.reset()  # This will put it back to [WIDTH//2, 100]
-                
-                # Reset players
-                player.reset()
-                if bot.is_paused:
-                    bot.resume()
-                bot.reset()
-                arena.player_dead = False
-                
-                # Reset powers
-                power_manager.reset()
+        # Run the simulation steps due for the real time since the last frame
+        for _ in range(timestep.advance()):
+            if match.finished:
+                break  # No steps past the final whistle
+            positions.snapshot()
+            match.apply_input(*controls.next_input(match))
+            match.step()
 
         # Draw game elements
-        if not arena.player_dead:
-            arena.draw(screen, ball, player, bot)
-        else:
-            arena.draw(screen, ball, None, bot)
-        
-        # Draw power effects
-        power_manager.draw_power_effects(screen)
-        
+        with frame_profiler.section("arena draw"), positions.blended(timestep.alpha()):
+            match.draw(canvas)
+
         # Update display ONCE per frame
-        pygame.display.flip()
+        with frame_profiler.section("display flip"):
+            if renderer:
+                renderer.present()
+            else:
+                pygame.display.flip()
+        frame_profiler.end_frame()
         clock.tick(FPS)
         
         # Check if game should end
-        if arena.time_out:
+        if match.finished:
+            pygame.time.wait(100)  # Hold the result on screen for a moment
             print("Level 2 Game Over!")
-            running = False
+            break
       
+    if PROFILE_FRAMES:
+        frame_profiler.report()
+        surface_pool.report(frame_profiler.frames)
+        frame_profiler.reset()
+        surface_pool.reset_counters()
+        if renderer:
+            renderer.report()
+
+    match.save_input_log()
+
     # Check if player has won
     if arena.win is True:
         print("Player wins Level 2!")
@@ -0,0 +1,60 @@
+import pygame
+
+# Events after which the window contents must be drawn again
+REPAINT_EVENTS = {pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN}
+
+
+class IdleScreen:
+    """Event loop for menus and dialogue screens that are static most of the time.
+
+    Instead of redrawing every frame, the screen blocks in pygame.event.wait
+    until input arrives or the next timed wakeup (wakeup_ms apart) is due,
+    and redraws only when the state it shows has changed. Without wakeup_ms
+    it sleeps until there is input.
+    """
+
+    def __init__(self, wakeup_ms=None, max_catch_up=5):
+        self.wakeup_ms = wakeup_ms
+        self.max_catch_up = max_catch_up
+        self.next_wakeup = None
+        self.drawn_state = None
+        self.repaint = True  # Nothing drawn yet
+        self.wakeups = 0
+        self.redraws = 0
+
+    def wait(self):
+        """Block until there is input or a wakeup is due, and return the pending events"""
+        if self.wakeup_ms is None:
+            first = pygame.event.wait()
+        else:
+            now = pygame.time.get_ticks()
+            if self.next_wakeup is None:
+                self.next_wakeup = now + self.wakeup_ms
+            # A timeout of 0 would wait forever
+            first = pygame.event.wait(max(1, self.next_wakeup - now))
+        events = [] if first.type == pygame.NOEVENT else [first]
+        events += pygame.event.get()
+        self.wakeups += 1
+        if any(event.type in REPAINT_EVENTS for event in events):
+            self.repaint = True
+        return events
+
+    def due_wakeups(self):
+        """Wakeup periods that elapsed since the last call (for frame-counted animations)"""
+        if self.wakeup_ms is None or self.next_wakeup is None:
+            return 0
+        now = pygame.time.get_ticks()
+        if now < self.next_wakeup:
+            return 0
+        due = 1 + (now - self.next_wakeup) // self.wakeup_ms
+        self.next_wakeup += due * self.wakeup_ms
+        return min(due, self.max_catch_up)
+
+    def needs_redraw(self, state=None):
+        """True when state differs from what is on screen; the caller then draws and flips"""
+        if self.repaint or state != self.drawn_state:
+            self.repaint = False
+            self.drawn_state = state
+            self.redraws += 1
+            return True
+        return False
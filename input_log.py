@@ -0,0 +1,177 @@
+"""Match input, sampled once per simulation step, and a compact binary log of it.
+
+A match sees its keyboard as two bitmasks over INPUT_KEYS per step: the
+keys held down and the keys pressed since the previous step. Live play
+(KeyboardInput), scripted players (ScriptedInput) and replays (InputReplay)
+all feed Match.apply_input the same way, so replaying a recorded log with
+the match's seed reproduces the match exactly.
+
+Log layout (written by InputRecorder):
+    header: magic, format version, level, simulation rate | varint seed
+    records: varint steps since the previous record | varint key masks
+Only steps whose input changed get a record; the masks are packed as
+held | pressed << len(INPUT_KEYS).
+"""
+import struct
+import pygame
+from config import CONTROL_KEYS, SIMULATION_RATE
+
+LOG_MAGIC = b"ORBKEYS\0"
+LOG_VERSION = 1
+LOG_HEADER = struct.Struct("<8sHBH")  # magic, version, level, simulation rate
+
+# Keys a match reacts to; a key's bit is its index here
+INPUT_KEYS = (CONTROL_KEYS["left"], CONTROL_KEYS["right"], CONTROL_KEYS["jump"],
+              pygame.K_k, pygame.K_p, pygame.K_v)
+KEY_BITS = {key: 1 << i for i, key in enumerate(INPUT_KEYS)}
+
+
+def key_mask(keys):
+    """Bitmask of the INPUT_KEYS among keys"""
+    mask = 0
+    for key in keys:
+        mask |= KEY_BITS.get(key, 0)
+    return mask
+
+
+def mask_keys(mask):
+    """INPUT_KEYS in mask, in bit order"""
+    return [key for i, key in enumerate(INPUT_KEYS) if mask >> i & 1]
+
+
+def write_varint(out, value):
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    """(value, position after it)"""
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class KeyboardInput:
+    """Keys from pygame events, handed to the match one step at a time"""
+
+    def __init__(self):
+        self.held = 0
+        self.pressed = 0  # Pressed since the last step
+
+    def handle_event(self, event):
+        bit = KEY_BITS.get(getattr(event, "key", None), 0)
+        if event.type == pygame.KEYDOWN:
+            self.held |= bit
+            self.pressed |= bit
+        elif event.type == pygame.KEYUP:
+            self.held &= ~bit
+
+    def next_input(self, match):
+        pressed, self.pressed = self.pressed, 0
+        return self.held, pressed
+
+
+class ScriptedInput:
+    """Held-key sets for each step, from a sequence (no keys once it runs out) or a function of (step, match)"""
+
+    def __init__(self, inputs):
+        self.script = inputs if callable(inputs) else iter(inputs)
+        self.step = 0
+        self.held = 0
+
+    def handle_event(self, event):
+        pass
+
+    def next_input(self, match):
+        if callable(self.script):
+            keys = self.script(self.step, match)
+        else:
+            keys = next(self.script, ())
+        self.step += 1
+        held = key_mask(keys)
+        pressed = held & ~self.held
+        self.held = held
+        return held, pressed
+
+
+class InputRecorder:
+    """Writes the input of one match to a log as it is applied.
+
+    Each record is flushed to the file as soon as it is made, so a match
+    that crashes or is killed still leaves a log of everything up to then.
+    """
+
+    def __init__(self, path, level, seed, rate):
+        self.path = path
+        self.file = open(path, "wb")
+        header = bytearray(LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, level, rate))
+        write_varint(header, seed)
+        self._write(header)
+        self.last_step = 0
+        self.held = 0
+
+    def _write(self, data):
+        self.file.write(data)
+        self.file.flush()
+
+    def record(self, step, held, pressed):
+        if held == self.held and not pressed:
+            return
+        data = bytearray()
+        write_varint(data, step - self.last_step)
+        write_varint(data, held | pressed << len(INPUT_KEYS))
+        self._write(data)
+        self.last_step = step
+        self.held = held
+
+    def close(self):
+        size = self.file.tell()
+        self.file.close()
+        print(f"Input log saved to {self.path} ({size} bytes)")
+
+
+class InputReplay:
+    """Feeds a recorded log back to a match, ignoring the keyboard"""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.level, self.rate = LOG_HEADER.unpack_from(data)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            raise ValueError(f"{path} is not a version {LOG_VERSION} input log")
+        if self.rate != SIMULATION_RATE:
+            raise ValueError(f"{path} was recorded at {self.rate} steps/s, the game runs at {SIMULATION_RATE}")
+        self.seed, pos = read_varint(data, LOG_HEADER.size)
+
+        self.records = []  # (step, held, pressed)
+        step = 0
+        width = len(INPUT_KEYS)
+        while pos < len(data):
+            try:
+                delta, pos = read_varint(data, pos)
+                masks, pos = read_varint(data, pos)
+            except IndexError:
+                break  # Cut off mid-record: the match crashed or was killed while recording
+            step += delta
+            self.records.append((step, masks & (1 << width) - 1, masks >> width))
+        self.next_record = 0
+        self.step = 0
+        self.held = 0
+
+    def handle_event(self, event):
+        pass
+
+    def next_input(self, match):
+        pressed = 0
+        if self.next_record < len(self.records) and self.records[self.next_record][0] == self.step:
+            _, self.held, pressed = self.records[self.next_record]
+            self.next_record += 1
+        self.step += 1
+        return self.held, pressed
@@ -1,28 +1,50 @@
-import pygame
 import sys
-import pygame.mixer
-from story import *
+from profiler import StartupTrace, FrameProfiler
 
-import arena
-from config import *
-from gameLevel1 import GameLevel1
-from gameLevel2 import GameLevel2
-from menu import Menu  # Import the Menu class
-from sound_manager import initialize_sounds, play_sound
+# python main.py --startup-trace prints where cold start time goes
+startup_trace = StartupTrace(enabled="--startup-trace" in sys.argv)
+
+with startup_trace.phase("import pygame"):
+    import pygame
+    import pygame.mixer
+with startup_trace.phase("import story"):
+    from story import *
+with startup_trace.phase("import levels"):
+    import arena
+    from config import *
+    from gameLevel1 import GameLevel1
+    from gameLevel2 import GameLevel2
+with startup_trace.phase("import menu/sound"):
+    from menu import Menu  # Import the Menu class
+    from sound_manager import initialize_sounds, play_sound
+    from asset_manager import preload_group, load_image
+    from text_cache import get_font, render_text
+    from idle_screen import IdleScreen
+
+# Full-screen backgrounds of the result and transition screens, in the
+# "screens" asset group so they are decoded before the screens open
+SCREEN_BACKGROUNDS = {
+    "level complete": "images/background/complate_level_background.png",
+    "win": "images/background/complate_level_background.png",
+    "level 2 transition": "images/background/fire_animatiaon.gif",
+}
 
 
 class MainGame:
     def __init__(self):
         # Initialize Pygame
-        pygame.init()
-        pygame.mixer.init()
+        with startup_trace.phase("pygame.init"):
+            pygame.init()
+            pygame.mixer.init()
 
         # Initialize sounds
-        initialize_sounds()
+        with startup_trace.phase("initialize_sounds"):
+            initialize_sounds()
         
         # Screen setup
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
-        pygame.display.set_caption("Legends of OrbArena")
+        with startup_trace.phase("display.set_mode"):
+            self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
+            pygame.display.set_caption("Legends of OrbArena")
         
         # Game state
         self.running = True
@@ -31,7 +53,13 @@ class MainGame:
         self.max_levels = 2  # Currently have 2 levels
         
         # Create menu instance
-        self.menu = Menu(self.screen)
+        with startup_trace.phase("Menu.__init__"):
+            self.menu = Menu(self.screen)
+
+        # Decode the result/transition backgrounds while the menu and intro run
+        preload_group("screens")
+        self.screen_profiler = FrameProfiler()  # Asset load vs draw time per screen
+        self.start_zoom_frames = None  # "Start!" pre-scaled once per zoom step
         
     # In MainGame class in main.py
     def show_main_menu(self):
@@ -40,6 +68,11 @@ class MainGame:
         
         # Play menu sound
         play_sound('menu_sound', loop=True)
+
+        if startup_trace.enabled and not startup_trace.reported:
+            with startup_trace.phase("first menu frame"):
+                self.menu.draw()
+            startup_trace.report()
         
         self.menu.running = True
         self.menu.run()
@@ -53,14 +86,14 @@ class MainGame:
     def show_ready_start_transition(self):
         """Show 'Ready?' and 'Start!' captions before starting gameplay"""
         clock = pygame.time.Clock()
-        font = pygame.font.SysFont(None, 120)  # Large font for visibility
+        font = get_font(120)  # Large font for visibility
         
         # Create a black background instead of capturing the current screen
         background = pygame.Surface((WIDTH, HEIGHT))
         background.fill((0, 0, 0))  # Fill with black
         
         # First show "Ready?" caption
-        ready_text = font.render("Ready?", True, (255, 255, 255))
+        ready_text = render_text(font, "Ready?", (255, 255, 255))
         ready_rect = ready_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
         
         # Fade in "Ready?" text
@@ -68,14 +101,8 @@ class MainGame:
             # Use black background
             self.screen.blit(background, (0, 0))
             
-            # Create a transparent surface for the text
-            text_surface = pygame.Surface((ready_rect.width, ready_rect.height), pygame.SRCALPHA)
-            ready_text_copy = ready_text.copy()
-            ready_text_copy.set_alpha(alpha)
-            text_surface.blit(ready_text_copy, (0, 0))
-            
-            # Overlay the text
-            self.screen.blit(text_surface, ready_rect)
+            # Overlay the cached, faded text
+            self.screen.blit(render_text(font, "Ready?", (255, 255, 255), alpha), ready_rect)
             pygame.display.flip()
             clock.tick(60)
         
@@ -87,34 +114,28 @@ class MainGame:
             # Use black background
             self.screen.blit(background, (0, 0))
             
-            # Create a transparent surface for the text
-            text_surface = pygame.Surface((ready_rect.width, ready_rect.height), pygame.SRCALPHA)
-            ready_text_copy = ready_text.copy()
-            ready_text_copy.set_alpha(alpha)
-            text_surface.blit(ready_text_copy, (0, 0))
-            
-            # Overlay the text
-            self.screen.blit(text_surface, ready_rect)
+            # Overlay the cached, faded text
+            self.screen.blit(render_text(font, "Ready?", (255, 255, 255), alpha), ready_rect)
             pygame.display.flip()
             clock.tick(60)
         
         # Short pause
         pygame.time.delay(500)
         
-        # Now show "Start!" caption
-        start_text = font.render("Start!", True, (255, 255, 0))  # Yellow color for emphasis
-        start_rect = start_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        # Now show "Start!" caption, with a slight zoom effect
+        if self.start_zoom_frames is None:
+            start_text = render_text(font, "Start!", (255, 255, 0))  # Yellow color for emphasis
+            width, height = start_text.get_size()
+            self.start_zoom_frames = []
+            for i in range(60):
+                scale = 0.5 + (i / 60) * 0.5  # Scale from 0.5 to 1.0
+                self.start_zoom_frames.append(
+                    pygame.transform.scale(start_text, (int(width * scale), int(height * scale))))
         
-        # Fade in "Start!" text with a slight zoom effect
-        for i in range(60):
+        for scaled_text in self.start_zoom_frames:
             # Use black background
             self.screen.blit(background, (0, 0))
             
-            scale = 0.5 + (i / 60) * 0.5  # Scale from 0.5 to 1.0
-            scaled_text = pygame.transform.scale(
-                start_text, 
-                (int(start_rect.width * scale), int(start_rect.height * scale))
-            )
             scaled_rect = scaled_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
             
             # Overlay the scaled text
@@ -123,66 +144,75 @@ class MainGame:
             clock.tick(60)
         
     
-    def show_level_complete(self, level_num):
-        """Display a level complete screen before moving to next level"""
-        clock = pygame.time.Clock()
-        font = pygame.font.SysFont(None, 100)
-        small_font = pygame.font.SysFont(None, 50)
-
-        try:
-            # Try loading the background image
-            complete_bg = pygame.image.load("images/background/complate_level_background.png").convert()
-            complete_bg = pygame.transform.scale(complete_bg, (WIDTH, HEIGHT))
-        except pygame.error as e:
-            print(f"Error loading background image: {e}")
-            complete_bg = None
+    def load_screen_background(self, screen_name):
+        """Preloaded, display-converted background for a result/transition screen"""
+        with self.screen_profiler.section(f"{screen_name}: assets"):
+            try:
+                return load_image(SCREEN_BACKGROUNDS[screen_name], (WIDTH, HEIGHT), alpha=False)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Error loading {screen_name} background: {e}")
+                return None
 
-        complete_bg = pygame.image.load("images/background/complate_level_background.png")
-        complete_bg = pygame.transform.scale(complete_bg, (WIDTH, HEIGHT))
+    def report_screen_profile(self):
+        if PROFILE_FRAMES:
+            self.screen_profiler.report()
+            self.screen_profiler.reset()
 
+    def show_level_complete(self, level_num):
+        """Display a level complete screen before moving to next level"""
+        complete_bg = self.load_screen_background("level complete")
         
         # Play a victory sound
         play_sound('win')  # Use an existing sound for level complete
         
         waiting = True
-        wait_timer = 0
-        max_wait_time = 3 * FPS  # Auto-continue after 3 seconds
+        blinks = 0
+        max_blinks = 12  # Auto-continue after 3 seconds
+
+        # Only the prompt changes, so sleep until input or the next blink
+        idle = IdleScreen(wakeup_ms=250)
         
-        while waiting and self.running and wait_timer < max_wait_time:
-            for event in pygame.event.get():
+        while waiting and self.running and blinks < max_blinks:
+            if idle.needs_redraw(blinks % 2):
+                with self.screen_profiler.section("level complete: draw"):
+                    self.draw_level_complete(level_num, complete_bg, show_prompt=blinks % 2)
+                pygame.display.flip()
+                self.screen_profiler.end_frame()
+
+            for event in idle.wait():
                 if event.type == pygame.QUIT:
                     self.running = False
                     waiting = False
                 elif event.type == pygame.KEYDOWN:
                     waiting = False  # Any key press skips the screen
-            
-            # Draw level complete screen
-            if complete_bg:
-                self.screen.blit(complete_bg, (0, 0))  # Draw background first
-            else:
-                self.screen.fill((0, 0, 0)) 
-            
-            # Level complete text
-            text = font.render(f"Level {level_num} Complete!", True, (0, 255, 0))
-            text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 3))
-            self.screen.blit(text, text_rect)
-            
-            # Show next level text
-            next_level_text = small_font.render(f"Get Ready for Level {level_num + 1}", True, (255, 255, 255))
-            next_level_rect = next_level_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-            self.screen.blit(next_level_text, next_level_rect)
-            
-            # Continue prompt
-            continue_text = small_font.render("Press any key to continue", True, (255, 255, 255))
+            blinks += idle.due_wakeups()
+
+        self.report_screen_profile()
+
+    def draw_level_complete(self, level_num, complete_bg, show_prompt):
+        font = get_font(100)
+        small_font = get_font(50)
+
+        if complete_bg:
+            self.screen.blit(complete_bg, (0, 0))  # Draw background first
+        else:
+            self.screen.fill((0, 0, 0)) 
+        
+        # Level complete text
+        text = render_text(font, f"Level {level_num} Complete!", (0, 255, 0))
+        text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 3))
+        self.screen.blit(text, text_rect)
+        
+        # Show next level text
+        next_level_text = render_text(small_font, f"Get Ready for Level {level_num + 1}", (255, 255, 255))
+        next_level_rect = next_level_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+        self.screen.blit(next_level_text, next_level_rect)
+        
+        # Continue prompt, blinking for visibility
+        if show_prompt:
+            continue_text = render_text(small_font, "Press any key to continue", (255, 255, 255))
             continue_rect = continue_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 100))
-            
-            # Make text pulse for visibility
-            if (wait_timer // 15) % 2:  # Pulse every 15 frames
-                self.screen.blit(continue_text, continue_rect)
-            
-            pygame.display.flip()
-            clock.tick(FPS)
-            wait_timer += 1
+            self.screen.blit(continue_text, continue_rect)
     
     def show_game_over(self, win):
         """Display game over screen - now using the Menu class for retry"""
@@ -200,14 +230,22 @@ class MainGame:
         # Play menu sound for win screen
         from sound_manager import play_sound, stop_sound
         play_sound('win')
+        stop_sound('background')
         
-        clock = pygame.time.Clock()
-        font = pygame.font.SysFont(None, 100)
-        small_font = pygame.font.SysFont(None, 50)
+        win_bg = self.load_screen_background("win")
+
+        # Nothing moves on this screen: draw it once and sleep until input
+        idle = IdleScreen()
         
         waiting = True
         while waiting and self.running:
-            for event in pygame.event.get():
+            if idle.needs_redraw():
+                with self.screen_profiler.section("win: draw"):
+                    self.draw_win_screen(win_bg)
+                pygame.display.flip()
+                self.screen_profiler.end_frame()
+
+            for event in idle.wait():
                 if event.type == pygame.QUIT:
                     stop_sound('menu_sound')  # Stop sound when quitting
                     self.running = False
@@ -221,29 +259,23 @@ class MainGame:
                         stop_sound('menu_sound')  # Stop sound when M is pressed
                         self.current_state = "MENU"
                         waiting = False
+
+        self.report_screen_profile()
+
+    def draw_win_screen(self, win_bg):
+        if win_bg:
+            self.screen.blit(win_bg, (0, 0))
+        else:
+            self.screen.fill((0, 0, 0))
         
-            # Draw win screen
-            try:
-                win_bg = pygame.image.load("images/background/complate_level_background.png").convert()
-                win_bg = pygame.transform.scale(win_bg, (WIDTH, HEIGHT))
-                self.screen.blit(win_bg, (0, 0))
-            except pygame.error as e:
-                print(f"Error loading win background: {e}")
-                self.screen.fill((0, 0, 0))
-            
-            # Result text
-            text = font.render("To Be Continued", True, (255, 215, 0))
-            text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 3))
-            self.screen.blit(text, text_rect)
-            
-            menu_text = small_font.render("Press M for Main Menu", True, (255, 255, 255))
-            menu_rect = menu_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 60))
-            self.screen.blit(menu_text, menu_rect)
-            stop_sound('background')
-            
-            
-            pygame.display.flip()
-            clock.tick(FPS)
+        # Result text
+        text = render_text(get_font(100), "To Be Continued", (255, 215, 0))
+        text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 3))
+        self.screen.blit(text, text_rect)
+        
+        menu_text = render_text(get_font(50), "Press M for Main Menu", (255, 255, 255))
+        menu_rect = menu_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 60))
+        self.screen.blit(menu_text, menu_rect)
     
     def play_level(self):
         """Play the current level with progression"""
@@ -311,11 +343,12 @@ class MainGame:
         
     def level_2_transition(self):
         """Transition to level 2"""
+        # No-op if level 1 already started it; otherwise warm level 2 during the cutscenes
+        preload_group("level2")
         # Load the transition background
-        transition_bg = pygame.image.load("images/background/fire_animatiaon.gif")
-        transition_bg = pygame.transform.scale(transition_bg, (WIDTH, HEIGHT))
+        transition_bg = self.load_screen_background("level 2 transition")
         # play the shake
-        screen_shake_effect(self.screen, transition_bg)
+        screen_shake_effect(self.screen, transition_bg, profiler=self.screen_profiler)
         pygame.mixer.init()
         pygame.mixer.music.load("TransitionLv1Lv2/goingToCastle.mp3")  # replace with your path
         pygame.mixer.music.play()
@@ -331,6 +364,7 @@ class MainGame:
         throne_room_dialogue(self.screen)
         
         self.show_ready_start_transition()
+        self.report_screen_profile()
         
         self.current_state = "PLAYING"
         
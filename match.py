@@ -0,0 +1,433 @@
+import os
+import random
+import sys
+from contextlib import redirect_stdout
+import numpy as np
+import pygame
+from config import *
+from ball import Ball
+from ball_swarm import BallSwarm
+from character import CharacterAnimation
+from arena import Arena
+from botLevel1 import BotLevel1
+from botLevel2 import BotLevel2
+from power_manager import PowerManager
+import particles
+from timestep import match_clock
+from input_log import INPUT_KEYS, InputRecorder, InputReplay, ScriptedInput, mask_keys
+from sound_manager import play_sound
+
+RESET_DELAY = 60  # frames to wait after goal before reset
+
+
+class MatchRandom:
+    """The random streams of one match, all derived from a single match seed.
+
+    gameplay decides anything that changes the match state (the enemy's
+    power choice, vine sizes, bounces off vines) and is handed to the
+    objects that use it. The cosmetic stream behind every particle effect
+    (particles.rng) is restarted from its own branch of the seed, so how
+    many sparks are spawned or drawn never shifts the gameplay sequence.
+    Without a seed one is picked at random; seed records it either way.
+    """
+
+    def __init__(self, seed=None):
+        sequence = np.random.SeedSequence(seed)
+        self.seed = sequence.entropy
+        gameplay, cosmetic = sequence.spawn(2)
+        self.gameplay = random.Random(int.from_bytes(gameplay.generate_state(4).tobytes(), "little"))
+        self.cosmetic = cosmetic
+
+    def reseed_effects(self):
+        particles.reseed(self.cosmetic)
+
+
+class Match:
+    """The objects of one level 1 or level 2 match and the rules that advance it.
+
+    GameLevel1/GameLevel2 call apply_input() and step() at the simulation
+    rate and draw it; simulate_match() runs it with no window.
+    effects=False skips the cosmetic particle effects, which are never drawn
+    headless. The same seed and the same key presses at the same steps give
+    the same match, bit for bit.
+    """
+
+    def __init__(self, level, effects=True, seed=None):
+        match_clock.reset()  # Arena and power bar timers start from here
+        self.random = MatchRandom(seed)
+        self.random.reseed_effects()
+        self.seed = self.random.seed
+        gameplay_rng = self.random.gameplay
+
+        self.level = level
+        self.ball = Ball(level, gameplay_rng)
+        self.arena = Arena(level=level, gameplay_rng=gameplay_rng)
+        self.bot = BotLevel1() if level == 1 else BotLevel2()
+        self.player = CharacterAnimation()
+        self.ball.effects = self.bot.effects = effects
+        # Chaos balls are only for show, so a headless match skips them
+        self.swarm = BallSwarm(CHAOS_BALLS, self.ball.HORIZONTAL_FORCE_SCALE) if CHAOS_BALLS and effects else None
+
+        # Link ball and arena for tracking who kicked last
+        self.ball.arena = self.arena
+
+        # Create power manager using arena's power bar
+        self.power_manager = PowerManager(self.player, self.ball, self.arena, self.bot,
+                                          self.arena.player_power_bar, gameplay_rng)
+
+        # Define edge rectangles for collision detection
+        arena = self.arena
+        self.character_rects = [self.player, self.bot]
+        self.goal_rects = [arena.left_net_rect_side_bar, arena.left_net_rect_top_bar,
+                           arena.right_net_rect_top_bar, arena.right_net_rect_side_bar]
+
+        self.keys_pressed = set()
+        self.goal_cooldown = False
+        self.reset_timer = 0
+        self.held_mask = 0  # Keys held at the last apply_input
+        self.recorder = None
+
+    def record_input(self, path):
+        """Log the input of every step, to be saved to path by save_input_log()"""
+        self.recorder = InputRecorder(path, self.level, self.seed, match_clock.rate)
+
+    def save_input_log(self):
+        """Close the input log, if recording; safe to call more than once"""
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+
+    @property
+    def finished(self):
+        return self.arena.time_out
+
+    @property
+    def fire_burning(self):
+        return self.level == 1 and self.bot.start_fire
+
+    def apply_input(self, held, pressed):
+        """Input for the next step, as masks of the held keys and the keys pressed since the last step.
+
+        Keys go up before keys go down, each in INPUT_KEYS order, so a
+        recorded match replays exactly.
+        """
+        if held == self.held_mask and not pressed:
+            return  # Most steps: nothing changed
+        if self.recorder:
+            self.recorder.record(match_clock.steps, held, pressed)
+        # A key pressed again since the last step was released in between
+        for key in mask_keys(self.held_mask & (~held | pressed)):
+            self.key_up(key)
+        for key in mask_keys(pressed):
+            self.key_down(key)
+        # Tapped and let go between two steps
+        for key in mask_keys(pressed & ~held):
+            self.key_up(key)
+        self.held_mask = held
+
+    def key_down(self, key):
+        if self.arena.celebrating:
+            return
+        player, bot, power_manager = self.player, self.bot, self.power_manager
+        self.keys_pressed.add(key)
+
+        # Handle power shot with 'p' key using power manager
+        if key == pygame.K_p and not power_manager.is_power_active:
+            if power_manager.activate_power():
+                # Power activated successfully, don't process other animations
+                return
+
+        # Handle vine power - Available in Level 2
+        if self.level == 2 and key == pygame.K_v and not power_manager.is_vine_active:
+            if power_manager.activate_vine():
+                # Play vine activation sound
+                play_sound('vine_power')
+                return
+
+        # Only process normal animations if not in power mode
+        if not power_manager.is_power_active and not self.fire_burning:
+            if key == pygame.K_k:
+                player.current_action = "kick"
+                play_sound('ball_kick')
+            elif key == pygame.K_SPACE and player.is_grounded:
+                player.current_action = "jump"
+            elif key in CONTROL_KEYS.values():
+                player.current_action = "run"
+            player.set_animation(bot)
+
+    def key_up(self, key):
+        if self.arena.celebrating:
+            return
+        self.keys_pressed.discard(key)
+        # Only change to idle if not in power mode and no keys pressed
+        if not self.keys_pressed and not self.power_manager.is_power_active:
+            self.player.current_action = "idle"
+            self.player.set_animation(self.bot)
+
+    def step(self):
+        """Advance the match by one simulation step"""
+        ball, arena, bot, player = self.ball, self.arena, self.bot, self.player
+        power_manager, keys_pressed = self.power_manager, self.keys_pressed
+        match_clock.advance()
+
+        # Update arena (handles its own celebrations, power bars and the game clock)
+        arena.update(bot, player, ball)
+
+        # Handle celebration and reset timing
+        if arena.celebrating:
+            # During celebration, count frames
+            self.reset_timer += 1
+
+            # Clear any pressed keys during celebration
+            if keys_pressed:
+                keys_pressed.clear()
+
+            # Check if celebration duration has passed
+            current_time = match_clock.time()
+            if current_time - arena.celebration_start_time >= arena.celebration_duration_sec:
+                # Start reset phase
+                arena.celebrating = False
+                print("Celebration ended, starting reset phase")
+        elif self.goal_cooldown and self.reset_timer > 0:
+            # Post-celebration reset phase
+            self.reset_timer += 1
+            if self.reset_timer >= RESET_DELAY:
+                print("Resetting game after goal")
+
+                # Reset ball using its own reset method
+                ball.reset()  # This will put it back to [WIDTH//2, 100]
+
+                # Reset players
+                player.reset()
+                bot.is_paused = False
+                bot.reset()
+                arena.player_dead = False
+
+                # Reset power manager
+                power_manager.reset()
+
+                # Resume timer and clear cooldown
+                arena.resume_timer()
+                arena.player_power_bar.resume()
+                arena.enemy_power_bar.resume()
+                self.goal_cooldown = False
+                self.reset_timer = 0
+
+                print(f"Ball reset to default sky position: ({ball.pos[0]}, {ball.pos[1]})")
+        else:
+            self._play(ball, arena, bot, player, power_manager, keys_pressed)
+
+        if self.level == 1:
+            # The bot's ground fire and power kick sparks advance with the simulation
+            bot.update_ground_fire(player)
+            bot.update_power_kick(ball)
+
+            if player.power_kick_hit:
+                if player.current_action != "hurt":
+                    player.current_action = "hurt"
+                    player.set_animation(bot)
+                player.update(keys_pressed, bot)
+
+    def _play(self, ball, arena, bot, player, power_manager, keys_pressed):
+        """Normal game logic (not celebrating or resetting after a goal)"""
+        # Update power manager (handles both powers)
+        power_manager.update(keys_pressed)
+
+        # Update game state for player (normal physics only if not in power mode)
+        if not power_manager.is_power_active:
+            player.update(keys_pressed, bot)
+
+        # Update game state for bot
+        bot.auto_chase(ball)
+        bot.update()
+
+        # Check vine collision before updating ball (a list of vine rectangles)
+        vine_rects = power_manager.get_vine_rect()
+        if vine_rects:
+            ball.check_vine_collision(vine_rects)
+
+        # Update game state for ball
+        if arena.player_dead:
+            dead_ball = ball.update(self.goal_rects, self.character_rects, bot, bot)  # Pass bot for both player and bot
+        else:
+            dead_ball = ball.update(self.goal_rects, self.character_rects, player, bot)
+        if self.swarm:
+            self.swarm.update(self.goal_rects, self.character_rects)
+
+        # Update scoreboard
+        ball_rect = ball.get_rect()
+
+        # Check for goal scored ONLY if not in cooldown
+        if not self.goal_cooldown:
+            goal_scored = arena.update_score(ball_rect)
+
+            # When something happened in goal area (score or own goal attempt)
+            if goal_scored:
+                print("Goal detected, starting celebration/reset sequence")
+                self.goal_cooldown = True
+                self.reset_timer = 1  # Start counting for reset
+
+                # Turn off special effects immediately
+                ball.special_effect_active = False
+                ball.previous_positions = []
+                ball.particles.clear()
+
+                # End power mode if active
+                if power_manager.is_power_active:
+                    power_manager._end_power_mode()
+
+                # Force bot to be visible and in a consistent position
+                # IMPORTANT: This is critical for maintaining visibility during celebration
+                bot.is_paused = False
+                bot.position_x = 570  # Fixed position X
+                bot.position_y = GROUND_Y - 150  # Place slightly higher to ensure visibility
+                bot.jump_height = 0  # Reset any jumping
+                bot.is_jumping = False
+                bot.is_grounded = True
+                bot.current_action = "idle"
+                bot.current_animation = bot.idle_animation
+                bot.frame_index = 0
+                bot.is_flipped = True
+
+                # Update rectangle
+                bot.rect.x = bot.position_x
+                bot.rect.y = bot.position_y - bot.jump_height + 50
+
+                # Print bot position for debugging
+                print(f"After goal, bot positioned at: ({bot.position_x}, {bot.position_y})")
+
+                # Pause timer for celebrations only
+                if arena.celebrating:
+                    arena.pause_timer()
+                    arena.player_power_bar.pause()
+                    arena.enemy_power_bar.pause()
+                else:
+                    # For own goals, skip celebration and go straight to reset
+                    print("Own goal detected, preparing immediate reset")
+                    arena.pause_timer()  # Still pause timer briefly
+                    play_sound('whistle')
+                    arena.player_power_bar.pause()
+                    arena.enemy_power_bar.pause()
+
+                # Clear keys
+                keys_pressed.clear()
+
+        # Handle dead ball
+        if dead_ball and not arena.celebrating and not self.goal_cooldown:
+            print("Dead ball detected, resetting")
+
+            # Reset ball using its own reset method
+            ball.reset()  # This will put it back to [WIDTH//2, 100]
+
+            # Reset players
+            player.reset()
+            if bot.is_paused:
+                bot.resume()
+            bot.reset()
+            arena.player_dead = False
+
+            # Reset powers
+            power_manager.reset()
+
+    def draw(self, canvas):
+        """Draw the arena, ball, characters and power effects"""
+        if not self.arena.player_dead:
+            self.arena.draw(canvas, self.ball, self.player, self.bot)
+        else:
+            self.arena.draw(canvas, self.ball, None, self.bot)
+        if self.swarm:
+            self.swarm.draw(canvas)
+
+        if self.fire_burning:
+            self.arena.apply_blur_effect_with_dark_top(canvas)
+
+        # Draw power effects
+        self.power_manager.draw_power_effects(canvas)
+
+    def state(self):
+        """Summary of where the match stands"""
+        return {
+            "level": self.level,
+            "seed": self.seed,
+            "steps": match_clock.steps,
+            "score": self.arena.score,
+            "enemy_score": self.arena.enemy_score,
+            "player_own_goals": self.arena.player_own_goals,
+            "enemy_own_goals": self.arena.enemy_own_goals,
+            "player_powers": self.arena.player_power_bar.times_used,
+            "enemy_powers": self.arena.enemy_power_bar.times_used,
+            "win": self.arena.win,
+            "finished": self.finished,
+            "ball": (self.ball.pos[0], self.ball.pos[1], self.ball.vel[0], self.ball.vel[1]),
+            "player": (self.player.position_x, self.player.position_y, self.player.jump_height),
+            "bot": (self.bot.position_x, self.bot.position_y, self.bot.jump_height),
+        }
+
+
+def chase_ball(step, match):
+    """Scripted player for simulate_match: runs at the ball, kicks often and uses powers when ready"""
+    keys = set()
+    ball_x, player_x = match.ball.pos[0], match.player.position_x + 75
+    if ball_x > player_x + 10:
+        keys.add(CONTROL_KEYS["right"])
+    elif ball_x < player_x - 10:
+        keys.add(CONTROL_KEYS["left"])
+    if step % 40 < 2:
+        keys.add(pygame.K_k)
+    if match.arena.player_power_bar.is_full:
+        keys.add(pygame.K_v if match.level == 2 and step % 2 else pygame.K_p)
+    return keys
+
+
+def random_player(seed):
+    """Scripted player for simulate_match that holds random keys, changing them every 10 steps"""
+    rng = random.Random(seed)
+    keys = []
+
+    def play(step, match):
+        if step % 10 == 0:
+            keys[:] = rng.sample(INPUT_KEYS, rng.randint(0, 3))
+        return keys
+
+    return play
+
+
+def init_headless():
+    """Start pygame on the SDL dummy drivers (no window, no sound output) if it is not running"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if not pygame.get_init():
+        pygame.init()
+    if pygame.display.get_surface() is None:
+        # Sprites are converted to the display format while loading
+        pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+def simulate_match(level, inputs=(), seed=0, quiet=True, max_steps=None, record=None):
+    """Play a whole match with no rendering, as fast as the CPU allows, and return its final state().
+
+    inputs is an input source (an InputReplay, say) or the keys held down
+    at each step, as for ScriptedInput. quiet hides the match's progress
+    prints; record saves an input log of the match to that path.
+    """
+    init_headless()
+    if not hasattr(inputs, "next_input"):
+        inputs = ScriptedInput(inputs)
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull if quiet else sys.stdout):
+        match = Match(level, effects=False, seed=seed)
+        if record:
+            match.record_input(record)
+        try:
+            while not match.finished and (max_steps is None or match_clock.steps < max_steps):
+                match.apply_input(*inputs.next_input(match))
+                match.step()
+        finally:
+            match.save_input_log()
+    return match.state()
+
+
+def replay_match(path, quiet=True):
+    """Replay an input log headless and return the final state()"""
+    replay = InputReplay(path)
+    return simulate_match(replay.level, replay, replay.seed, quiet)
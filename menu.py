@@ -2,6 +2,9 @@ import pygame
 import sys
 from config import *
 from sound_manager import play_sound, stop_sound, stop_all_sounds
+from asset_manager import load_image
+from surface_pool import surface_pool
+from idle_screen import IdleScreen
 
 class Menu:
     def __init__(self, screen):
@@ -11,8 +14,7 @@ class Menu:
         
         # Load background image
         try:
-            self.background_img = pygame.image.load("images/background/menu_background.png").convert()
-            self.background_img = pygame.transform.scale(self.background_img, (WIDTH, HEIGHT))
+            self.background_img = load_image("images/background/menu_background.png", (WIDTH, HEIGHT), alpha=False)
         except pygame.error:
             print("Error loading menu background image. Using solid color instead.")
             self.background_img = None
@@ -24,10 +26,8 @@ class Menu:
         
         # Load button image
         try:
-            self.start_button_img = pygame.image.load("images/button/play_button.png").convert_alpha()
-            self.retry_button_img = pygame.image.load("images/button/replay.png").convert_alpha()
-            self.start_button_img = pygame.transform.scale(self.start_button_img, (200, 80))
-            self.retry_button_img = pygame.transform.scale(self.retry_button_img, (200, 200))
+            self.start_button_img = load_image("images/button/play_button.png", (200, 80))
+            self.retry_button_img = load_image("images/button/replay.png", (200, 200))
             self.start_button_rect = self.start_button_img.get_rect(center=(WIDTH//2, HEIGHT//2 + 100))
             self.retry_button_rect = self.retry_button_img.get_rect(center=(WIDTH//2, HEIGHT//2 + 100))
         except:
@@ -48,33 +48,36 @@ class Menu:
     def run(self):
         """Run the main menu"""
         self.running = True  # Reset running state
+        # Only the button hover highlight changes, so sleep until there is input
+        idle = IdleScreen()
         while self.running:
-            choice = self.handle_events_start_button()
+            if idle.needs_redraw(self.start_button_rect.collidepoint(pygame.mouse.get_pos())):
+                self.draw()
+
+            choice = self.handle_events_start_button(idle.wait())
             if choice == "start_game":
                 self.running = False
                 return choice  # Return user's selection like "start_game"
 
-            self.draw()
-            self.clock.tick(FPS)
-
     def show_retry_menu(self):
         """Show the retry menu after losing the game"""
         self.running = True  # Reset running state
         play_sound('retry')
 
+        idle = IdleScreen()
         while self.running:
-            choice = self.handle_events_retry_button()
+            if idle.needs_redraw(self.retry_button_rect.collidepoint(pygame.mouse.get_pos())):
+                self.draw_retry_menu()
+
+            choice = self.handle_events_retry_button(idle.wait())
             if choice == "retry_game":
                 return choice  # Return the user's selection
-
-            self.draw_retry_menu()
-            self.clock.tick(FPS)
         
-    def handle_events_retry_button(self):
+    def handle_events_retry_button(self, events):
         """Handle events for retry menu"""
         mouse_pos = pygame.mouse.get_pos()
         
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -93,11 +96,11 @@ class Menu:
                         play_sound('start_button')
                         return "retry_game"  # Return to retry the game
                     
-    def handle_events_start_button(self):
+    def handle_events_start_button(self, events):
         """Handle events for main menu"""
         mouse_pos = pygame.mouse.get_pos()
         
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -126,9 +129,9 @@ class Menu:
             self.screen.fill(self.black)
         
         # Create a semi-transparent overlay for better text readability
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))  # Semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+        with surface_pool.scratch((WIDTH, HEIGHT), pygame.SRCALPHA) as overlay:
+            overlay.fill((0, 0, 0, 100))  # Semi-transparent black
+            self.screen.blit(overlay, (0, 0))
         
         
         # Draw start button
@@ -138,9 +141,9 @@ class Menu:
             # Add hover effect
             if self.start_button_rect.collidepoint(pygame.mouse.get_pos()):
                 # Create a semi-transparent overlay for hover effect
-                s = pygame.Surface((self.start_button_rect.width, self.start_button_rect.height), pygame.SRCALPHA)
-                s.fill((255, 255, 255, 50))  # White with 50 alpha
-                self.screen.blit(s, self.start_button_rect)
+                with surface_pool.scratch(self.start_button_rect.size, pygame.SRCALPHA) as s:
+                    s.fill((255, 255, 255, 50))  # White with 50 alpha
+                    self.screen.blit(s, self.start_button_rect)
         else:
             # Fallback rectangle button if image loading failed
             mouse_pos = pygame.mouse.get_pos()
@@ -167,9 +170,9 @@ class Menu:
             self.screen.fill(self.black)
         
         # Create semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))  # Darker semi-transparent black for retry menu
-        self.screen.blit(overlay, (0, 0))
+        with surface_pool.scratch((WIDTH, HEIGHT), pygame.SRCALPHA) as overlay:
+            overlay.fill((0, 0, 0, 150))  # Darker semi-transparent black for retry menu
+            self.screen.blit(overlay, (0, 0))
         
         # Draw lose message
         message_text = self.message_font.render("You lose! Please try again", True, self.message_color)
@@ -182,9 +185,9 @@ class Menu:
             
             # Add hover effect
             if self.retry_button_rect.collidepoint(pygame.mouse.get_pos()):
-                s = pygame.Surface((self.retry_button_rect.width, self.retry_button_rect.height), pygame.SRCALPHA)
-                s.fill((255, 255, 255, 50))
-                self.screen.blit(s, self.retry_button_rect)
+                with surface_pool.scratch(self.retry_button_rect.size, pygame.SRCALPHA) as s:
+                    s.fill((255, 255, 255, 50))
+                    self.screen.blit(s, self.retry_button_rect)
         else:
             # Fallback rectangle button
             mouse_pos = pygame.mouse.get_pos()
@@ -1,4 +1,7 @@
+import numpy as np
 import pygame
+from particles import draw_circles, stamps
+from dirty_renderer import mark_dirty
 
 class MeteorEffect:
     def __init__(self, start_pos, end_pos, duration=50):
@@ -26,19 +29,19 @@ class MeteorEffect:
         if not self.active:
             return
         # Draw trail first (older = more transparent)
-        for i, pos in enumerate(self.trail):
-            alpha = int(100 * (i / len(self.trail)))
-            s = pygame.Surface((80,80), pygame.SRCALPHA)
-            pygame.draw.circle(s, (255,100,0,alpha), (40,40), 30)
-            screen.blit(s, (pos[0]-40, pos[1]-40))
+        if self.trail:
+            trail = np.array(self.trail)
+            colors = np.empty((len(trail), 4))
+            colors[:] = (255, 100, 0, 0)
+            colors[:, 3] = 100 * np.arange(len(trail)) / len(trail)
+            draw_circles(screen, trail[:, 0], trail[:, 1], np.full(len(trail), 30), colors)
         # Draw "meteor" as big orange ball with glow
         t = min(1, self.counter / self.duration)
         x = (1-t) * self.start_pos[0] + t * self.end_pos[0]
         y = (1-t) * self.start_pos[1] + t * self.end_pos[1]
         # Glow
-        s = pygame.Surface((100,100), pygame.SRCALPHA)
-        pygame.draw.circle(s, (255, 200, 50, 120), (50,50), 50)
+        s = stamps.get(50, (255, 200, 50, 120))
         screen.blit(s, (x-50, y-50))
         # Core
-        pygame.draw.circle(screen, (255,60,0), (int(x), int(y)), 30)
+        mark_dirty(screen, pygame.draw.circle(screen, (255,60,0), (int(x), int(y)), 30))
         pygame.draw.circle(screen, (255,220,120), (int(x), int(y)), 16)
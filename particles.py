@@ -0,0 +1,254 @@
+import numpy as np
+import pygame
+from itertools import repeat
+from config import WIDTH, HEIGHT
+
+# Cosmetic randomness for particle spawns and flicker (each match reseeds it)
+rng = np.random.default_rng()
+
+
+def reseed(seed):
+    """Restart the cosmetic stream shared by every effect from seed"""
+    rng.bit_generator.state = type(rng.bit_generator)(seed).state
+
+
+class StampCache:
+    """Pre-drawn circle sprites keyed by (radius, quantized RGBA, blend mode).
+
+    Colours are rounded to a grid of color_step so fading particles share a
+    handful of stamps instead of allocating a Surface per particle per frame.
+    """
+
+    def __init__(self, color_step=16, max_stamps=4096):
+        self.color_step = color_step
+        self.max_stamps = max_stamps
+        self.stamps = {}
+
+    def quantize(self, colors):
+        """Round an (n, 4) RGBA array to the stamp colour grid"""
+        step = self.color_step
+        return np.minimum(255, (colors.astype(np.int32) + step // 2) // step * step)
+
+    def get(self, radius, color, additive=False):
+        """Stamp for one circle of an RGBA colour"""
+        step = self.color_step
+        color = tuple(min(255, (c + step // 2) // step * step) for c in color)
+        return self._stamp(radius, color, additive)
+
+    def _stamp(self, radius, color, additive):
+        key = (radius, color, additive)
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            if len(self.stamps) >= self.max_stamps:
+                self.stamps.clear()
+            if additive:
+                # Premultiplied on black: adding it brightens by colour * alpha
+                r, g, b, a = color
+                stamp = pygame.Surface((radius * 2, radius * 2))
+                pygame.draw.circle(stamp, (r * a // 255, g * a // 255, b * a // 255), (radius, radius), radius)
+            else:
+                stamp = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(stamp, color, (radius, radius), radius)
+            self.stamps[key] = stamp
+        return stamp
+
+
+# Circle stamps shared by every emitter
+stamps = StampCache()
+
+
+def draw_circles(screen, x, y, radius, colors, additive=False):
+    """Draw one circle per particle with a single Surface.blits() call.
+
+    x, y and radius are arrays of centres and radii, colors an (n, 4) RGBA
+    array. additive=True brightens what is underneath instead of alpha
+    blending over it.
+    """
+    radius = np.asarray(radius).astype(np.int64)
+    if len(radius) == 0:
+        return
+    left = (np.asarray(x) - radius).astype(np.int32).tolist()
+    top = (np.asarray(y) - radius).astype(np.int32).tolist()
+
+    # Pack (radius, RGBA) into one integer so stamps are looked up once per
+    # distinct key rather than once per particle
+    rgba = stamps.quantize(np.asarray(colors)).astype(np.int64)
+    keys = (radius << 32) | (rgba[:, 0] << 24) | (rgba[:, 1] << 16) | (rgba[:, 2] << 8) | rgba[:, 3]
+    unique_keys, which = np.unique(keys, return_inverse=True)
+    unique_stamps = np.empty(len(unique_keys), object)
+    for i, key in enumerate(unique_keys.tolist()):
+        color = ((key >> 24) & 255, (key >> 16) & 255, (key >> 8) & 255, key & 255)
+        unique_stamps[i] = stamps._stamp(key >> 32, color, additive)
+    surfaces = unique_stamps[which.ravel()].tolist()
+
+    if additive:
+        sequence = zip(surfaces, zip(left, top), repeat(None), repeat(pygame.BLEND_RGB_ADD))
+    else:
+        sequence = zip(surfaces, zip(left, top))
+    screen.blits(sequence, doreturn=False)
+
+
+class ParticlePool:
+    """Fixed-capacity particle storage as one NumPy array per attribute.
+
+    Live particles occupy slots [0, count). Updates run on whole arrays, and
+    dead particles are swap-removed: live ones from the tail are moved into
+    their slots, so removal never shifts the rest of the pool.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.vel_x = np.zeros(capacity, np.float32)
+        self.vel_y = np.zeros(capacity, np.float32)
+        self.life = np.zeros(capacity, np.float32)
+        self.max_life = np.zeros(capacity, np.float32)
+        self.radius = np.zeros(capacity, np.float32)
+        self.color = np.zeros((capacity, 4), np.uint8)  # RGBA
+        self.fields = (self.x, self.y, self.vel_x, self.vel_y, self.life,
+                       self.max_life, self.radius, self.color)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+
+    def emit(self, x, y, vel_x, vel_y, life, radius, color):
+        """Spawn particles. Each argument is a single value or one per particle.
+
+        color is one RGB(A) tuple or an (n, 3|4) array. Particles that do not
+        fit in the remaining capacity are dropped.
+        """
+        x, y, vel_x, vel_y, life, radius = (np.ravel(a) for a in
+                                            np.broadcast_arrays(x, y, vel_x, vel_y, life, radius))
+        n = min(len(x), self.capacity - self.count)
+        if n <= 0:
+            return
+        new = slice(self.count, self.count + n)
+
+        self.x[new] = x[:n]
+        self.y[new] = y[:n]
+        self.vel_x[new] = vel_x[:n]
+        self.vel_y[new] = vel_y[:n]
+        self.life[new] = life[:n]
+        self.max_life[new] = life[:n]
+        self.radius[new] = radius[:n]
+
+        color = np.asarray(color, np.uint8)
+        channels = color.shape[-1]
+        self.color[new, :channels] = np.broadcast_to(color, (len(x), channels))[:n]
+        if channels == 3:
+            self.color[new, 3] = 255
+        self.count += n
+
+    def update(self, gravity=0.0, life_step=1):
+        """Move every particle one frame, age it and drop the dead ones"""
+        live = slice(0, self.count)
+        self.x[live] += self.vel_x[live]
+        self.y[live] += self.vel_y[live]
+        self.vel_y[live] += gravity
+        self.life[live] -= life_step
+        self.compact()
+
+    def compact(self):
+        """Swap-remove particles whose life ran out"""
+        alive = self.life[:self.count] > 0
+        remaining = int(np.count_nonzero(alive))
+        if remaining == self.count:
+            return
+        # Dead slots below the new count are refilled from live particles above it
+        holes = np.flatnonzero(~alive[:remaining])
+        movers = remaining + np.flatnonzero(alive[remaining:])
+        for field in self.fields:
+            field[holes] = field[movers]
+        self.count = remaining
+
+
+def spark_colors(n):
+    """n random warm spark colours, orange to pale yellow"""
+    return rng.integers((200, 100, 50), (256, 256, 151), (n, 3))
+
+
+class SparkPool(ParticlePool):
+    """Glowing sparks around the ball during a power shot (drawn additively)"""
+
+    FADE_FRAMES = 30.0
+
+    def draw(self, screen):
+        live = slice(0, self.count)
+        colors = self.color[live].copy()
+        colors[:, 3] = np.minimum(255, 255 * self.life[live] / self.FADE_FRAMES)
+        draw_circles(screen, self.x[live], self.y[live], self.radius[live], colors, additive=True)
+
+
+class KickSparkPool(ParticlePool):
+    """Flickering sparks from the level 1 bot's power kick, yellow fading to red"""
+
+    def update(self):
+        super().update(gravity=0.1)
+
+    def draw(self, screen):
+        live = slice(0, self.count)
+        progress = self.life[live] / self.max_life[live]
+        colors = np.empty((self.count, 4), np.int32)
+        colors[:] = (255, 0, 0, 255)
+        colors[:, 1] = 140 * progress
+        radius = np.maximum(1, (6 * progress).astype(np.int32))
+        # Flicker by a pixel each frame
+        x = self.x[live].astype(np.int32) + rng.integers(-1, 2, self.count)
+        y = self.y[live].astype(np.int32) + rng.integers(-1, 2, self.count)
+        draw_circles(screen, x, y, radius, colors)
+
+
+class FireSmokePool(ParticlePool):
+    """Ground fire particles that turn from flame to grey smoke as they rise"""
+
+    FLAME_COLORS = np.array([(255, 100, 0), (255, 150, 50), (255, 200, 100)], np.uint8)
+
+    def emit_row(self, per_column, step=5):
+        """Spawn per_column flames every step pixels along the bottom of the screen"""
+        x = np.repeat(np.arange(0, WIDTH, step), per_column)
+        n = len(x)
+        self.emit(x + rng.integers(-5, 6, n), HEIGHT,
+                  rng.uniform(-1, 1, n), rng.uniform(-3, -1, n),
+                  250, rng.integers(5, 11, n),
+                  self.FLAME_COLORS[rng.integers(0, len(self.FLAME_COLORS), n)])
+
+    def update(self):
+        super().update(life_step=2)
+        self._update_colors()
+
+    def _update_colors(self):
+        n = self.count
+        y = self.y[:n]
+        # Colour bands jitter every frame so the smoke flickers
+        mid = rng.uniform(HEIGHT * 0.8, HEIGHT * 0.9, n)  # Flame to grey
+        top = rng.uniform(HEIGHT * 0.2, HEIGHT * 0.4, n)  # Grey to white
+        fade = rng.uniform(HEIGHT * 0.01, HEIGHT * 0.05, n)  # Fully faded
+
+        flame = y > mid
+        grey = ~flame & (y > top)
+        white = ~flame & ~grey & (y > fade)
+
+        rgba = np.empty((n, 4), np.float32)
+        rgba[:] = (255, 255, 255, 0)
+
+        rel = (HEIGHT - y) / (HEIGHT - mid)
+        rgba[flame] = np.stack([255 - 205 * rel, 100 - 50 * rel, 50 * rel,
+                                np.full(n, 200.0)], axis=1)[flame]
+        rel = (mid - y) / (mid - top)
+        shade = 50 + 205 * rel
+        rgba[grey] = np.stack([shade, shade, shade, 200 * (1 - rel)], axis=1)[grey]
+        rel = (top - y) / (top - fade)
+        shade = 255 * rel
+        rgba[white] = np.stack([shade, shade, shade, 200 * (1 - rel)], axis=1)[white]
+
+        self.color[:n] = rgba.astype(np.int32)
+
+    def draw(self, screen):
+        live = slice(0, self.count)
+        draw_circles(screen, self.x[live], self.y[live], self.radius[live], self.color[live])
@@ -0,0 +1,57 @@
+import numpy as np
+import pygame
+from config import WIDTH, HEIGHT
+
+
+def build_top_gradient(size, darkness):
+    """Black overlay fading from darkness alpha at the top to clear at the bottom"""
+    width, height = size
+    gradient = pygame.Surface(size, pygame.SRCALPHA)
+    gradient.fill((0, 0, 0, 0))
+    alpha = (darkness * (1 - np.arange(height) / height)).astype(np.uint8)
+    pygame.surfarray.pixels_alpha(gradient)[...] = alpha[np.newaxis, :]
+    return gradient
+
+
+class BlurDarkenPass:
+    """Full-screen blur blended over the frame, then a darkened top.
+
+    The blur is a downsample/upsample smoothscale chain into scratch
+    surfaces allocated once per target format; the gradient is built once.
+    strength is the opacity of the blurred copy (0 = off, 1 = fully blurred)
+    and downsample sets the blur radius in pixels.
+    """
+
+    def __init__(self, size=(WIDTH, HEIGHT), strength=0.5, downsample=10, darkness=150):
+        self.size = size
+        self.downsample = downsample
+        self.gradient = build_top_gradient(size, darkness)
+        self.small = None
+        self.blurred = None
+        self.set_strength(strength)
+
+    def set_strength(self, strength):
+        self.strength = max(0.0, min(1.0, strength))
+        if self.blurred is not None:
+            self._apply_strength()
+
+    def _apply_strength(self):
+        # Alpha 255 still takes SDL's blending path; no alpha is a plain copy
+        alpha = int(255 * self.strength)
+        self.blurred.set_alpha(alpha if alpha < 255 else None)
+
+    def _allocate(self, target):
+        # smoothscale into an existing surface needs the source's exact format
+        small_size = (self.size[0] // self.downsample, self.size[1] // self.downsample)
+        self.small = pygame.Surface(small_size, 0, target)
+        self.blurred = pygame.Surface(self.size, 0, target)
+        self._apply_strength()
+
+    def apply(self, screen):
+        if self.strength > 0:
+            if self.blurred is None or self.blurred.get_bitsize() != screen.get_bitsize():
+                self._allocate(screen)
+            pygame.transform.smoothscale(screen, self.small.get_size(), self.small)
+            pygame.transform.smoothscale(self.small, self.size, self.blurred)
+            screen.blit(self.blurred, (0, 0))
+        screen.blit(self.gradient, (0, 0))
@@ -1,25 +1,27 @@
 import pygame
 import os
-import time
 import math
+from asset_manager import load_image
+from text_cache import get_font, render_text
+from timestep import match_clock
 
 class PowerBar:
     def __init__(self, is_player=True, level=1):
         self.is_player = is_player
         self.level = level  # Store the level
-        self.last_update_time = time.time()
+        self.last_update_time = match_clock.time()
         self.cooldown_duration = 5  # 5 seconds total cooldown
         self.current_image_index = 5  # Start at powerbar_6 (empty)
         self.is_full = False
         self.paused = False
+        self.times_used = 0
         
         # Load all 6 power bar images
         self.images = []
         for i in range(1, 7):  # powerbar_1.png to powerbar_6.png
             try:
                 img_path = os.path.join("images", "power_bar", f"powerbar_{i}.png")
-                img = pygame.image.load(img_path).convert_alpha()
-                img = pygame.transform.scale(img, (200, 60))
+                img = load_image(img_path, (200, 60))
                 self.images.append(img)
             except Exception as e:
                 print(f"Error loading powerbar_{i}.png: {e}")
@@ -33,8 +35,8 @@ class PowerBar:
         
         # Font for power hints
         try:
-            self.font = pygame.font.Font(None, 24)
-            self.hint_font = pygame.font.Font(None, 28)
+            self.font = get_font(24)
+            self.hint_font = get_font(28)
         except:
             print("Font loading failed")
             self.font = None
@@ -43,6 +45,7 @@ class PowerBar:
         # Pulsing effect for hint text
         self.pulse_timer = 0
         self.pulse_alpha = 255
+        self.hint_bg = None  # Translucent box behind the hint, built on first draw
 
     def use_power(self):
         """Attempt to use the power. Returns True if successful."""
@@ -50,14 +53,15 @@ class PowerBar:
             self.current_image_index = 5  # Reset to empty (powerbar_6)
             self.image = self.images[5]
             self.is_full = False
-            self.last_update_time = time.time()
+            self.last_update_time = match_clock.time()
+            self.times_used += 1
             return True
         return False
 
     def update(self):
         """Update power bar state with countdown animation"""
         if not self.is_full and not self.paused:
-            current_time = time.time()
+            current_time = match_clock.time()
             elapsed = current_time - self.last_update_time
             
             # Update image every second
@@ -96,8 +100,7 @@ class PowerBar:
             else:
                 hint_text = "Press 'V' for Vine | Press 'P' for Sky Shot"  # Both powers available
             
-            hint_surface = self.hint_font.render(hint_text, True, (255, 255, 255))
-            hint_surface.set_alpha(self.pulse_alpha)
+            hint_surface = render_text(self.hint_font, hint_text, (255, 255, 255), self.pulse_alpha)
             
             # Position the hint below the power bar
             hint_x = bar_pos[0]
@@ -107,9 +110,10 @@ class PowerBar:
             bg_rect = pygame.Rect(hint_x - 5, hint_y - 5, 
                                 hint_surface.get_width() + 10, 
                                 hint_surface.get_height() + 10)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-            bg_surface.fill((0, 0, 0, 128))
-            screen.blit(bg_surface, bg_rect.topleft)
+            if self.hint_bg is None or self.hint_bg.get_size() != bg_rect.size:
+                self.hint_bg = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+                self.hint_bg.fill((0, 0, 0, 128))
+            screen.blit(self.hint_bg, bg_rect.topleft)
             
             # Draw the hint text
             screen.blit(hint_surface, (hint_x, hint_y))
@@ -122,7 +126,7 @@ class PowerBar:
         """Pause the power bar cooldown"""
         if not self.paused:
             self.paused = True
-            self.pause_time = time.time()
+            self.pause_time = match_clock.time()
 
     def resume(self):
         """Resume the power bar cooldown"""
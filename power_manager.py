@@ -3,9 +3,11 @@ import math
 import random
 from config import *
 from sound_manager import play_sound
+from asset_manager import load_image, load_frames
 
 class PowerManager:
-    def __init__(self, player, ball, arena, bot, power_bar):
+    def __init__(self, player, ball, arena, bot, power_bar, gameplay_rng=None):
+        self.gameplay_rng = gameplay_rng or random.Random()  # Vine sizes and growth speeds
         self.player = player
         self.ball = ball
         self.arena = arena
@@ -47,38 +49,22 @@ class PowerManager:
         self.vine_rect = None
         
         # Load power animation
-        self.power_frames = []
-        for i in range(1, 11):
-            img_path = f'images/player/Jump A-{str(i).zfill(2)}.png'
-            try:
-                img = pygame.image.load(img_path)
-                img = pygame.transform.scale(img, (150, 200))
-                self.power_frames.append(img)
-            except pygame.error:
-                pass
+        power_frames = [f'images/player/Jump A-{str(i).zfill(2)}.png' for i in range(1, 11)]
+        self.power_frames = load_frames(power_frames, (150, 200))
         
         # Load kick animation
-        self.kick_frames = []
         kick_frames = ['images/player/Attack A-03.png', 'images/player/Attack A-04.png']
-        for frame in kick_frames:
-            try:
-                img = pygame.image.load(frame)
-                img = pygame.transform.scale(img, (150, 200))
-                self.kick_frames.append(img)
-            except pygame.error:
-                pass
+        self.kick_frames = load_frames(kick_frames, (150, 200))
         
         # Vine power attributes - MODIFIED: Only load if level > 1
         self.vine_frames = []
         if self.level > 1:  # ADDED: Level check for vine frames
             for i in range(1, 6):
-                # FIXED: Use relative path instead of absolute path
-                img_path = f'images/Vine/vine{str(i)}.png'
+                # FIXED: Use relative path instead of absolute path (folder is lowercase)
+                img_path = f'images/vine/vine{str(i)}.png'
                 try:
-                    img = pygame.image.load(img_path).convert_alpha()
-                    img = pygame.transform.scale(img, (80, 200))
-                    self.vine_frames.append(img)
-                except pygame.error:
+                    self.vine_frames.append(load_image(img_path, (80, 200)))
+                except (pygame.error, FileNotFoundError):
                     pass
         
         # MODIFIED: Support for multiple vines
@@ -183,10 +169,10 @@ class PowerManager:
                         'frame_index': 0,
                         'position': [base_x + offset, GROUND_Y],
                         'rect': pygame.Rect(base_x + offset - 25, GROUND_Y - 180, 50, 180),
-                        'animation_duration': 70 + random.randint(-10, 10),  # Varied growth speed
+                        'animation_duration': 70 + self.gameplay_rng.randint(-10, 10),  # Varied growth speed
                         'hold_duration': 180,
                         'active': True,
-                        'scale': 0.7 + random.uniform(-0.1, 0.1)  # Varied scales
+                        'scale': 0.7 + self.gameplay_rng.uniform(-0.1, 0.1)  # Varied scales
                     }
                     side_vines.append(side_vine)
                 
@@ -282,6 +268,7 @@ class PowerManager:
                 ):
                 vines_to_remove.append(i)
                 continue
+            self._grow_vine(vine_group['main'], 1.0)
             
             # Update side vines
             for side_vine in vine_group['sides']:
@@ -294,6 +281,7 @@ class PowerManager:
                             side_vine['frame_index'] + 1, 
                             len(self.vine_frames) - 1
                         )
+                self._grow_vine(side_vine, side_vine.get('scale', 0.75))
         
         # Remove completed vine groups (in reverse order to avoid index issues)
         for i in sorted(vines_to_remove, reverse=True):
@@ -317,8 +305,8 @@ class PowerManager:
                     if side_vine['active'] and side_vine['frame_index'] < len(self.vine_frames):
                         self._draw_single_vine(surface, side_vine, side_vine.get('scale', 0.75))  # Smaller scale
     
-    def _draw_single_vine(self, surface, vine_data, scale=1.0):
-        """Helper method to draw a single vine with given parameters"""
+    def _vine_height(self, vine_data, scale):
+        """Height of a vine as it grows to full size over its animation"""
         vine_frame = self.vine_frames[vine_data['frame_index']]
         
         # Calculate growth factor
@@ -326,11 +314,24 @@ class PowerManager:
             growth_factor = vine_data['animation_timer'] / vine_data['animation_duration']
         else:
             growth_factor = 1.0
+        return int(vine_frame.get_height() * scale * growth_factor)
+
+    def _grow_vine(self, vine_data, scale):
+        """Fit the collision rect to the vine's height (in update, so drawing never changes it)"""
+        if not self.vine_frames or vine_data['frame_index'] >= len(self.vine_frames):
+            return
+        new_height = self._vine_height(vine_data, scale)
+        if new_height > 0 and 'rect' in vine_data:
+            vine_data['rect'].height = new_height
+            vine_data['rect'].y = vine_data['position'][1] - new_height
+
+    def _draw_single_vine(self, surface, vine_data, scale=1.0):
+        """Helper method to draw a single vine with given parameters"""
+        vine_frame = self.vine_frames[vine_data['frame_index']]
         
         # MODIFIED: Scale width more to make vines appear denser
         original_width = vine_frame.get_width() * scale * 1.4  # 40% wider
-        original_height = vine_frame.get_height() * scale
-        new_height = int(original_height * growth_factor)
+        new_height = self._vine_height(vine_data, scale)
         
         if new_height > 0:
             scaled_vine = pygame.transform.scale(vine_frame, (int(original_width), new_height))
@@ -339,11 +340,6 @@ class PowerManager:
                 vine_data['position'][1] - new_height
             ]
             surface.blit(scaled_vine, vine_draw_pos)
-            
-            # Update collision rect
-            if 'rect' in vine_data:
-                vine_data['rect'].height = new_height
-                vine_data['rect'].y = vine_data['position'][1] - new_height
     
     def get_vine_rect(self):
         """Return all vine collision rects as a list"""
@@ -0,0 +1,77 @@
+import time
+from contextlib import contextmanager
+
+
+class StartupTrace:
+    """Times named startup phases and reports the time to the first menu frame"""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.phases = []  # (name, seconds) in the order they ran
+        self.reported = False
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as one startup phase"""
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - begin))
+
+    def report(self):
+        """Print the breakdown (only when tracing was requested)"""
+        if not self.enabled:
+            return
+        self.reported = True
+        total = time.perf_counter() - self.start
+        traced = sum(seconds for _, seconds in self.phases)
+
+        print("Startup trace (time to first menu frame):")
+        for name, seconds in self.phases + [("untraced", total - traced)]:
+            print(f"  {name:<24} {seconds * 1000:8.1f} ms  {seconds / total * 100:5.1f}%")
+        print(f"  {'total':<24} {total * 1000:8.1f} ms")
+
+
+class FrameProfiler:
+    """Accumulates time spent in named sections of the game loop"""
+
+    def __init__(self):
+        self.totals = {}  # section -> seconds
+        self.calls = {}  # section -> times entered
+        self.frames = 0
+
+    @contextmanager
+    def section(self, name):
+        """Time the enclosed block under name"""
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] = self.totals.get(name, 0.0) + time.perf_counter() - begin
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+    def end_frame(self):
+        self.frames += 1
+
+    def average_ms(self, name):
+        """Average cost of one call of a section in milliseconds"""
+        calls = self.calls.get(name, 0)
+        return self.totals.get(name, 0.0) * 1000 / calls if calls else 0.0
+
+    def report(self):
+        print(f"Frame profile over {self.frames} frames:")
+        for name, total in sorted(self.totals.items(), key=lambda item: -item[1]):
+            per_frame = total * 1000 / max(1, self.frames)
+            print(f"  {name:<24} {self.average_ms(name):7.2f} ms/call  {per_frame:7.2f} ms/frame"
+                  f"  ({self.calls[name]} calls)")
+
+    def reset(self):
+        self.totals.clear()
+        self.calls.clear()
+        self.frames = 0
+
+
+# Shared by the game loops and the effects they draw
+frame_profiler = FrameProfiler()
@@ -0,0 +1,42 @@
+"""Replay a match from an input log saved with RECORD_INPUT_LOGS.
+
+Usage: python replay.py LOG [--speed N] [--headless]
+
+The match is rebuilt from the seed in the log and fed the recorded keys
+step by step, so it plays out exactly as it did. It is shown in a window
+at --speed times real time, or with --headless simulated as fast as the
+CPU allows and only its final state printed.
+"""
+import argparse
+import pygame
+from config import WIDTH, HEIGHT
+from input_log import InputReplay
+from match import replay_match
+
+
+def watch(path, speed):
+    replay = InputReplay(path)
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption(f"Replay: {path}")
+    from sound_manager import initialize_sounds
+    initialize_sounds()
+
+    if replay.level == 1:
+        from gameLevel1 import GameLevel1 as play
+    else:
+        from gameLevel2 import GameLevel2 as play
+    play(screen, replay, speed)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded match")
+    parser.add_argument("log", help="input log (.keys) to replay")
+    parser.add_argument("--speed", type=float, default=1, help="playback speed in the window")
+    parser.add_argument("--headless", action="store_true", help="simulate without a window and print the result")
+    args = parser.parse_args()
+    if args.headless:
+        print(replay_match(args.log))
+    else:
+        watch(args.log, args.speed)
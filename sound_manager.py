@@ -55,6 +55,16 @@ def initialize_sounds():
     for sound_name in sounds:
         sounds[sound_name].set_volume(0.5)  # 50% volume by default
 
+# Sounds played straight from a file path, decoded on first use
+loaded_sounds = {}
+
+def load_sound(path):
+    """Sound for a file path, loaded once and shared afterwards"""
+    sound = loaded_sounds.get(path)
+    if sound is None:
+        sound = loaded_sounds[path] = pygame.mixer.Sound(path)
+    return sound
+
 def play_sound(sound_name, loop=False):
     """Play a sound effect"""
     global sounds
@@ -1,15 +1,41 @@
 import pygame
 import sys
-import random
+from contextlib import nullcontext
 
 from config import *
-from storyscene.introscene1 import *
 from character import *
 from botLevel2 import BotLevel2 
 from sound_manager import play_sound, play_background_music
+from asset_manager import load_image
+from surface_pool import surface_pool
+from particles import rng
+from idle_screen import IdleScreen
 
 
-def screen_shake_effect(screen, background_img, duration_ms=5000, intensity=10):
+def _cutscenes():
+    """Import the video cutscenes (and with them cv2/numpy) on first use"""
+    from storyscene import introscene1
+    return introscene1
+
+
+def play_intro_scene(screen):
+    _cutscenes().play_intro_scene(screen)
+
+
+def play_first_video(screen):
+    _cutscenes().play_first_video(screen)
+
+
+def play_second_video(screen):
+    _cutscenes().play_second_video(screen)
+
+
+def play_chaos_video(screen):
+    _cutscenes().play_chaos_video(screen)
+
+
+def screen_shake_effect(screen, background_img, duration_ms=5000, intensity=10, profiler=None):
+    """Shake background_img (black if None) and fade it out; profiler times each frame's drawing"""
     clock = pygame.time.Clock()
     start = pygame.time.get_ticks()
     fade_start = duration_ms - 1000  # start fade 1s before end
@@ -34,20 +60,23 @@ def screen_shake_effect(screen, background_img, duration_ms=5000, intensity=10):
         if elapsed >= duration_ms:
             break
 
-        dx = random.randint(-intensity, intensity)
-        dy = random.randint(-intensity, intensity)
-        screen.fill((0, 0, 0))
-        screen.blit(background_img, (dx, dy))
+        with profiler.section("level 2 transition: draw") if profiler else nullcontext():
+            dx, dy = rng.integers(-intensity, intensity + 1, 2)
+            screen.fill((0, 0, 0))
+            if background_img:
+                screen.blit(background_img, (dx, dy))
 
-        # Fading overlay
-        if elapsed >= fade_start:
-            fade_alpha = int(255 * (elapsed - fade_start) / 1000)  # 0 → 255 over 1 sec
-            fade_surface = pygame.Surface((screen_width, screen_height))
-            fade_surface.set_alpha(fade_alpha)
-            fade_surface.fill((0, 0, 0))
-            screen.blit(fade_surface, (0, 0))
+            # Fading overlay
+            if elapsed >= fade_start:
+                fade_alpha = int(255 * (elapsed - fade_start) / 1000)  # 0 → 255 over 1 sec
+                with surface_pool.scratch((screen_width, screen_height)) as fade_surface:
+                    fade_surface.set_alpha(fade_alpha)
+                    fade_surface.fill((0, 0, 0))
+                    screen.blit(fade_surface, (0, 0))
 
         pygame.display.flip()
+        if profiler:
+            profiler.end_frame()
         clock.tick(60)
 
     # Final fade to black
@@ -62,7 +91,7 @@ def screen_shake_effect(screen, background_img, duration_ms=5000, intensity=10):
     pygame.mixer.music.stop()
 
 def castle_zoom_out(screen, image_path, duration_ms=10000):
-    original_img = pygame.image.load(image_path).convert()
+    original_img = load_image(image_path, alpha=False)
     clock = pygame.time.Clock()
     start_time = pygame.time.get_ticks()
 
@@ -124,8 +153,7 @@ def gate_entry_scene(screen, background_path):
     clock = pygame.time.Clock()
 
     # Load background
-    background = pygame.image.load(background_path).convert()
-    background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+    background = load_image(background_path, (WIDTH, HEIGHT), alpha=False)
 
     # Create the character
     player = CharacterAnimation()
@@ -195,8 +223,7 @@ def throne_room_scene(screen):
     pygame.mixer.music.load("storyscene/beforeLuciferSoundTrack.mp3")
     pygame.mixer.music.play(-1)
 
-    background = pygame.image.load("images/background/throne room.png").convert()
-    background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+    background = load_image("images/background/throne room.png", (WIDTH, HEIGHT), alpha=False)
 
     player = CharacterAnimation()
     player.position_x = 100
@@ -234,14 +261,17 @@ def throne_room_scene(screen):
         pygame.display.flip()
         clock.tick(60)
 
-def throne_room_dialogue(screen):
-    clock = pygame.time.Clock()
+def _pose(character):
+    """Everything a character's draw() depends on, to tell when a dialogue frame changed"""
+    return (id(character.current_animation), character.frame_index, character.is_flipped,
+            character.position_x, character.position_y, character.jump_height)
+
 
+def throne_room_dialogue(screen):
     pygame.mixer.music.load("storyscene/beforeLuciferSoundTrack.mp3")
     pygame.mixer.music.play(-1)  
 
-    background = pygame.image.load("images/background/throne room.png").convert()
-    background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+    background = load_image("images/background/throne room.png", (WIDTH, HEIGHT), alpha=False)
 
     # Player
     player = CharacterAnimation()
@@ -284,10 +314,40 @@ def throne_room_dialogue(screen):
     waiting = False
     start_time = pygame.time.get_ticks()
 
+    # The characters animate every few frames and the text changes only on a
+    # key press, so wake up at 60 Hz to animate and redraw only when that shows
+    idle = IdleScreen(wakeup_ms=1000 // 60)
+
     running = True
     while running:
+        if idle.needs_redraw((index, _pose(player), _pose(bot))):
+            screen.blit(background, (0, 0))
+            player.draw(screen)
+            bot.draw(screen)
+
+            if index < len(dialogues):
+                speaker, message = dialogues[index]
+
+                # Draw comic-style speech box
+                pygame.draw.rect(screen, (255, 255, 255), (80, 50, 640, 100), border_radius=10)
+                pygame.draw.rect(screen, (0, 0, 0), (80, 50, 640, 100), width=3, border_radius=10)
+
+                # Render text
+                speaker_text = font.render(f"{speaker}:", True, (0, 0, 0))
+                message_text = font.render(message, True, (0, 0, 0))
+                screen.blit(speaker_text, (100, 60))
+                screen.blit(message_text, (100, 100))
+
+            else:
+                # End of dialogue — fade out and return to Level 2d
+                pygame.mixer.music.fadeout(1000)
+                fade_to_black(screen)
+                return
+
+            pygame.display.flip()
+
         keys = pygame.key.get_pressed()
-        for event in pygame.event.get():
+        for event in idle.wait():
             if event.type == pygame.QUIT or keys[pygame.K_ESCAPE]:
                 pygame.quit()
                 sys.exit()
@@ -301,42 +361,15 @@ def throne_room_dialogue(screen):
         if waiting and pygame.time.get_ticks() - start_time > advance_delay:
             waiting = False
 
-        screen.blit(background, (0, 0))
-        player.update(set())
-        player.draw(screen)
-        bot.update()
-        bot.draw(screen)
-
-        if index < len(dialogues):
-            speaker, message = dialogues[index]
-
-            # Draw comic-style speech box
-            pygame.draw.rect(screen, (255, 255, 255), (80, 50, 640, 100), border_radius=10)
-            pygame.draw.rect(screen, (0, 0, 0), (80, 50, 640, 100), width=3, border_radius=10)
-
-            # Render text
-            speaker_text = font.render(f"{speaker}:", True, (0, 0, 0))
-            message_text = font.render(message, True, (0, 0, 0))
-            screen.blit(speaker_text, (100, 60))
-            screen.blit(message_text, (100, 100))
-
-        else:
-            # End of dialogue — fade out and return to Level 2d
-            pygame.mixer.music.fadeout(1000)
-            fade_to_black(screen)
-            return
-
-        pygame.display.flip()
-        clock.tick(60)
+        for _ in range(idle.due_wakeups()):
+            player.update(set())
+            bot.update()
 
 def throne_room_dialogue_after(screen):
-    clock = pygame.time.Clock()
-
     pygame.mixer.music.load("storyscene/beforeLuciferSoundTrack.mp3")
     pygame.mixer.music.play(-1)  
 
-    background = pygame.image.load("images/background/throne room.png").convert()
-    background = pygame.transform.scale(background, screen.get_size())
+    background = load_image("images/background/throne room.png", screen.get_size(), alpha=False)
 
     # Player
     player = CharacterAnimation()
@@ -375,9 +408,36 @@ def throne_room_dialogue_after(screen):
     waiting = False
     start_time = pygame.time.get_ticks()
 
+    # Same idle loop as throne_room_dialogue: animate at 60 Hz, redraw on change
+    idle = IdleScreen(wakeup_ms=1000 // 60)
+
     running = True
     while running:
-        for event in pygame.event.get():
+        if idle.needs_redraw((index, _pose(player), _pose(bot))):
+            screen.blit(background, (0, 0))
+            player.draw(screen)
+            bot.draw(screen)
+
+            if index < len(dialogues):
+                speaker, message = dialogues[index]
+
+                pygame.draw.rect(screen, (255, 255, 255), (80, 50, 640, 100), border_radius=10)
+                pygame.draw.rect(screen, (0, 0, 0), (80, 50, 640, 100), width=3, border_radius=10)
+
+                speaker_text = font.render(f"{speaker}:", True, (0, 0, 0))
+                message_text = font.render(message, True, (0, 0, 0))
+                screen.blit(speaker_text, (100, 60))
+                screen.blit(message_text, (100, 100))
+
+            else:
+                pygame.mixer.music.fadeout(1000)
+                fade_to_black(screen)
+                move_player_to_lucifer(screen, player, bot, background)
+                return
+
+            pygame.display.flip()
+
+        for event in idle.wait():
             if event.type == pygame.QUIT or (
                 event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
             ):
@@ -392,32 +452,10 @@ def throne_room_dialogue_after(screen):
         if waiting and pygame.time.get_ticks() - start_time > advance_delay:
             waiting = False
 
-        screen.blit(background, (0, 0))
-        player.update(set())
-        player.draw(screen)
-        bot.stationary = True
-        bot.update()
-        bot.draw(screen)
-
-        if index < len(dialogues):
-            speaker, message = dialogues[index]
-
-            pygame.draw.rect(screen, (255, 255, 255), (80, 50, 640, 100), border_radius=10)
-            pygame.draw.rect(screen, (0, 0, 0), (80, 50, 640, 100), width=3, border_radius=10)
-
-            speaker_text = font.render(f"{speaker}:", True, (0, 0, 0))
-            message_text = font.render(message, True, (0, 0, 0))
-            screen.blit(speaker_text, (100, 60))
-            screen.blit(message_text, (100, 100))
-
-        else:
-            pygame.mixer.music.fadeout(1000)
-            fade_to_black(screen)
-            move_player_to_lucifer(screen, player, bot, background)
-            return
-
-        pygame.display.flip()
-        clock.tick(60)
+        for _ in range(idle.due_wakeups()):
+            player.update(set())
+            bot.stationary = True
+            bot.update()
 
 
 def move_player_to_lucifer(screen, player, bot, background):
@@ -508,11 +546,9 @@ def orb_statue_scene(screen):
     pygame.mixer.music.play(-1)  
 
     # Load both backgrounds
-    orb_present = pygame.image.load("storyscene/orbAtLucifer.png").convert()
-    orb_present = pygame.transform.scale(orb_present, (WIDTH, HEIGHT))
+    orb_present = load_image("storyscene/orbAtLucifer.png", (WIDTH, HEIGHT), alpha=False)
 
-    orb_missing = pygame.image.load("storyscene/orbAtLuciferMissing.jpeg").convert()
-    orb_missing = pygame.transform.scale(orb_missing, (WIDTH, HEIGHT))
+    orb_missing = load_image("storyscene/orbAtLuciferMissing.jpeg", (WIDTH, HEIGHT), alpha=False)
 
     # Setup player
     player = CharacterAnimation()
@@ -586,13 +622,10 @@ def chaos_statue_scene(screen):
     pygame.mixer.music.play(-1) 
 
     # Load both backgrounds
-    chaos_bg = pygame.image.load("storyscene/stormBackToFirstBackground.png").convert()
-    chaos_bg = pygame.transform.scale(chaos_bg, (WIDTH, HEIGHT))
+    chaos_bg = load_image("storyscene/stormBackToFirstBackground.png", (WIDTH, HEIGHT), alpha=False)
 
-    orb_restored_bg = pygame.image.load("images/background/scene01.png").convert()
-    orb_restored_bg = pygame.transform.scale(orb_restored_bg, (WIDTH, HEIGHT))
-    dragon_bg = pygame.image.load("storyscene/dragon.jpg").convert()
-    orb_restored_bg = pygame.transform.scale(orb_restored_bg, (WIDTH, HEIGHT))
+    orb_restored_bg = load_image("images/background/scene01.png", (WIDTH, HEIGHT), alpha=False)
+    dragon_bg = load_image("storyscene/dragon.jpg", alpha=False)
 
     # Setup player on the right (carrying orb)
     player = CharacterAnimation()
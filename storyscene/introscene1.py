@@ -1,29 +1,24 @@
 import pygame
 import time
 import sys
-import cv2
-import numpy as np
 from botLevel2 import BotLevel2  # Lucifer animation class
-
-pygame.mixer.init()
+from asset_manager import load_image
+from config import PROFILE_FRAMES
+from storyscene.video_stream import VideoStream, MediaClock
 
 
 def play_intro_scene(screen):
     # Load background images
-    bg_with_orb = pygame.image.load("images/background/scene01.png")
-    bg_with_orb = pygame.transform.scale(bg_with_orb, (800, 600))
+    bg_with_orb = load_image("images/background/scene01.png", (800, 600), alpha=False)
 
-    bg_without_orb = pygame.image.load("images/background/scene02.jpeg")
-    bg_without_orb = pygame.transform.scale(bg_without_orb, (800, 600))
+    bg_without_orb = load_image("images/background/scene02.jpeg", (800, 600), alpha=False)
 
     grass_sound = pygame.mixer.Sound("storyscene/grasssound.mp3")
     grass_sound.set_volume(0.3)  # optional, reduce volume
 
     # Load all run frames for exit animation
     lucifer_run_frames = [
-        pygame.transform.scale(
-            pygame.image.load(f"images/bot_level_2/Run-{str(i).zfill(2)}.png"), (120, 135)
-        )
+        load_image(f"images/bot_level_2/Run-{str(i).zfill(2)}.png", (120, 135))
         for i in range(1, 9)
     ]
     lucifer_run_frame_index = 0
@@ -141,76 +136,60 @@ def play_intro_scene(screen):
         pygame.display.flip()
         clock.tick(60)
 
-def play_chaos_video(screen):
-    cap = cv2.VideoCapture("storyscene/chaosNoOrb.mp4")
+def play_video(screen, path, flip=True, music=None, music_delay_ms=0):
+    """Play a cutscene from a background decode thread, paced by its music.
 
-    if not cap.isOpened():
-        print(" Could not open video.")
+    The music starts music_delay_ms into the video. Frames the picture has
+    fallen behind on are dropped instead of slowing the whole clip down.
+    """
+    stream = VideoStream(path, screen.get_size(), flip=flip)
+    if not stream.is_open():
+        print(f"Could not open video {path}.")
         return
 
-    clock = pygame.time.Clock()
-
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        # Convert BGR (OpenCV) to RGB (Pygame)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame = np.rot90(frame)  # Rotate if needed
-        surface = pygame.surfarray.make_surface(frame)
-        surface = pygame.transform.scale(surface, screen.get_size())
-
-        screen.blit(surface, (0, 0))
-        pygame.display.flip()
-        clock.tick(30)  # Match your video FPS
+    if music:
+        pygame.mixer.music.load(music)
+    media_clock = MediaClock(stream.fps, music_delay_ms / 1000 if music else None)
+
+    stream.start()
+    media_clock.start()
+    try:
+        while True:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (
+                    event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
+                ):
+                    stream.close()
+                    pygame.quit()
+                    sys.exit()
+
+            if media_clock.music_due():
+                pygame.mixer.music.play()
+
+            frame = stream.next_frame(skip=media_clock.frames_behind(stream.frame_number))
+            if frame is None:
+                break
+
+            media_clock.wait_for(stream.frame_number)
+            screen.blit(frame, (0, 0))
+            pygame.display.flip()
+            media_clock.shown(stream.frame_number)
+    finally:
+        stream.close()
+        if PROFILE_FRAMES:
+            stream.report()
+            media_clock.report()
+
+    if music:
+        pygame.mixer.music.stop()
 
-    cap.release()   
+def play_chaos_video(screen):
+    # This one was never flipped back, so it keeps its mirrored look
+    play_video(screen, "storyscene/chaosNoOrb.mp4", flip=False)
 
 def play_first_video(screen):
-    running = True
-
-    cap = cv2.VideoCapture("storyscene/revisionFirstVid.mp4")
-    if not cap.isOpened():
-        print("❌ Could not open video.")
-        return
-
-    clock = pygame.time.Clock()
-    pygame.mixer.music.load("storyscene/firstVideo.mp3")
-
-    start_time = pygame.time.get_ticks()
-    music_played = False
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT or (
-                event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
-            ):
-                # running = False  # Just set this; cleanup happens below
-                pygame.quit()
-                sys.exit()
-
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame = np.rot90(frame)
-        surface = pygame.surfarray.make_surface(frame)
-        surface = pygame.transform.scale(surface, screen.get_size())
-        surface = pygame.transform.flip(surface, True, False)
-
-        screen.blit(surface, (0, 0))
-        pygame.display.flip()
-
-        if not music_played and pygame.time.get_ticks() - start_time >= 2000:
-            pygame.mixer.music.play()
-            music_played = True
-
-        clock.tick(30)
-
-    cap.release()
-    pygame.mixer.music.stop()
+    play_video(screen, "storyscene/revisionFirstVid.mp4",
+               music="storyscene/firstVideo.mp3", music_delay_ms=2000)
 
 
 # def play_second_video(screen):
@@ -250,55 +229,5 @@ def play_first_video(screen):
 #     pygame.mixer.music.stop()
 
 def play_second_video(screen):
-    cap = cv2.VideoCapture("storyscene/revisionChaos.mp4")
-    if not cap.isOpened():
-        print("Could not open video.")
-        return
-
-    clock = pygame.time.Clock()
-
-    pygame.mixer.music.load("storyscene/revisionChaos.mp3")
-
-    start_time = pygame.time.get_ticks()  # Record start time
-    music_played = False
-
-    running = True
-    while cap.isOpened() and running:
-        # 🔁 Handle ESC key or window close
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT or (
-                event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE
-            ):
-                pygame.quit()
-                sys.exit()
-
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        frame = np.rot90(frame)
-        surface = pygame.surfarray.make_surface(frame)
-        surface = pygame.transform.scale(surface, screen.get_size())
-        surface = pygame.transform.flip(surface, True, False)
-
-        screen.blit(surface, (0, 0))
-        pygame.display.flip()
-
-        if not music_played and pygame.time.get_ticks() - start_time >= 1000:
-            pygame.mixer.music.play()
-            music_played = True
-
-        clock.tick(30)
-
-    cap.release()
-    pygame.mixer.music.stop()
-
-
-
-
-
-
-
-
-
+    play_video(screen, "storyscene/revisionChaos.mp4",
+               music="storyscene/revisionChaos.mp3", music_delay_ms=1000)
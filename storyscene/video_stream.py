@@ -0,0 +1,295 @@
+import json
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+import cv2
+import numpy as np
+import pygame
+from config import CUTSCENE_CACHE_DIR
+
+# Cutscene frame cache layout (written by bake_cutscenes.py):
+#   header | frame blobs (16-byte aligned) | JSON index
+# Each frame is "raw" RGB rows, a zlib-compressed "key" frame, or a "delta":
+# the zlib-compressed XOR with the frame before it.
+CACHE_MAGIC = b"ORBFRMS\0"
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct("<8sIQQ")  # magic, version, index offset, index length
+
+
+def convert_frame(frame, size, mirror, out):
+    """Scale a decoded BGR frame to size and write it into out as RGB rows"""
+    resized = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    if mirror:
+        cv2.flip(resized, 1, dst=resized)
+    cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=out)
+
+
+def cache_path(path):
+    return os.path.join(CUTSCENE_CACHE_DIR, os.path.basename(path) + ".frames")
+
+
+class FrameCache:
+    """Memory-mapped frames of one cutscene, already scaled and flipped by bake_cutscenes.py"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_offset, index_length = CACHE_HEADER.unpack_from(self.data)
+        if magic != CACHE_MAGIC or version != CACHE_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {CACHE_VERSION} cutscene cache")
+        self.index = json.loads(self.data[index_offset:index_offset + index_length])
+        self.buffer = memoryview(self.data)
+        self.fps = self.index["fps"]
+        width, height = self.index["size"]
+        self.frame = np.zeros((height, width, 3), np.uint8)  # Base for the next delta
+        self.position = 0
+
+    def matches(self, source, size, flip):
+        """True if baked from the current source at this size and orientation"""
+        index = self.index
+        if list(size) != index["size"] or flip != index["flip"]:
+            return False
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return True  # Source missing at runtime: the baked copy is all we have
+        return stat.st_mtime_ns == index["source_mtime"] and stat.st_size == index["source_size"]
+
+    def read(self, out):
+        """Write the next frame into out; False at the end"""
+        if self.position >= len(self.index["frames"]):
+            return False
+        offset, length, kind = self.index["frames"][self.position]
+        self.position += 1
+        blob = self.buffer[offset:offset + length]
+        if kind == "raw":
+            np.copyto(out, np.frombuffer(blob, np.uint8).reshape(out.shape))
+            return True
+        pixels = np.frombuffer(zlib.decompress(blob), np.uint8).reshape(out.shape)
+        if kind == "key":
+            np.copyto(self.frame, pixels)
+        else:
+            np.bitwise_xor(self.frame, pixels, out=self.frame)
+        np.copyto(out, self.frame)
+        return True
+
+    def close(self):
+        self.buffer = None
+        self.data.close()
+        self.file.close()
+
+
+def open_frame_cache(source, size, flip):
+    """Baked frames of a cutscene, or None to decode the video instead"""
+    path = cache_path(source)
+    if not os.path.exists(path):
+        return None
+    try:
+        cache = FrameCache(path)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring cutscene cache {path}: {e}")
+        return None
+    if not cache.matches(source, size, flip):
+        print(f"Cutscene cache {path} is stale, decoding {source} (re-run bake_cutscenes.py)")
+        cache.close()
+        return None
+    return cache
+
+
+class VideoCapture:
+    """Decodes a video with cv2 and converts each frame like the baked cache stores it"""
+
+    def __init__(self, path, size, flip):
+        self.capture = cv2.VideoCapture(path)
+        self.size = size
+        self.mirror = not flip
+        self.fps = self.capture.get(cv2.CAP_PROP_FPS) or 30.0
+
+    def is_open(self):
+        return self.capture.isOpened()
+
+    def read(self, out):
+        ok, frame = self.capture.read()
+        if ok:
+            convert_frame(frame, self.size, self.mirror, out)
+        return ok
+
+    def close(self):
+        self.capture.release()
+
+
+class VideoStream:
+    """Decodes a cutscene on a background thread into a ring of preallocated frames.
+
+    The decode thread reads each frame from the baked cache, or decodes,
+    resizes and converts it with cv2, into the next free slot, a row-major RGB buffer with a Surface
+    made over it once with frombuffer. Playback takes the next ready slot,
+    blits its Surface and hands the slot back, so no Surface or pixel
+    buffer is allocated per frame. When the ring is full the decoder waits;
+    when it is empty playback waits and counts a stall.
+
+    flip=False keeps the mirrored picture the old rot90 + make_surface path
+    produced for videos it did not flip back.
+    """
+
+    def __init__(self, path, size, flip=True, slots=8):
+        self.path = path
+        self.size = size
+        self.source = open_frame_cache(path, size, flip) or VideoCapture(path, size, flip)
+        self.fps = self.source.fps
+
+        width, height = size
+        self.buffers = [np.empty((height, width, 3), np.uint8) for _ in range(slots)]
+        self.surfaces = [pygame.image.frombuffer(buffer, size, "RGB") for buffer in self.buffers]
+        self.free = queue.Queue()
+        for slot in range(slots):
+            self.free.put(slot)
+        self.ready = queue.Queue()  # (slot, frame number), then None at the end
+        self.stopping = threading.Event()
+        self.thread = None
+        self.current = None  # Slot on screen, returned on the next frame
+        self.frame_number = -1  # Frame number of the current slot
+
+        self.decoded = 0
+        self.shown = 0
+        self.dropped = 0
+        self.stalls = 0
+
+    def is_open(self):
+        return isinstance(self.source, FrameCache) or self.source.is_open()
+
+    def start(self):
+        self.thread = threading.Thread(target=self._decode, name=f"decode {self.path}", daemon=True)
+        self.thread.start()
+
+    def _decode(self):
+        frame_number = 0
+        try:
+            while not self.stopping.is_set():
+                slot = self._free_slot()
+                if slot is None:
+                    break
+                if not self.source.read(self.buffers[slot]):
+                    self.free.put(slot)
+                    break
+                self.decoded += 1
+                self.ready.put((slot, frame_number))
+                frame_number += 1
+        finally:
+            self.ready.put(None)
+
+    def _free_slot(self):
+        while not self.stopping.is_set():
+            try:
+                return self.free.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        return None
+
+    def next_frame(self, skip=0):
+        """Surface of the next decoded frame after dropping skip frames, or None at the end.
+
+        The Surface shares its slot's pixels and stays valid until the next call.
+        """
+        if self.current is not None:
+            self.free.put(self.current)
+            self.current = None
+
+        while True:
+            try:
+                item = self.ready.get_nowait()
+            except queue.Empty:
+                self.stalls += 1
+                item = self.ready.get()
+            if item is None:
+                self.ready.put(None)  # Later calls see the end too
+                return None
+            slot, frame_number = item
+            if skip > 0:
+                skip -= 1
+                self.dropped += 1
+                self.free.put(slot)
+                continue
+            self.current = slot
+            self.frame_number = frame_number
+            self.shown += 1
+            return self.surfaces[slot]
+
+    def close(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join()
+        self.source.close()
+
+    def report(self):
+        source = "cache" if isinstance(self.source, FrameCache) else "cv2"
+        print(f"Video {self.path} ({source}): {self.decoded} decoded, {self.shown} shown,"
+              f" {self.dropped} dropped, {self.stalls} stalls waiting for the decoder")
+
+
+class MediaClock:
+    """Playback position of a cutscene, driven by its music once the music is playing.
+
+    Until then it is a monotonic clock from start(). The music is meant to
+    start music_delay seconds into the video; once it does, its playback
+    position plus that delay is the master, so the picture follows the sound
+    even when frames are late. drift records how far each shown frame was
+    from the clock when it reached the screen (positive: picture ahead).
+    """
+
+    def __init__(self, fps, music_delay=None):
+        self.fps = fps
+        self.music_delay = music_delay
+        self.started = None
+        self.music_started = False
+        self.drift = []  # Seconds, one per shown frame
+
+    def start(self):
+        self.started = time.perf_counter()
+
+    def position(self):
+        """Seconds into the video"""
+        if self.music_started:
+            music_ms = pygame.mixer.music.get_pos()
+            if music_ms >= 0:
+                return self.music_delay + music_ms / 1000
+        return time.perf_counter() - self.started
+
+    def music_due(self):
+        """True once, when the music should start"""
+        if self.music_delay is None or self.music_started:
+            return False
+        if self.position() < self.music_delay:
+            return False
+        self.music_started = True
+        return True
+
+    def frames_behind(self, frame_number):
+        """Frames to skip so that the frame after frame_number is the one due now"""
+        return max(0, int(self.position() * self.fps) - frame_number - 1)
+
+    def wait_for(self, frame_number):
+        """Sleep until frame_number is due"""
+        due = frame_number / self.fps
+        ahead = due - self.position()
+        while ahead > 0.0005:
+            # The music position moves in audio-buffer steps, so re-check rather than trust one sleep
+            time.sleep(ahead)
+            ahead = due - self.position()
+
+    def shown(self, frame_number):
+        self.drift.append(frame_number / self.fps - self.position())
+
+    def report(self):
+        if not self.drift:
+            return
+        worst = max(self.drift, key=abs)
+        late = sum(1 for drift in self.drift if drift < -1 / self.fps)
+        print(f"A/V drift over {len(self.drift)} frames: mean {1000 * sum(self.drift) / len(self.drift):+.1f} ms,"
+              f" worst {1000 * worst:+.1f} ms, {late} frames more than a frame late")
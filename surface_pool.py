@@ -0,0 +1,60 @@
+import pygame
+from contextlib import contextmanager
+
+
+class SurfacePool:
+    """Scratch Surfaces keyed by (size, flags) that effects borrow and return within a frame.
+
+    flags is 0 or pygame.SRCALPHA. A borrowed Surface has no surface alpha
+    or colour key, but its pixels are whatever the last borrower left, so
+    callers fill it first. allocations counts the Surfaces actually
+    created; once every size in use has been seen it should stop growing.
+    """
+
+    def __init__(self):
+        self.free = {}  # (size, flags) -> [Surface]
+        self.allocations = 0
+        self.borrows = 0
+        self.outstanding = 0  # Borrowed and not yet returned
+
+    def borrow(self, size, flags=0):
+        key = (tuple(size), flags & pygame.SRCALPHA)
+        free = self.free.get(key)
+        if free:
+            surface = free.pop()
+            surface.set_alpha(None)
+            surface.set_colorkey(None)
+        else:
+            surface = pygame.Surface(*key)
+            self.allocations += 1
+        self.borrows += 1
+        self.outstanding += 1
+        return surface
+
+    def give_back(self, surface):
+        # get_flags() also reports SRCALPHA once set_alpha was called, so
+        # per-pixel alpha is read from the pixel format instead
+        key = (surface.get_size(), pygame.SRCALPHA if surface.get_masks()[3] else 0)
+        self.free.setdefault(key, []).append(surface)
+        self.outstanding -= 1
+
+    @contextmanager
+    def scratch(self, size, flags=0):
+        """Borrow a Surface for the enclosed block"""
+        surface = self.borrow(size, flags)
+        try:
+            yield surface
+        finally:
+            self.give_back(surface)
+
+    def report(self, frames):
+        print(f"Scratch surfaces over {frames} frames: {self.allocations} allocated,"
+              f" {self.borrows} borrowed ({self.allocations / max(1, frames):.3f} allocations/frame)")
+
+    def reset_counters(self):
+        self.allocations = 0
+        self.borrows = 0
+
+
+# Scratch surfaces shared by every effect and screen
+surface_pool = SurfacePool()
@@ -0,0 +1,92 @@
+import pygame
+from collections import OrderedDict
+
+# (face, size) -> Font; face None is pygame's default font
+_fonts = {}
+
+
+def get_font(size, face=None):
+    """Shared Font for a font file (or the default font) at a size, created once.
+
+    SysFont(None, size) resolved to the same default font after scanning the
+    system font list, so callers use this instead.
+    """
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(face, size)
+    return font
+
+
+class TextCache:
+    """Bounded LRU of rendered strings keyed by (font, string, colour, alpha)"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()  # key -> Surface, oldest first
+
+    def render(self, font, text, color, alpha=255):
+        key = (font, text, tuple(color), alpha)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+
+        if alpha < 255:
+            # Faded copies come from the opaque render so it is only rasterised once
+            surface = self.render(font, text, color).copy()
+            surface.set_alpha(alpha)
+        else:
+            surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Rendered text shared by the HUD and the result screens
+text_cache = TextCache()
+
+
+def render_text(font, text, color, alpha=255):
+    """Antialiased text Surface, rendered once per (font, string, colour, alpha)"""
+    return text_cache.render(font, text, color, alpha)
+
+
+class HudLabel:
+    """A HUD line of text on an optional padded box, re-rendered only when its text changes.
+
+    position is one Rect anchor keyword for the text, e.g. midtop=(400, 20).
+    """
+
+    def __init__(self, font, color, background=None, padding=5, **position):
+        self.font = font
+        self.color = color
+        self.background = background
+        self.padding = padding
+        self.position = position
+        self.text = None
+        self.surface = None
+        self.rect = None
+
+    def draw(self, screen, text):
+        if text != self.text:
+            self.text = text
+            self._render()
+        screen.blit(self.surface, self.rect)
+
+    def _render(self):
+        text_surface = self.font.render(self.text, True, self.color)
+        rect = text_surface.get_rect(**self.position)
+        if self.background is None:
+            self.surface, self.rect = text_surface, rect
+            return
+        # Box and text are baked into one Surface so drawing is a single blit
+        pad = self.padding
+        self.rect = rect.inflate(pad * 2, pad * 2)
+        self.surface = pygame.Surface(self.rect.size)
+        self.surface.fill(self.background)
+        self.surface.blit(text_surface, (pad, pad))
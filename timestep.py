@@ -0,0 +1,121 @@
+import time
+from contextlib import contextmanager
+from config import SIMULATION_RATE, MAX_CATCH_UP_STEPS
+
+
+class FixedTimestep:
+    """Runs the match simulation at a fixed rate, independent of the render frame rate.
+
+    Each rendered frame asks advance() how many simulation steps are due for
+    the real time that passed. When drawing falls far behind, at most
+    max_steps are run and the rest of the backlog is dropped, so a slow
+    stretch slows the game down briefly instead of snowballing.
+    """
+
+    def __init__(self, rate=SIMULATION_RATE, max_steps=MAX_CATCH_UP_STEPS):
+        self.step_seconds = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.last_time = None
+
+    def advance(self):
+        """Number of simulation steps to run before drawing this frame"""
+        now = time.perf_counter()
+        if self.last_time is None:
+            self.last_time = now - self.step_seconds  # The first frame runs one step
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        steps = int(self.accumulator / self.step_seconds)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_seconds
+        return steps
+
+    def alpha(self):
+        """How far real time is into the next step (0..1), for interpolated drawing"""
+        return self.accumulator / self.step_seconds
+
+
+class InterpolatedPositions:
+    """Draws the ball and characters between their last two simulated positions.
+
+    snapshot() is called before every simulation step. blended(alpha) then
+    moves each entity to the point alpha of the way from its previous to its
+    current position for the duration of the draw and moves it back
+    afterwards. Jumps longer than snap_distance (resets after a goal or a
+    dead ball) are drawn at the new position straight away.
+    """
+
+    def __init__(self, ball, *characters, snap_distance=100):
+        self.ball = ball
+        self.characters = characters
+        self.snap_distance = snap_distance
+        self.previous = None
+
+    def _read(self):
+        positions = [(self.ball.pos[0], self.ball.pos[1], 0)]
+        for character in self.characters:
+            positions.append((character.position_x, character.position_y, character.jump_height))
+        return positions
+
+    def _write(self, positions):
+        (x, y, _), *characters = positions
+        self.ball.pos[0], self.ball.pos[1] = x, y
+        for character, (x, y, jump_height) in zip(self.characters, characters):
+            character.position_x, character.position_y, character.jump_height = x, y, jump_height
+
+    def snapshot(self):
+        self.previous = self._read()
+
+    @contextmanager
+    def blended(self, alpha):
+        if self.previous is None:
+            yield
+            return
+        current = self._read()
+        blend = []
+        for before, after in zip(self.previous, current):
+            if max(abs(b - a) for b, a in zip(before, after)) > self.snap_distance:
+                blend.append(after)
+            else:
+                blend.append(tuple(b + (a - b) * alpha for b, a in zip(before, after)))
+        self._write(blend)
+        try:
+            yield
+        finally:
+            self._write(current)
+
+
+class MatchClock:
+    """Time read by match timers: the game clock, celebrations, power bars and the ground fire.
+
+    It moves one simulation step per advance() instead of following the
+    wall clock, so timers stay in step with the simulation: a stalled frame
+    does not eat into the match, and a headless match runs its whole
+    duration as fast as the steps can be computed.
+    """
+
+    def __init__(self, rate=SIMULATION_RATE):
+        self.rate = rate
+        self.steps = 0
+
+    def reset(self):
+        self.steps = 0
+
+    def advance(self):
+        self.steps += 1
+
+    def time(self):
+        """Seconds since the match started (stands in for time.time())"""
+        return self.steps / self.rate
+
+    def ticks(self):
+        """Milliseconds since the match started (stands in for pygame.time.get_ticks())"""
+        return self.steps * 1000 // self.rate
+
+
+# Clock of the match being played or simulated
+match_clock = MatchClock()
@@ -0,0 +1,63 @@
+import pygame
+from collections import OrderedDict
+
+
+class TransformCache:
+    """Bounded LRU of scaled, rotated and faded copies of shared frames.
+
+    Scale, angle and alpha are rounded to buckets, so a trail segment that
+    looks the same as one drawn a frame ago reuses that Surface instead of
+    allocating a new one. Source frames come from the asset cache, so the
+    frame Surface itself identifies the power frame index.
+    """
+
+    def __init__(self, budget_bytes, scale_step=0.05, angle_step=5, alpha_step=16):
+        self.budget_bytes = budget_bytes
+        self.scale_step = scale_step
+        self.angle_step = angle_step
+        self.alpha_step = alpha_step
+        self.used_bytes = 0
+        self.surfaces = OrderedDict()  # key -> Surface, oldest first
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, frame, scale, angle, alpha=255):
+        """frame scaled by scale, rotated clockwise by angle degrees, faded to alpha"""
+        scale_bucket = round(scale / self.scale_step)
+        angle_bucket = round(angle / self.angle_step) % round(360 / self.angle_step)
+        alpha_bucket = min(255, round(alpha / self.alpha_step) * self.alpha_step)
+        key = (frame, scale_bucket, angle_bucket, alpha_bucket)
+
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        scale = scale_bucket * self.scale_step
+        size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
+        surface = pygame.transform.rotate(pygame.transform.scale(frame, size),
+                                          -angle_bucket * self.angle_step)
+        if alpha_bucket < 255:
+            surface.set_alpha(alpha_bucket)
+        self._store(key, surface)
+        return surface
+
+    def _store(self, key, surface):
+        self.surfaces[key] = surface
+        self.used_bytes += surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+        # Evict least recently used transforms until we are back under budget
+        while self.used_bytes > self.budget_bytes and len(self.surfaces) > 1:
+            _, old = self.surfaces.popitem(last=False)
+            self.used_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self):
+        """Drop every cached transform"""
+        self.surfaces.clear()
+        self.used_bytes = 0